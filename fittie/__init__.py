@@ -1,5 +1,25 @@
-from .fitfile import decode
+from .fitfile import (
+    Checkpoint,
+    FitIndex,
+    FitPushParser,
+    build_index,
+    decode,
+    decode_appended,
+    decode_many,
+    decode_vectorized,
+    iter_messages,
+)
 
-__all__ = ["decode"]
+__all__ = [
+    "Checkpoint",
+    "FitIndex",
+    "FitPushParser",
+    "build_index",
+    "decode",
+    "decode_appended",
+    "decode_many",
+    "decode_vectorized",
+    "iter_messages",
+]
 __VERSION__ = "1.0.0"
 __PROFILE_VERSION__ = "21.158.00"
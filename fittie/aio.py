@@ -0,0 +1,267 @@
+"""
+Asyncio entry points to decode FIT files from an `asyncio.StreamReader` or any async
+iterable of bytes, without the need for the complete file in memory.
+"""
+
+from __future__ import annotations  # Added for type hints
+
+import asyncio
+import functools
+from array import array
+from collections import defaultdict
+from concurrent.futures import Executor
+from typing import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    DefaultDict,
+    Iterable,
+    Optional,
+    Protocol,
+    Union,
+    cast,
+)
+
+from fittie.fitfile.columns import MessageColumns
+from fittie.fitfile.data_message import DataMessage
+from fittie.fitfile.decode import LAYOUTS
+from fittie.fitfile.decoder import Decoder
+from fittie.fitfile.fitfile import FitFile
+from fittie.fitfile.header import Header
+from fittie.fitfile.push import FitPushParser
+
+# Number of bytes that is decoded at once, a larger chunk is split
+CHUNK_SIZE = 64 * 1024
+
+
+class AsyncReadable(Protocol):
+    async def read(self, n: int = -1) -> bytes: ...
+
+
+# Values that can be decoded asynchronously, e.g. an asyncio.StreamReader
+AsyncSource = Union[AsyncReadable, AsyncIterable[bytes]]
+
+
+class _FitFileBuilder:
+    """Collects the data messages of a single FIT file, like `decode` does"""
+
+    __slots__ = ("layout", "data_messages", "sequence_numbers", "columns", "sequence")
+
+    layout: str
+    data_messages: DefaultDict[str, list[DataMessage]]
+    sequence_numbers: DefaultDict[str, array]
+    columns: dict[str, MessageColumns]
+    sequence: int
+
+    def __init__(self, layout: str):
+        self.layout = layout
+        self.data_messages = defaultdict(list)
+        self.sequence_numbers = defaultdict(functools.partial(array, "I"))
+        self.columns = {}
+        self.sequence = 0
+
+    def append(self, message_type: str, message: DataMessage) -> None:
+        if self.layout == "messages":
+            self.data_messages[message_type].append(message)
+            self.sequence_numbers[message_type].append(self.sequence)
+        elif (message_columns := self.columns.get(message_type)) is not None:
+            message_columns.append(message.fields)
+        else:
+            self.columns[message_type] = MessageColumns(message_type)
+            self.columns[message_type].append(message.fields)
+
+        self.sequence += 1
+
+    def build(self, fitfile: Callable[..., FitFile]) -> FitFile:
+        return fitfile(
+            data_messages=self.data_messages,
+            message_columns=self.columns,
+            sequence_numbers=self.sequence_numbers,
+        )
+
+
+async def iter_chunks(
+    source: AsyncSource, chunk_size: int = CHUNK_SIZE
+) -> AsyncIterator[Union[bytes, memoryview]]:
+    """
+    Yields the bytes of source in chunks of at most chunk_size bytes. A source with a
+    `read` method, like an asyncio.StreamReader, is only read when the next chunk is
+    requested, which applies backpressure to the writer of the stream.
+    """
+    if hasattr(source, "read"):
+        while chunk := await source.read(chunk_size):
+            yield chunk
+
+        return
+
+    async for chunk in source:
+        view = memoryview(chunk)
+
+        for start in range(0, len(view), chunk_size):
+            yield view[start : start + chunk_size]
+
+
+def _check_executor(executor: Optional[Executor]) -> None:
+    """Raises a TypeError if the executor can not decode the chunks of a parser"""
+    if executor is None:
+        return
+
+    # Imported here, importing the process pool slows down `import fittie`
+    from concurrent.futures import ProcessPoolExecutor
+
+    if isinstance(executor, ProcessPoolExecutor):
+        raise TypeError(
+            "the parser state can not be shared with a process pool, use a thread pool"
+        )
+
+
+async def _iter_feeds(
+    parser: FitPushParser,
+    source: AsyncSource,
+    chunk_size: int,
+    executor: Optional[Executor],
+) -> AsyncIterator[list[tuple[int, str, DataMessage]]]:
+    """Feeds the chunks of source to the parser, yields the decoded data messages"""
+    loop = asyncio.get_running_loop()
+
+    async for chunk in iter_chunks(source, chunk_size):
+        if executor is None:
+            yield parser.feed(chunk)
+        else:
+            yield await loop.run_in_executor(executor, parser.feed, chunk)
+
+    parser.close()
+
+
+def iter_messages(
+    source: AsyncSource,
+    calculate_crc: bool = True,
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    fields: Optional[dict[str, Iterable[str]]] = None,
+    lazy: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> AsyncIterator[tuple[int, str, DataMessage]]:
+    """
+    Decode a fit file from an async source and yield every data message as soon as it
+    is decoded.
+
+    The next chunk of source is only read after all data messages of the previous
+    chunk are consumed. Every chunk is decoded at once, in the executor when provided.
+
+    Args:
+        source: an asyncio.StreamReader, or an async iterable of bytes
+        calculate_crc: whether to calculate the CRC
+        include: only decode data messages of these message types
+        exclude: skip data messages of these message types
+        fields: only decode these fields, by message type
+        lazy: decode the fields of data messages on first access, see
+            `LazyDataMessage`
+        chunk_size: the maximum number of bytes that is decoded at once
+        executor: decode the chunks in this executor instead of the event loop, e.g.
+            a ThreadPoolExecutor
+
+    Yields:
+        tuple[int, str, DataMessage]: the index of the (chained) fit file, the
+        message type and the data message
+    """
+    # Checked before the first chunk is requested, not when the messages are iterated
+    _check_executor(executor)
+    parser = FitPushParser(
+        calculate_crc=calculate_crc,
+        include=include,
+        exclude=exclude,
+        fields=fields,
+        lazy=lazy,
+    )
+
+    return _iter_messages(parser, source, chunk_size, executor)
+
+
+async def _iter_messages(
+    parser: FitPushParser,
+    source: AsyncSource,
+    chunk_size: int,
+    executor: Optional[Executor],
+) -> AsyncIterator[tuple[int, str, DataMessage]]:
+    async for messages in _iter_feeds(parser, source, chunk_size, executor):
+        for message in messages:
+            yield message
+
+
+async def decode(
+    source: AsyncSource,
+    calculate_crc: bool = True,
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    fields: Optional[dict[str, Iterable[str]]] = None,
+    layout: str = "messages",
+    lazy: bool = False,
+    chunk_size: int = CHUNK_SIZE,
+    executor: Optional[Executor] = None,
+) -> list[FitFile]:
+    """
+    Decode a fit file from an async source into a list of FitFile, see `decode`.
+
+    Args:
+        source: an asyncio.StreamReader, or an async iterable of bytes
+        calculate_crc: whether to calculate the CRC
+        include: only decode data messages of these message types
+        exclude: skip data messages of these message types
+        fields: only decode these fields, by message type
+        layout: 'messages' to store a DataMessage per message, or 'columnar' to
+            store the field values per message type in columns, see
+            `FitFile.columns`
+        lazy: decode the fields of data messages on first access, see
+            `LazyDataMessage`
+        chunk_size: the maximum number of bytes that is decoded at once
+        executor: decode the chunks in this executor instead of the event loop, e.g.
+            a ThreadPoolExecutor
+
+    Returns:
+        list[FitFile]: one or more instances of FitFile
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"unsupported layout '{layout}' received")
+
+    _check_executor(executor)
+    fitfiles: list[FitFile] = []
+    # FitFiles that are complete, only missing their data messages
+    completed: list[Callable[..., FitFile]] = []
+    builders: DefaultDict[int, _FitFileBuilder] = defaultdict(
+        functools.partial(_FitFileBuilder, layout)
+    )
+
+    def on_fitfile(decoder: Decoder) -> None:
+        completed.append(
+            functools.partial(
+                FitFile,
+                header=cast(Header, decoder.header),
+                local_message_definitions=decoder.local_message_definitions,
+                developer_data=decoder.developer_data,
+            )
+        )
+
+    parser = FitPushParser(
+        calculate_crc=calculate_crc,
+        include=include,
+        exclude=exclude,
+        fields=fields,
+        lazy=lazy,
+        on_fitfile=on_fitfile,
+    )
+
+    async for messages in _iter_feeds(parser, source, chunk_size, executor):
+        for fitfile_index, message_type, message in messages:
+            builders[fitfile_index].append(message_type, message)
+
+        # The data messages of a complete FitFile are returned by the same feed
+        for fitfile in completed:
+            # A FIT file without (included) data messages has no builder yet
+            builder = builders.pop(len(fitfiles), None) or _FitFileBuilder(layout)
+            fitfiles.append(builder.build(fitfile))
+
+        completed.clear()
+
+    return fitfiles
@@ -1 +1,6 @@
-from .decode import decode  # noqa
+from .batch import decode_many  # noqa
+from .decode import decode, iter_messages  # noqa
+from .index import FitIndex, build_index  # noqa
+from .checkpoint import Checkpoint  # noqa
+from .push import FitPushParser, decode_appended  # noqa
+from .vectorized import decode_vectorized  # noqa
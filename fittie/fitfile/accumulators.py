@@ -0,0 +1,156 @@
+from __future__ import annotations  # Added for type hints
+
+from typing import Any, TYPE_CHECKING, cast
+
+if TYPE_CHECKING:
+    from fittie.fitfile.decode_plan import DecodePlan, FieldPlan
+
+
+class Accumulator:
+    """
+    Accumulates the values of a component that rolls over, e.g. a 12-bit distance
+    that is accumulated into the total distance.
+
+    The difference with the previous value, within the bits of the component, is
+    added to the accumulated value.
+    """
+
+    __slots__ = ("mask", "last_value", "value")
+
+    mask: int
+    last_value: int
+    value: int
+
+    def __init__(self, bits: int):
+        self.mask = (1 << bits) - 1
+        self.last_value = 0
+        self.value = 0
+
+    def accumulate(self, value: int) -> int:
+        """Adds the rolled over value and returns the accumulated value"""
+        self.value += (value - self.last_value) & self.mask
+        self.last_value = value
+
+        return self.value
+
+    def set(self, value: int) -> None:
+        """Sets the accumulated value, e.g. when the field itself is decoded"""
+        self.value = value
+        self.last_value = value
+
+    def __str__(self) -> str:
+        return f"Accumulator:{self.mask=}{self.last_value=}{self.value=}".replace(
+            "self.", " "
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class Accumulators:
+    """
+    The accumulators of a decode, by global message number, field name and bits of
+    the component. Accumulated values depend on all previous messages, so the
+    messages have to be passed in the order of the FIT file.
+
+    Data messages that contain the destination field of an accumulated component set
+    the accumulated value, see `update`.
+    """
+
+    __slots__ = ("_accumulators", "_pending")
+
+    _accumulators: dict[tuple[int, str, int], Accumulator]
+    # Last valid value of the fields that set accumulated values, by message number and
+    # field name, with the field plan and the bits, scale and offset of the components
+    _pending: dict[tuple[int, str], tuple["FieldPlan", tuple, Any]]
+
+    def __init__(self) -> None:
+        self._accumulators = {}
+        self._pending = {}
+
+    def _get(self, message_number: int, field_name: str, bits: int) -> Accumulator:
+        key = (message_number, field_name, bits)
+
+        if (accumulator := self._accumulators.get(key)) is None:
+            accumulator = self._accumulators[key] = Accumulator(bits)
+
+        return accumulator
+
+    def accumulate(
+        self, message_number: int, field_name: str, bits: int, value: int
+    ) -> int:
+        """Accumulates the value of a component, returns the accumulated value"""
+        if self._pending:
+            self._apply_pending()
+
+        return self._get(message_number, field_name, bits).accumulate(value)
+
+    def set(self, message_number: int, field_name: str, bits: int, value: int) -> None:
+        """Sets the accumulated value of a field, in units of the component"""
+        self._get(message_number, field_name, bits).set(value)
+
+    def update(self, plan: "DecodePlan", values: tuple[Any, ...]) -> None:
+        """
+        Updates the accumulated values with the unpacked values of a data message, for
+        the fields that are the destination of accumulated components (e.g. the
+        distance of a record).
+
+        A set value is replaced by the next one, so the values are only converted and
+        set when a component is accumulated. Files without accumulated components,
+        but with these fields in every message, are decoded without the extra work.
+        """
+        message_number = cast(int, plan.global_message_type)
+
+        for field, components in plan.accumulated_fields:
+            invalid = field.invalid_value
+
+            if field.count == 1:
+                if (value := values[field.index]) == invalid:
+                    continue
+            elif valid := [
+                item
+                for item in values[field.index : field.index + field.count]
+                if item != invalid
+            ]:
+                # The last value of an array, e.g. the last event timestamp
+                value = valid[-1]
+            else:
+                continue
+
+            self._pending[(message_number, field.name)] = (field, components, value)
+
+    def _apply_pending(self) -> None:
+        for (message_number, field_name), (
+            field,
+            components,
+            value,
+        ) in self._pending.items():
+            if field.is_scaled:
+                value = value / cast(float, field.scale or 1) - (field.offset or 0)
+
+            for bits, scale, offset in components:
+                self.set(
+                    message_number, field_name, bits, round((value + offset) * scale)
+                )
+
+        self._pending.clear()
+
+    def __getstate__(self) -> dict:
+        # Pending values are applied first, their field plans are not pickled
+        if self._pending:
+            self._apply_pending()
+
+        return {"_accumulators": self._accumulators}
+
+    def __setstate__(self, state: dict) -> None:
+        self._accumulators = state["_accumulators"]
+        self._pending = {}
+
+    def __len__(self) -> int:
+        return len(self._accumulators)
+
+    def __str__(self) -> str:
+        return f"Accumulators:{self._accumulators=}".replace("self.", " ")
+
+    def __repr__(self) -> str:
+        return str(self)
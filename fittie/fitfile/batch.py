@@ -0,0 +1,153 @@
+from __future__ import annotations  # Added for type hints
+
+import itertools
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from fittie.fitfile.decode import create_executor, decode, resolve_executor
+from fittie.fitfile.fitfile import FitFile
+from fittie.fitfile.utils.exceptions import DecodeException
+
+
+class DecodeResult:
+    """
+    The result of decoding a single file with `decode_many`.
+
+    If the file could not be decoded, `error` contains the raised exception and
+    `fitfiles` is empty. A DecodeException has the path of the file attached.
+    """
+
+    path: Union[str, Path]
+    fitfiles: list[FitFile]
+    error: Optional[Exception]
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        fitfiles: Optional[list[FitFile]] = None,
+        error: Optional[Exception] = None,
+    ):
+        self.path = path
+        self.fitfiles = fitfiles if fitfiles is not None else []
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        """Check whether the file was decoded without errors"""
+        return self.error is None
+
+    def __str__(self) -> str:
+        return f"DecodeResult:{self.path=}{self.ok=}{self.error=}".replace("self.", " ")
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+def _decode_path(path: Union[str, Path], options: dict[str, Any]) -> DecodeResult:
+    try:
+        return DecodeResult(path, fitfiles=decode(path, **options))
+    except DecodeException as exc:
+        exc.path = path
+        return DecodeResult(path, error=exc)
+    except Exception as exc:  # noqa: BLE001
+        # Deliberately broad: besides I/O errors, corrupt data can raise exceptions
+        # other than a DecodeException (e.g. a UnicodeDecodeError or KeyError). The
+        # exception is returned in the result, one file does not stop the others
+        return DecodeResult(path, error=exc)
+
+
+def _decode_chunk(
+    paths: list[Union[str, Path]], options: dict[str, Any]
+) -> list[DecodeResult]:
+    """Decodes a chunk of paths inside a worker"""
+    return [_decode_path(path, options) for path in paths]
+
+
+def decode_many(
+    paths: Iterable[Union[str, Path]],
+    workers: Optional[int] = None,
+    executor: str = "auto",
+    ordered: bool = True,
+    chunksize: int = 1,
+    **options: Any,
+) -> Iterator[DecodeResult]:
+    """
+    Decode many fit files in parallel, with a pool of processes or threads.
+
+    Paths are submitted to the workers in chunks. Only a limited number of chunks is
+    submitted ahead, so paths can be a lazy iterable. Errors are captured per file,
+    see `DecodeResult`.
+
+    Args:
+        paths: the file names of the fit files
+        workers: the number of workers, defaults to the number of CPUs
+        executor: 'process' to decode in a process pool, 'thread' to decode in a
+            thread pool, 'auto' to decode in a thread pool when the GIL is disabled
+            (free-threaded Python) and in a process pool otherwise
+        ordered: yield the results in the order of paths, or as soon as they are
+            decoded
+        chunksize: the number of paths that is submitted to a worker at once
+        **options: options for `decode`, e.g. calculate_crc, include and exclude
+
+    Yields:
+        DecodeResult: the result of every path
+    """
+    executor = resolve_executor(executor)
+
+    if chunksize < 1:
+        raise ValueError("chunksize should be at least 1")
+
+    # Raises a TypeError for unsupported options before anything is submitted, inspect
+    # is imported here as it slows down `import fittie`
+    import inspect
+
+    inspect.signature(decode).bind(None, **options)
+
+    return _decode_many(
+        iter(paths),
+        executor,
+        workers or os.cpu_count() or 1,
+        ordered,
+        chunksize,
+        options,
+    )
+
+
+def _decode_many(
+    iterator: Iterator[Union[str, Path]],
+    executor: str,
+    workers: int,
+    ordered: bool,
+    chunksize: int,
+    options: dict[str, Any],
+) -> Iterator[DecodeResult]:
+    pool = create_executor(executor, workers)
+    chunks = iter(lambda: list(itertools.islice(iterator, chunksize)), [])
+    pending: deque[Future[list[DecodeResult]]] = deque()
+
+    def submit() -> None:
+        if (chunk := next(chunks, None)) is not None:
+            pending.append(pool.submit(_decode_chunk, chunk, options))
+
+    try:
+        # Keep every worker busy, with one chunk waiting for each worker
+        for _ in range(workers * 2):
+            submit()
+
+        while pending:
+            if ordered:
+                future = pending.popleft()
+            else:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                future = done.pop()
+                pending.remove(future)
+
+            results = future.result()
+            submit()
+
+            yield from results
+    finally:
+        pool.shutdown(cancel_futures=True)
@@ -0,0 +1,114 @@
+from __future__ import annotations  # Added for type hints
+
+import pickle
+from typing import Any, Optional
+
+from fittie.fitfile.accumulators import Accumulators
+from fittie.fitfile.definition_message import DefinitionMessage
+from fittie.fitfile.header import Header
+
+CHECKPOINT_VERSION = 1
+
+
+class Checkpoint:
+    """
+    The state of a decode at a record boundary, see `FitPushParser.checkpoint`. A
+    decode can be resumed from the checkpoint, only the bytes after `position` are
+    decoded, see `decode_appended`.
+
+    A checkpoint is a copy of the state, it does not change when the decode continues.
+    It can be pickled, or converted to bytes with `to_bytes`. Only load checkpoints
+    from a trusted source, they are unpickled.
+    """
+
+    __slots__ = (
+        "position",
+        "fitfile_index",
+        "start",
+        "header_bytes",
+        "header",
+        "state",
+        "remaining",
+        "crc",
+        "local_message_definitions",
+        "developer_data",
+        "accumulators",
+        "timestamp",
+    )
+
+    # Number of bytes that is decoded, the position to resume from
+    position: int
+    fitfile_index: int
+    # Position and bytes of the header of the current FIT file
+    start: int
+    header_bytes: bytes
+    header: Optional[Header]
+    # What the parser expects next, and the number of bytes of records that are left in
+    # the current FIT file
+    state: int
+    remaining: int
+    # Running crc of the records of the current FIT file, without the header
+    crc: int
+    local_message_definitions: dict[int, DefinitionMessage]
+    developer_data: dict[int, dict[str, Any]]
+    accumulators: Accumulators
+    # Last full timestamp, for compressed timestamps
+    timestamp: Optional[int]
+
+    def __init__(
+        self,
+        position: int,
+        fitfile_index: int,
+        start: int,
+        header_bytes: bytes,
+        header: Optional[Header],
+        state: int,
+        remaining: int,
+        crc: int,
+        local_message_definitions: dict[int, DefinitionMessage],
+        developer_data: dict[int, dict[str, Any]],
+        accumulators: Accumulators,
+        timestamp: Optional[int],
+    ):
+        self.position = position
+        self.fitfile_index = fitfile_index
+        self.start = start
+        self.header_bytes = header_bytes
+        self.header = header
+        self.state = state
+        self.remaining = remaining
+        self.crc = crc
+        self.local_message_definitions = local_message_definitions
+        self.developer_data = developer_data
+        self.accumulators = accumulators
+        self.timestamp = timestamp
+
+    def to_bytes(self) -> bytes:
+        """Returns the checkpoint as bytes, e.g. to store it next to the FIT file"""
+        return pickle.dumps((CHECKPOINT_VERSION, self))
+
+    @classmethod
+    def from_bytes(cls, value: bytes) -> Checkpoint:
+        """
+        Returns the checkpoint of `to_bytes`, raises a ValueError if value is not a
+        checkpoint of this version.
+        """
+        try:
+            version, checkpoint = pickle.loads(value)
+        except (pickle.UnpicklingError, EOFError, TypeError, ValueError):
+            raise ValueError("value is not a checkpoint") from None
+
+        if version != CHECKPOINT_VERSION or not isinstance(checkpoint, cls):
+            raise ValueError(
+                f"value is not a checkpoint of version {CHECKPOINT_VERSION}"
+            )
+
+        return checkpoint
+
+    def __str__(self) -> str:
+        return (
+            f"Checkpoint:{self.position=}{self.fitfile_index=}{self.timestamp=}"
+        ).replace("self.", " ")
+
+    def __repr__(self) -> str:
+        return str(self)
@@ -0,0 +1,230 @@
+from __future__ import annotations  # Added for type hints
+
+import array
+from typing import Any, Iterator, Mapping, Optional, Union
+
+# Typecodes of the array.array buffers, all integers are stored as int64 and all
+# floats (e.g. values with scale and offset applied) as float64
+INT_TYPECODE = "q"
+FLOAT_TYPECODE = "d"
+
+ColumnValues = Union[array.array, list]
+
+
+def import_numpy() -> Any:
+    """
+    Returns the numpy module, it is only imported on first use: importing it slows down
+    `import fittie` while most decodes do not need it.
+
+    Raises ImportError when NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "numpy is required to convert a column to a numpy array"
+        ) from None
+
+    return numpy
+
+
+class Column:
+    """
+    Values of a single field for all messages of a message type.
+
+    Numeric values are stored in a typed array.array buffer, other values (e.g.
+    arrays and strings) in a list. Invalid or missing values are not stored as None,
+    but are marked in the validity mask `valid` (1 = valid, 0 = invalid).
+    """
+
+    name: str
+    values: ColumnValues
+    valid: array.array
+
+    def __init__(self, name: str, length: int = 0):
+        self.name = name
+        self.values = array.array(INT_TYPECODE, bytes(8 * length))
+        self.valid = array.array("B", bytes(length))
+
+    @classmethod
+    def from_numpy(cls, name: str, values: Any, valid: Any) -> "Column":
+        """
+        Creates a column of a NumPy array of values and a NumPy array of booleans as
+        validity mask. The values are copied into the buffers of the column.
+        """
+        import numpy
+
+        column = cls(name)
+        column.valid = array.array("B", valid.astype(numpy.uint8).tobytes())
+
+        if values.dtype.kind in "iu" and (
+            values.dtype.kind == "i"
+            or values.dtype.itemsize < 8
+            or not numpy.any(values[valid] > numpy.iinfo(numpy.int64).max)
+        ):
+            values = numpy.where(valid, values, 0).astype(numpy.int64)
+            column.values = array.array(INT_TYPECODE, values.tobytes())
+        elif values.dtype.kind == "f":
+            values = numpy.where(valid, values, 0).astype(numpy.float64)
+            column.values = array.array(FLOAT_TYPECODE, values.tobytes())
+        else:
+            column.values = [
+                item if is_valid else None
+                for item, is_valid in zip(values.tolist(), valid.tolist(), strict=True)
+            ]
+
+        return column
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    @property
+    def typecode(self) -> Optional[str]:
+        """Returns the typecode of the values, None when values are stored in a list"""
+        return self.values.typecode if isinstance(self.values, array.array) else None
+
+    def append(self, value: Any) -> None:
+        """Appends a value to the column, None is stored as invalid"""
+        if value is None:
+            self.values.append(0 if self.typecode else None)
+            self.valid.append(0)
+            return
+
+        try:
+            self.values.append(value)
+        except (TypeError, OverflowError):
+            self._widen(value)
+            self.values.append(value)
+
+        self.valid.append(1)
+
+    def _widen(self, value: Any) -> None:
+        """
+        Converts the values to a type that can hold the provided value: int64 values
+        are converted to float64 for floats, anything else is stored in a list.
+        """
+        if self.typecode == INT_TYPECODE and isinstance(value, float):
+            self.values = array.array(FLOAT_TYPECODE, self.values)
+        elif self.typecode is not None:
+            self.values = self.to_list()
+
+    def to_list(self) -> list[Any]:
+        """Returns the values as list, with None for invalid values"""
+        return [
+            item if valid else None
+            for item, valid in zip(self.values, self.valid, strict=True)
+        ]
+
+    def to_numpy(self) -> Any:
+        """
+        Returns the values as NumPy array, invalid values are not masked. Use
+        `valid_mask` to get the validity mask.
+
+        Raises ImportError when NumPy is not installed.
+        """
+        numpy = import_numpy()
+
+        if isinstance(self.values, array.array):
+            return numpy.frombuffer(self.values, dtype=self.values.typecode)
+
+        return object_array(self.values)
+
+    def valid_mask(self) -> Any:
+        """
+        Returns the validity mask as NumPy array of booleans
+
+        Raises ImportError when NumPy is not installed.
+        """
+        numpy = import_numpy()
+
+        return numpy.frombuffer(self.valid, dtype=numpy.uint8).astype(bool)
+
+    def __str__(self) -> str:
+        return f"Column:{self.name=}{self.typecode=}length={len(self)}".replace(
+            "self.", " "
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+def object_array(values: list[Any]) -> Any:
+    """
+    Returns a one dimensional NumPy array of objects, list values (e.g. of array
+    fields) are kept as items instead of becoming an extra dimension.
+    """
+    numpy = import_numpy()
+    result = numpy.empty(len(values), dtype=object)
+
+    for index, value in enumerate(values):
+        result[index] = value
+
+    return result
+
+
+class MessageColumns:
+    """
+    Columnar representation of all messages of a single message type.
+
+    Every field is a Column, all columns have the same length: the number of
+    messages. If a field is not present in a message, its value is invalid.
+    """
+
+    message_type: str
+    columns: dict[str, Column]
+    length: int
+
+    def __init__(self, message_type: str):
+        self.message_type = message_type
+        self.columns = {}
+        self.length = 0
+
+    def append(self, fields: Mapping[str, Any]) -> None:
+        """Appends the field values of a single message"""
+        length = self.length
+        columns = self.columns
+
+        for name, value in fields.items():
+            if (column := columns.get(name)) is None:
+                column = columns[name] = Column(name, length)
+
+            column.append(value)
+
+        self.length = length + 1
+
+        if len(fields) != len(columns):
+            for column in columns.values():
+                if len(column) == length:
+                    column.append(None)
+
+    def row(self, index: int) -> dict[str, Any]:
+        """Returns the field values of a single message"""
+        return {
+            name: column.values[index] if column.valid[index] else None
+            for name, column in self.columns.items()
+        }
+
+    def to_numpy(self) -> dict[str, Any]:
+        """Returns all columns as NumPy arrays, see `Column.to_numpy`"""
+        return {name: column.to_numpy() for name, column in self.columns.items()}
+
+    def keys(self) -> Iterator[str]:
+        return iter(self.columns.keys())
+
+    def __getitem__(self, name: str) -> Column:
+        return self.columns[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.columns
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __str__(self) -> str:
+        return (
+            f"MessageColumns:{self.message_type=}{self.length=}"
+            f"columns={list(self.columns)}"
+        ).replace("self.", " ")
+
+    def __repr__(self) -> str:
+        return str(self)
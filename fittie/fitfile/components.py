@@ -0,0 +1,420 @@
+from __future__ import annotations  # Added for type hints
+
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from fittie.fitfile.accumulators import Accumulators
+
+if TYPE_CHECKING:
+    from fittie.profile import FieldProfile, MessageProfile, SubField
+
+# Maximum depth of components of components, e.g. compressed_speed_distance > speed >
+# enhanced_speed
+MAX_COMPONENT_DEPTH = 4
+
+Profile = Union["FieldProfile", "SubField"]
+
+
+def _split(value: Any, count: int) -> list[Any]:
+    """
+    Returns a profile value (e.g. bits or scale) per component, a single value is
+    used for all components.
+    """
+    if isinstance(value, str):
+        value = [int(item) for item in value.split(",")]
+
+    if not isinstance(value, list):
+        return [value] * count
+
+    return value + [value[-1] if value else None] * (count - len(value))
+
+
+def _names(profile: Profile) -> list[str]:
+    """Returns the destination names of the components of a profile"""
+    components = profile.components or []
+
+    return components.split(",") if isinstance(components, str) else list(components)
+
+
+def _scale_and_offset(profile: Optional[Profile]) -> tuple[Any, Any]:
+    """Returns the scale and offset of the destination profile of a component"""
+    if profile is None or isinstance(profile.scale, list):
+        return 1, 0
+
+    return profile.scale or 1, profile.offset or 0
+
+
+class ComponentPlan:
+    """
+    Precomputed bit extraction of a single component: the bits of the component are
+    `(raw >> shift) & mask`, the value is `bits / scale - offset`.
+
+    When the destination field has components itself, `components` are expanded
+    from the value of the destination field.
+    """
+
+    __slots__ = (
+        "name",
+        "shift",
+        "bits",
+        "mask",
+        "scale",
+        "offset",
+        "is_scaled",
+        "accumulate",
+        "is_array",
+        "destination_scale",
+        "destination_offset",
+        "components",
+    )
+
+    name: str
+    shift: int
+    bits: int
+    mask: int
+    scale: float | int
+    offset: float | int
+    is_scaled: bool
+    accumulate: bool
+    # Whether multiple components have the same destination, the value is a list
+    is_array: bool
+    destination_scale: float | int
+    destination_offset: float | int
+    components: Optional["ComponentsPlan"]
+
+    def __init__(
+        self,
+        name: str,
+        shift: int,
+        bits: int,
+        scale: Optional[float | int],
+        offset: Optional[float | int],
+        accumulate: bool,
+        is_array: bool,
+        destination: Optional[FieldProfile],
+        components: Optional["ComponentsPlan"] = None,
+    ):
+        self.name = name
+        self.shift = shift
+        self.bits = bits
+        self.mask = (1 << bits) - 1
+        self.scale = scale or 1
+        self.offset = offset or 0
+        self.is_scaled = self.scale != 1 or self.offset != 0
+        self.accumulate = accumulate
+        self.is_array = is_array
+        self.destination_scale, self.destination_offset = _scale_and_offset(destination)
+        self.components = components
+
+    def destination_raw(self, bits: int, value: Any) -> int:
+        """Returns the value of the destination field, without its scale and offset"""
+        if (
+            self.scale == self.destination_scale
+            and self.offset == self.destination_offset
+        ):
+            return bits
+
+        return round((value + self.destination_offset) * self.destination_scale)
+
+    def __str__(self) -> str:
+        return (
+            f"ComponentPlan:{self.name=}{self.shift=}{self.bits=}{self.scale=}"
+            f"{self.offset=}{self.accumulate=}"
+        ).replace("self.", " ")
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class ComponentsPlan:
+    """
+    The precomputed components of a field, for a field value of `count` values of
+    `element_bits` bits each. Array values are combined into a single integer, the
+    first value in the lowest bits.
+
+    Components that do not fit in the bits of the field value are left out.
+    """
+
+    __slots__ = ("field_name", "count", "element_bits", "invalid_value", "components")
+
+    field_name: str
+    count: int
+    element_bits: int
+    invalid_value: Any
+    components: tuple[ComponentPlan, ...]
+
+    def __init__(
+        self,
+        field_name: str,
+        count: int,
+        element_bits: int,
+        invalid_value: Any,
+        components: tuple[ComponentPlan, ...],
+    ):
+        self.field_name = field_name
+        self.count = count
+        self.element_bits = element_bits
+        self.invalid_value = invalid_value
+        self.components = components
+
+    @property
+    def bits(self) -> int:
+        """Returns the number of bits of the field value"""
+        return self.count * self.element_bits
+
+    def names(self) -> list[str]:
+        """Returns the destination names of all (nested) components, in order"""
+        names: dict[str, None] = {}
+
+        for component in self.components:
+            names[component.name] = None
+
+            if component.components is not None:
+                names.update(dict.fromkeys(component.components.names()))
+
+        return list(names)
+
+    def source(self, value: Any) -> Optional[int]:
+        """
+        Returns the field value as a single integer, or None when the field value is
+        invalid. Value is a single value, or a tuple or list of values.
+        """
+        if self.count == 1:
+            if isinstance(value, (tuple, list)):
+                value = value[0]
+
+            return None if value == self.invalid_value else value
+
+        invalid = self.invalid_value
+
+        if all(item == invalid for item in value):
+            return None
+
+        raw = 0
+
+        for position, item in enumerate(value):
+            raw |= item << (position * self.element_bits)
+
+        return raw
+
+    def expand(
+        self,
+        raw: int,
+        expanded: dict[str, Any],
+        accumulators: Optional[Accumulators] = None,
+        message_number: int = 0,
+    ) -> None:
+        """
+        Adds the values of the components of the raw field value to expanded.
+
+        Accumulated components are accumulated with the accumulators of the message
+        number, without accumulators they are left out.
+        """
+        for component in self.components:
+            bits = (raw >> component.shift) & component.mask
+
+            if component.accumulate:
+                if accumulators is None:
+                    # Accumulated values depend on previous messages
+                    continue
+
+                bits = accumulators.accumulate(
+                    message_number, component.name, component.bits, bits
+                )
+
+            value = (
+                bits / component.scale - component.offset
+                if component.is_scaled
+                else bits
+            )
+
+            if component.is_array:
+                expanded.setdefault(component.name, []).append(value)
+            elif component.name not in expanded:
+                # The first expanded value of a destination field is used
+                expanded[component.name] = value
+
+            if component.components is not None:
+                component.components.expand(
+                    component.destination_raw(bits, value),
+                    expanded,
+                    accumulators,
+                    message_number,
+                )
+
+    @property
+    def accumulates(self) -> bool:
+        """Check whether any of the (nested) components is accumulated"""
+        return any(
+            component.accumulate
+            or (component.components is not None and component.components.accumulates)
+            for component in self.components
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"ComponentsPlan:{self.field_name=}{self.count=}{self.element_bits=}"
+            f"{self.components=}"
+        ).replace("self.", " ")
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+def compile_components(
+    profile: Profile,
+    message_profile: Optional[MessageProfile],
+    count: int,
+    element_bits: int,
+    invalid_value: Any,
+    depth: int = 0,
+) -> Optional[ComponentsPlan]:
+    """
+    Compiles the components of a field or subfield profile, for a field value of
+    `count` values of `element_bits` bits. Returns None if the profile has no
+    components, or none of the components fit in the field value.
+
+    The components of the destination fields are compiled too, with the message
+    profile.
+    """
+    if profile.components is None or depth > MAX_COMPONENT_DEPTH:
+        return None
+
+    names = _names(profile)
+    bits = _split(profile.bits, len(names))
+    scales = _split(profile.scale, len(names))
+    offsets = _split(profile.offset, len(names))
+    accumulates = _split(profile.accumulate, len(names))
+    destinations = (
+        {field.field_name: field for field in message_profile.fields.values()}
+        if message_profile is not None
+        else {}
+    )
+
+    components: list[ComponentPlan] = []
+    shift = 0
+
+    for name, size, scale, offset, accumulate in zip(
+        names, bits, scales, offsets, accumulates, strict=True
+    ):
+        if size is None or shift + size > count * element_bits:
+            break
+
+        destination = destinations.get(name)
+        nested = None
+
+        if destination is not None and destination is not profile:
+            # The value of the destination field is not limited to the bits of the
+            # component, e.g. speed (12 bits) > enhanced_speed (16 bits)
+            nested = compile_components(
+                destination, message_profile, 1, 64, None, depth + 1
+            )
+
+        components.append(
+            ComponentPlan(
+                name,
+                shift,
+                size,
+                scale,
+                offset,
+                accumulate=bool(accumulate),
+                is_array=names.count(name) > 1,
+                destination=destination,
+                components=nested,
+            )
+        )
+        shift += size
+
+    if not components:
+        return None
+
+    return ComponentsPlan(
+        profile.field_name, count, element_bits, invalid_value, tuple(components)
+    )
+
+
+# Compiled components by id of the profile, field value count and element bits, with
+# the profile to make sure the id is not reused by another profile
+_COMPONENTS: dict[tuple[int, int, int], tuple[Profile, Optional[ComponentsPlan]]] = {}
+
+
+def get_components_plan(
+    profile: Optional[Profile],
+    message_profile: Optional[MessageProfile],
+    count: int,
+    element_bits: int,
+    invalid_value: Any,
+) -> Optional[ComponentsPlan]:
+    """
+    Returns the compiled components of a field or subfield profile, see
+    `compile_components`. Components are compiled once per profile and field size.
+    """
+    if profile is None or profile.components is None:
+        return None
+
+    key = (id(profile), count, element_bits)
+
+    if (entry := _COMPONENTS.get(key)) is None or entry[0] is not profile:
+        entry = _COMPONENTS[key] = (
+            profile,
+            compile_components(
+                profile, message_profile, count, element_bits, invalid_value
+            ),
+        )
+
+    return entry[1]
+
+
+# Accumulated fields by id of the message profile, with the message profile to make
+# sure the id is not reused by another message profile
+_ACCUMULATED_FIELDS: dict[
+    int, tuple[MessageProfile, dict[str, tuple[tuple[int, Any, Any], ...]]]
+] = {}
+
+
+def get_accumulated_fields(
+    message_profile: Optional[MessageProfile],
+) -> dict[str, tuple[tuple[int, Any, Any], ...]]:
+    """
+    Returns the fields of the message profile that are the destination of accumulated
+    components, with the bits, scale and offset of each of these components.
+
+    When such a field is decoded itself, its value is the new accumulated value.
+    """
+    if message_profile is None:
+        return {}
+
+    key = id(message_profile)
+
+    if (entry := _ACCUMULATED_FIELDS.get(key)) is not None and entry[
+        0
+    ] is message_profile:
+        return entry[1]
+
+    accumulated: dict[str, dict[tuple[int, Any, Any], None]] = {}
+    profiles: list[Profile] = []
+
+    for field in message_profile.fields.values():
+        profiles.append(field)
+        profiles.extend(field.subfields or [])
+
+    for profile in profiles:
+        if profile.components is None or not profile.accumulate:
+            continue
+
+        names = _names(profile)
+
+        for name, bits, scale, offset, accumulate in zip(
+            names,
+            _split(profile.bits, len(names)),
+            _split(profile.scale, len(names)),
+            _split(profile.offset, len(names)),
+            _split(profile.accumulate, len(names)),
+            strict=True,
+        ):
+            if accumulate and bits is not None:
+                accumulated.setdefault(name, {})[(bits, scale or 1, offset or 0)] = None
+
+    fields = {name: tuple(components) for name, components in accumulated.items()}
+    _ACCUMULATED_FIELDS[key] = (message_profile, fields)
+
+    return fields
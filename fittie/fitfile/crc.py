@@ -1,3 +1,5 @@
+import functools
+
 TABLE = (
     0x0000,
     0xCC01,
@@ -35,16 +37,89 @@ def apply_crc(crc: int, value: int) -> int:
     return crc
 
 
-def calculate_crc(data: bytes) -> int:
+# Crc of every possible byte value, allows the crc to be computed per byte instead of
+# per nibble
+BYTE_TABLE = tuple(apply_crc(0, byte) for byte in range(256))
+
+
+def crc16(data: bytes | bytearray | memoryview, crc: int = 0) -> int:
+    """
+    Continues the crc computation of the provided crc over all bytes in data and
+    returns it.
+
+    Uses the 256 entry byte table, this gives the same result as calling apply_crc
+    for every byte, but with a single table lookup per byte.
+    """
+    table = BYTE_TABLE
+
+    for byte in data:
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+
+    return crc
+
+
+def calculate_crc(data: bytes | bytearray | memoryview, crc: int = 0) -> int:
     """
     Calculates crc checksum for the entire provided data
 
     Compute method from https://developer.garmin.com/fit/protocol/
     """
+    return crc16(data, crc)
 
-    crc = 0
 
-    for byte in data:
-        crc = apply_crc(crc, byte)
+# Polynomial of the crc, in the bit order of the crc register
+POLYNOMIAL = 0xA001
 
-    return crc
+
+def _matrix_times(matrix: tuple[int, ...], vector: int) -> int:
+    """Multiplies a 16x16 matrix over GF(2), as a list of columns, with a vector"""
+    result = 0
+    index = 0
+
+    while vector:
+        if vector & 1:
+            result ^= matrix[index]
+
+        vector >>= 1
+        index += 1
+
+    return result
+
+
+def _matrix_square(matrix: tuple[int, ...]) -> tuple[int, ...]:
+    return tuple(_matrix_times(matrix, column) for column in matrix)
+
+
+@functools.cache
+def _zero_operator(power: int) -> tuple[int, ...]:
+    """Returns the operator that continues a crc over 2 ** power zero bytes"""
+    if power > 0:
+        return _matrix_square(_zero_operator(power - 1))
+
+    # Operator for a single zero bit, squared three times for a zero byte
+    operator = (POLYNOMIAL,) + tuple(1 << index for index in range(15))
+
+    for _ in range(3):
+        operator = _matrix_square(operator)
+
+    return operator
+
+
+def crc16_combine(crc1: int, crc2: int, length2: int) -> int:
+    """
+    Returns the crc of two concatenated blocks of data, with the crc of the first
+    block, and the crc (starting from 0) and length of the second block.
+
+    The crc of the first block is continued over length2 zero bytes in O(log(length2))
+    steps, like zlib's crc32_combine, without the bytes of the second block.
+    """
+    power = 0
+
+    while length2 > 0:
+        if length2 & 1:
+            crc1 = _matrix_times(_zero_operator(power), crc1)
+
+        length2 >>= 1
+        power += 1
+
+    return crc1 ^ crc2
@@ -1,20 +1,69 @@
 from __future__ import annotations  # Added for type hints
 import logging
-from copy import deepcopy
-from typing import Any, Optional, TYPE_CHECKING, cast
+import struct
+from typing import Any, Iterator, Mapping, Optional, TYPE_CHECKING, cast
 
-from fittie.profile import FieldProfile
-from fittie.fitfile.utils.datastream import Streamable
+from fittie.fitfile.accumulators import Accumulators
+from fittie.fitfile.utils.datastream import Streamable, read_struct
 from fittie.fitfile.utils.exceptions import DecodeException
+from fittie.fitfile.decode_plan import (
+    ARRAY,
+    SCALAR,
+    STRING,
+    DecodePlan,
+    FieldNames,
+    FieldPlan,
+    get_field_names,
+)
 from fittie.fitfile.definition_message import DefinitionMessage
-from fittie.fitfile.field_definitions import read_field, read_developer_field
 from fittie.fitfile.field_description import FieldDescription
-from fittie.profile.util import get_message_profile
+from fittie.fitfile.subfields import SubfieldTable, get_subfield_table
+from fittie.fitfile.timestamps import TimestampTracker
 
 logger = logging.getLogger("fittie")
 
 if TYPE_CHECKING:
     from fittie.fitfile.records import RecordHeader
+    from fittie.profile import FieldProfile
+
+
+class FieldsView(Mapping[str, Optional[Any]]):
+    """
+    Read-only, dict-like view on the field values of a data message.
+
+    The field values are stored in a tuple, the field names are shared by all data
+    messages with the same fields.
+    """
+
+    __slots__ = ("_field_names", "_values")
+
+    def __init__(self, field_names: FieldNames, values: tuple[Any, ...]):
+        self._field_names = field_names
+        self._values = values
+
+    def __getitem__(self, name: str) -> Optional[Any]:
+        return self._values[self._field_names.index[name]]
+
+    def get(self, name: str, default: Optional[Any] = None) -> Optional[Any]:
+        if (index := self._field_names.index.get(name)) is None:
+            return default
+
+        return self._values[index]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._field_names.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._field_names.names)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __str__(self) -> str:
+        return str(dict(self.items()))
+
+    def __repr__(self) -> str:
+        return str(self)
 
 
 class DataMessage:
@@ -27,14 +76,44 @@ class DataMessage:
         Compressed Timestamp Data Message
 
     Related DefinitionMessages and DataMessages share a local message type
+
+    The field values are stored as a tuple, with field names that are shared by the
+    data messages of the same definition. `fields` is a read-only dict-like view on
+    the field values.
     """
 
+    __slots__ = ("header", "_field_names", "_values")
+
     header: "RecordHeader"
-    fields: dict[str, Optional[Any]]
+    _field_names: Optional[FieldNames]
+    _values: Optional[tuple[Any, ...]]
 
-    def __init__(self, header: "RecordHeader", fields: dict[str, Optional[Any]]):
+    def __init__(self, header: "RecordHeader", fields: Mapping[str, Optional[Any]]):
         self.header = header
-        self.fields = fields
+        self.fields = fields  # type: ignore[assignment]
+
+    @classmethod
+    def from_values(
+        cls, header: "RecordHeader", field_names: FieldNames, values: tuple[Any, ...]
+    ) -> "DataMessage":
+        """Creates a DataMessage of field values and their shared field names"""
+        message = cls.__new__(cls)
+        message.header = header
+        message._field_names = field_names
+        message._values = values
+
+        return message
+
+    @property
+    def fields(self) -> FieldsView:
+        return FieldsView(
+            cast(FieldNames, self._field_names), cast(tuple, self._values)
+        )
+
+    @fields.setter
+    def fields(self, fields: Mapping[str, Optional[Any]]) -> None:
+        self._field_names = get_field_names(tuple(fields))
+        self._values = tuple(fields.values())
 
     def get_field(self, field_name: str) -> Optional[Any]:
         """Retrieve a field by key from fields"""
@@ -52,6 +131,83 @@ class DataMessage:
         return str(self)
 
 
+class LazyDataMessage(DataMessage):
+    """
+    A DataMessage that keeps the raw bytes of the data message, and a reference to
+    the compiled decode plan of its definition message.
+
+    The fields are decoded when `fields` (or `get_field`) is first used, then the
+    decoded fields are cached and the raw bytes are released.
+    """
+
+    __slots__ = ("_raw", "_plan", "_developer_plan")
+
+    _raw: Optional[bytes]
+    _plan: Optional[DecodePlan]
+    _developer_plan: Optional[DecodePlan]
+
+    def __init__(
+        self,
+        header: "RecordHeader",
+        raw: bytes,
+        plan: DecodePlan,
+        developer_plan: Optional[DecodePlan] = None,
+    ):
+        self.header = header
+        self._raw = raw
+        self._plan = plan
+        self._developer_plan = developer_plan
+        self._field_names = None
+        self._values = None
+
+    @property
+    def fields(self) -> FieldsView:
+        if self._values is None:
+            # The raw bytes are released before the plans, when the raw bytes are
+            # read last and not released, the plans are not released either. Messages
+            # that are shared by threads are then decoded by one or more threads.
+            plan, developer_plan, raw = self._plan, self._developer_plan, self._raw
+
+            if raw is not None:
+                plan = cast(DecodePlan, plan)
+                values = plan.struct.unpack_from(raw)
+                developer_values = (
+                    developer_plan.struct.unpack_from(raw, plan.size)
+                    if developer_plan is not None
+                    else None
+                )
+                self._field_names, self._values = decode_fields(
+                    plan, values, developer_plan, developer_values
+                )
+                self._raw = None
+                self._plan = None
+                self._developer_plan = None
+
+        return super().fields
+
+    @fields.setter
+    def fields(self, fields: Mapping[str, Optional[Any]]) -> None:
+        DataMessage.fields.fset(self, fields)  # type: ignore[attr-defined]
+        self._raw = None
+        self._plan = None
+        self._developer_plan = None
+
+    @property
+    def is_decoded(self) -> bool:
+        """Check whether the fields have been decoded"""
+        return self._values is not None
+
+    def __reduce__(self):
+        # The decode plan can not be pickled, pickle as decoded DataMessage instead
+        fields = self.fields
+
+        return DataMessage.from_values, (
+            self.header,
+            fields._field_names,
+            fields._values,
+        )
+
+
 def add_subfields_to_fields(
     fields: dict[str, Any],
     fields_raw: dict[str, Any],
@@ -71,32 +227,49 @@ def add_subfields_to_fields(
 
     For example {"product": 22} as fields, becomes {"product": 22, "garmin_product": 22}
     """
+    if (table := get_subfield_table(field_profile)) is None:
+        return []
+
+    return resolve_subfields(fields, fields_raw, table, fields_with_components)
+
 
+def resolve_subfields(
+    fields: dict[str, Any],
+    fields_raw: dict[str, Any],
+    table: SubfieldTable,
+    fields_with_components: list[str],
+) -> list[str]:
+    """
+    Adds the subfields that apply to the fields, with the precomputed subfield table
+    of a field. Returns the names of the added subfields.
+    """
     subfield_names: list[str] = []
+    raw = fields_raw[table.field_name]
 
-    if not field_profile.subfields:
-        return subfield_names
+    for reference_name, lookup in table.references:
+        try:
+            subfields = lookup.get(fields.get(reference_name))
+        except TypeError:
+            # Unhashable value, e.g. a reference field that is decoded as an array
+            continue
 
-    for subfield in field_profile.subfields:
-        for reference in subfield.refs:
-            if reference is None:
-                continue
-            if not (field_value := fields.get(cast(str, reference["field_name"]))):
-                continue
+        if subfields is None:
+            continue
 
-            if reference["value_number"] == field_value:
-                subfield_names.append(subfield.field_name)
-                field_data = deepcopy(fields_raw[field_profile.field_name])
+        for subfield in subfields:
+            # Scalars and strings are immutable, only arrays are copied
+            field_data = list(raw) if isinstance(raw, list) else raw
 
-                if subfield.scale is not None or subfield.offset is not None:
-                    field_data = apply_scale_and_offset(
-                        field_data, subfield.scale, subfield.offset
-                    )
+            if subfield.is_scaled:
+                field_data = apply_scale_and_offset(
+                    field_data, subfield.scale, subfield.offset
+                )
 
-                fields[subfield.field_name] = field_data
+            fields[subfield.name] = field_data
+            subfield_names.append(subfield.name)
 
-                if subfield.has_components:
-                    fields_with_components.append(subfield.field_name)
+            if subfield.has_components:
+                fields_with_components.append(subfield.name)
 
     return subfield_names
 
@@ -132,76 +305,150 @@ def apply_scale_and_offset(
     return [apply_scale_and_offset(data, scale, offset) for data in field_data]
 
 
-def decode_data_message(
-    header: "RecordHeader",
-    message_definition: DefinitionMessage,
-    developer_data: dict[int, dict[str, dict[int, FieldDescription]]],
-    data: Streamable,
-) -> DataMessage:
-    message_profile = get_message_profile(message_definition.global_message_type)
-    fields: dict[str, Any] = {}
-    # Field values without scale and offset applied,
-    # used for subfields
-    fields_raw: dict[str, Any] = {}
-    fields_with_subfields: dict[str, FieldProfile] = {}
-    fields_with_components: list[str] = []
-    subfield_names = []
-
-    for field in message_definition.field_definitions:
-        message_profile_name = (
-            message_profile.name
-            if message_profile
-            else f"unknown_{message_definition.global_message_type}"
-        )
-        field_profile = (
-            message_profile.fields.get(field.number) if message_profile else None
-        )
-        field_data = read_field(
-            field_definition=field,
-            endianness=message_definition.endianness,
-            data=data,
-        )
-        field_name = (
-            field_profile.field_name
-            if field_profile
-            else f"{message_profile_name}_unknown_field_{field.number}"
-        )
-        fields_raw[field_name] = field_data
+def _decode_values(
+    plan: DecodePlan,
+    values: tuple[Any, ...],
+    fields_raw: dict[str, Any],
+) -> list[Any]:
+    """
+    Converts the unpacked values of a data message into field values, in the order of
+    the fields of the plan.
 
-        if field_profile and (
-            field_profile.scale is not None or field_profile.offset is not None
-        ):
-            field_data = apply_scale_and_offset(
-                field_data, scale=field_profile.scale, offset=field_profile.offset
-            )
+    Invalid values are converted to None and scale and offset are applied. For fields
+    with subfields, the value without scale and offset is stored in fields_raw.
+    """
+    decoded: list[Any] = []
+    append = decoded.append
+
+    for name, kind, index, count, invalid, scale, offset, keep_raw in plan.layout:
+        if kind == SCALAR:
+            value = values[index]
+
+            if value == invalid:
+                value = None
+        elif kind == ARRAY:
+            value = [
+                None if item == invalid else item
+                for item in values[index : index + count]
+            ]
+
+            if not any(filter(None, value)):
+                value = None
+        elif kind == STRING:
+            if raw := values[index].replace(b"\x00", b""):
+                value = raw.decode("utf-8")
+            else:
+                value = None
+        else:
+            value = values[index]
 
-        fields[field_name] = field_data
+        if keep_raw:
+            fields_raw[name] = value
 
-        if field_profile:
-            if field_profile.has_subfields:
-                fields_with_subfields[field_name] = field_profile
-            if field_profile.has_components:
-                fields_with_components.append(field_name)
+        if scale is not None and value is not None:
+            if kind == SCALAR and not isinstance(scale, list):
+                value = value / scale - offset
+            else:
+                value = apply_scale_and_offset(value, scale, offset)
 
-    # TODO: components, accumulate etc (from field_profile?)
-    if fields_with_subfields:
-        for field_name, field_profile in fields_with_subfields.items():
-            subfield_names += add_subfields_to_fields(
-                fields, fields_raw, field_profile, fields_with_components
+        append(value)
+
+    return decoded
+
+
+def _field_value(field: FieldPlan, values: tuple[Any, ...]) -> Any:
+    """Returns the unpacked value(s) of a field, invalid values are not converted"""
+    if field.count == 1:
+        return values[field.index]
+
+    return values[field.index : field.index + field.count]
+
+
+def _expand_components(
+    plan: DecodePlan,
+    values: tuple[Any, ...],
+    decoded: list[Any],
+    accumulators: Optional[Accumulators] = None,
+) -> None:
+    """
+    Expands the components of the fields of the plan, the component values are added
+    to the decoded values, in the order of `DecodePlan.decoded_names`.
+
+    A component value is only used when the destination field has no valid value.
+    Components with the same value as their field are copied from the field.
+    """
+    decoded.extend([None] * len(plan.component_names))
+
+    for source, destination in plan.component_aliases:
+        if decoded[destination] is None:
+            decoded[destination] = decoded[source]
+
+    if not plan.expanded_components:
+        return
+
+    expanded: dict[str, Any] = {}
+
+    for field, components in plan.expanded_components:
+        if (raw := components.source(_field_value(field, values))) is not None:
+            components.expand(
+                raw, expanded, accumulators, cast(int, plan.global_message_type)
             )
-    if fields_with_components:
-        logger.debug(f"components not implemented yet, {fields_with_components=}")
 
-    # if field_profile.accumulate:
-    #     ...
+    positions = plan.component_positions
+
+    for name, value in expanded.items():
+        if decoded[position := positions[name]] is None:
+            decoded[position] = value
+
+
+def _expand_subfield_components(
+    plan: DecodePlan,
+    subfield_name: str,
+    values: tuple[Any, ...],
+    fields: dict,
+    accumulators: Optional[Accumulators] = None,
+) -> None:
+    """Expands the components of a resolved subfield into the fields"""
+    if (entry := plan.subfield_components.get(subfield_name)) is None:
+        return
+
+    field, components = entry
+
+    if (raw := components.source(_field_value(field, values))) is None:
+        return
+
+    expanded: dict[str, Any] = {}
+    components.expand(raw, expanded, accumulators, cast(int, plan.global_message_type))
+
+    for name, value in expanded.items():
+        if fields.get(name) is None:
+            fields[name] = value
+
+
+def get_developer_plan(
+    plan: DecodePlan,
+    message_definition: DefinitionMessage,
+    developer_data: dict[int, dict[str, dict[int, FieldDescription]]],
+    data: Streamable,
+) -> Optional[DecodePlan]:
+    """
+    Returns the decode plan for the developer fields of the message definition, or
+    None if the message definition has no developer fields.
+
+    Raises a DecodeException if a developer field has no field description.
+    """
+    if not message_definition.developer_field_definitions:
+        return None
 
-    if message_definition.developer_field_definitions and not developer_data:
+    if not developer_data:
         raise DecodeException(
             detail="definition message contains developer fields, "
             "but no field descriptions are provided",
             position=data.tell(),
         )
 
+    developer_fields = []
+
     for developer_field in message_definition.developer_field_definitions:
         try:
             field_description = developer_data[developer_field.data_index]["fields"][
@@ -213,24 +460,197 @@ def decode_data_message(
                 position=data.tell(),
             )
 
-        developer_field_definition = message_definition.get_developer_field_definition(
-            data_index=field_description.developer_data_index,
-            number=field_description.field_definition_number,
+        developer_fields.append(
+            (
+                field_description.field_name,
+                developer_field.number,
+                developer_field.size,
+                field_description.base_type,
+            )
         )
 
-        if not developer_field_definition:
-            raise DecodeException(
-                detail=f"no developer field definition found for field {developer_field}",
-                position=data.tell(),
-            )
+    return plan.developer_plan(tuple(developer_fields))
 
-        field_data = read_developer_field(
-            field_description=field_description,
-            field_definition=developer_field_definition,
-            endianness=message_definition.endianness,
-            data=data,
+
+def decode_data_message(
+    header: "RecordHeader",
+    message_definition: DefinitionMessage,
+    developer_data: dict[int, dict[str, dict[int, FieldDescription]]],
+    data: Streamable,
+    plan: Optional[DecodePlan] = None,
+    accumulators: Optional[Accumulators] = None,
+    timestamps: Optional[TimestampTracker] = None,
+) -> DataMessage:
+    """
+    Decodes a data message with the compiled decode plan of the message definition,
+    or with the provided plan (e.g. a projection of the plan of the definition).
+
+    The data message is unpacked with the precompiled struct of the plan, developer
+    fields are unpacked with the struct of the developer plan. Accumulated components
+    are accumulated with the provided accumulators, see `decode_fields`.
+
+    The timestamps keep track of the last timestamp, a data message with a compressed
+    timestamp header gets the timestamp field of its time offset.
+    """
+    if plan is None:
+        plan = message_definition.plan
+
+    developer_plan = get_developer_plan(plan, message_definition, developer_data, data)
+
+    try:
+        values = read_struct(data, plan.struct)
+        developer_values = (
+            read_struct(data, developer_plan.struct) if developer_plan else None
         )
+    except struct.error as exc:
+        raise DecodeException(
+            detail="could not decode data message with provided data",
+            position=data.tell(),
+        ) from exc
+
+    timestamp = None
+
+    if timestamps is not None:
+        if header.is_compressed_timestamp_message:
+            if (
+                timestamp := timestamps.rollover(cast(int, header.time_offset))
+            ) is None:
+                raise DecodeException(
+                    detail="received a compressed timestamp header before a timestamp",
+                    position=data.tell(),
+                )
+        elif (field := plan.timestamp_field) is not None and (
+            value := values[field.index]
+        ) != field.invalid_value:
+            timestamps.timestamp = value
+
+    field_names, decoded = decode_fields(
+        plan, values, developer_plan, developer_values, accumulators=accumulators
+    )
+
+    if timestamp is not None:
+        field_names, decoded = _add_timestamp(plan, field_names, decoded, timestamp)
+
+    return DataMessage.from_values(header, field_names, decoded)
+
+
+def _add_timestamp(
+    plan: DecodePlan,
+    field_names: FieldNames,
+    values: tuple[Any, ...],
+    timestamp: int,
+) -> tuple[FieldNames, tuple[Any, ...]]:
+    """
+    Adds the timestamp of a compressed timestamp header to the field values, a valid
+    timestamp field of the message itself is kept.
+    """
+    if (position := field_names.index.get("timestamp")) is not None:
+        if values[position] is not None:
+            return field_names, values
+
+        return field_names, values[:position] + (timestamp,) + values[position + 1 :]
+
+    if plan.projection is not None and "timestamp" not in plan.projection:
+        return field_names, values
+
+    return get_field_names(field_names.names + ("timestamp",)), values + (timestamp,)
+
+
+def read_lazy_data_message(
+    header: "RecordHeader",
+    message_definition: DefinitionMessage,
+    developer_data: dict[int, dict[str, dict[int, FieldDescription]]],
+    data: Streamable,
+    plan: Optional[DecodePlan] = None,
+    accumulators: Optional[Accumulators] = None,
+    timestamps: Optional[TimestampTracker] = None,
+) -> "LazyDataMessage":
+    """
+    Reads the raw bytes of a data message, the fields are decoded on first access.
+    See `decode_data_message` for the arguments.
+
+    The fields of a lazy data message can not be accumulated, they are decoded out of
+    order. Fields that set accumulated values, and the timestamp, are still unpacked
+    to update the accumulators and timestamps. A data message with a compressed
+    timestamp header can not be read lazily.
+    """
+    if plan is None:
+        plan = message_definition.plan
+
+    developer_plan = get_developer_plan(plan, message_definition, developer_data, data)
+    size = plan.size + (developer_plan.size if developer_plan else 0)
+    raw = data.read(size)
+
+    if accumulators is not None and plan.accumulated_fields:
+        accumulators.update(plan, plan.struct.unpack_from(raw))
+
+    if timestamps is not None and (timestamp_struct := plan.timestamp_struct):
+        (value,) = timestamp_struct.unpack_from(raw)
+
+        if value != cast(FieldPlan, plan.timestamp_field).invalid_value:
+            timestamps.timestamp = value
+
+    return LazyDataMessage(header, raw, plan, developer_plan)
+
+
+def decode_fields(
+    plan: DecodePlan,
+    values: tuple[Any, ...],
+    developer_plan: Optional[DecodePlan] = None,
+    developer_values: Optional[tuple[Any, ...]] = None,
+    accumulators: Optional[Accumulators] = None,
+) -> tuple[FieldNames, tuple[Any, ...]]:
+    """
+    Converts the unpacked values of a data message into field values, subfields are
+    added and developer fields are converted with the developer plan.
+
+    Accumulated components are accumulated with the accumulators, the messages then
+    have to be decoded in the order of the FIT file. Without accumulators, the
+    accumulated components are left out.
+
+    Returns the shared field names and the field values.
+    """
+    # Field values without scale and offset applied,
+    # used for subfields
+    fields_raw: dict[str, Any] = {}
+    decoded = _decode_values(plan, values, fields_raw)
+
+    if accumulators is not None and plan.accumulated_fields:
+        accumulators.update(plan, values)
+
+    if plan.fields_with_components:
+        _expand_components(plan, values, decoded, accumulators)
+
+    developer_decoded = (
+        _decode_values(developer_plan, developer_values, fields_raw)
+        if developer_plan is not None and developer_values is not None
+        else None
+    )
+
+    if (
+        not plan.fields_with_subfields
+        and plan.output_names is None
+        and (field_names := plan.field_names(developer_plan)) is not None
+    ):
+        # The decoded fields are exactly the fields of the plans
+        if developer_decoded:
+            decoded.extend(developer_decoded)
+
+        return field_names, tuple(decoded)
+
+    fields = dict(zip(plan.decoded_names, decoded, strict=True))
+    subfields_with_components: list[str] = []
+
+    for _, table in plan.fields_with_subfields:
+        resolve_subfields(fields, fields_raw, table, subfields_with_components)
+
+    for subfield_name in subfields_with_components:
+        _expand_subfield_components(plan, subfield_name, values, fields, accumulators)
+
+    if developer_plan is not None and developer_decoded is not None:
+        fields.update(zip(developer_plan.names, developer_decoded, strict=True))
 
-        fields[field_description.field_name] = field_data
+    if (output_names := plan.output_names) is not None:
+        fields = {name: value for name, value in fields.items() if name in output_names}
 
-    return DataMessage(header=header, fields=fields)
+    return get_field_names(tuple(fields)), tuple(fields.values())
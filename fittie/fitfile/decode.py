@@ -1,26 +1,89 @@
 from __future__ import annotations  # Added for type hints
 
-import struct
-
+import functools
+import sys
+from array import array
 from collections import defaultdict
+from concurrent.futures import Executor
 from pathlib import Path
-from typing import Any, DefaultDict, Union, cast
-
+from typing import (
+    Any,
+    DefaultDict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Union,
+    cast,
+)
+
+from fittie.fitfile.columns import MessageColumns
+from fittie.fitfile.decoder import CRC_STRUCT, Decoder
 from fittie.fitfile.fitfile import FitFile
 from fittie.profile.fit_types import FIT_TYPES
 from fittie.fitfile.util import is_definition_message, is_data_message
-from fittie.fitfile.utils.datastream import DataStream, Streamable
+from fittie.fitfile.utils.datastream import DataStream, Source
 from fittie.fitfile.utils.exceptions import DecodeException
 from fittie.fitfile.data_message import DataMessage
 from fittie.fitfile.definition_message import DefinitionMessage
-from fittie.fitfile.field_description import FieldDescription
 from fittie.fitfile.header import decode_header
-from fittie.profile.mesg_nums import MESG_NUMS
 from fittie.fitfile.records import read_record_header, read_message
 
+LAYOUTS = ("messages", "columnar")
+EXECUTORS = ("process", "thread")
+
+
+def is_gil_enabled() -> bool:
+    """
+    Check whether the GIL is enabled. The GIL can be disabled on free-threaded Python
+    builds (e.g. 3.13t), threads then decode fit files in parallel.
+    """
+    return getattr(sys, "_is_gil_enabled", lambda: True)()
+
+
+def resolve_executor(executor: str) -> str:
+    """
+    Returns the executor to decode in parallel with: 'auto' is a thread pool when the
+    GIL is disabled, to avoid pickling the decoded fit files, and a process pool
+    otherwise.
+
+    Raises a ValueError for unsupported executors.
+    """
+    if executor == "auto":
+        return "process" if is_gil_enabled() else "thread"
+
+    if executor not in EXECUTORS:
+        raise ValueError(f"unsupported executor '{executor}' received")
+
+    return executor
+
+
+def create_executor(executor: str, workers: int) -> Executor:
+    """
+    Returns a pool of processes or threads with the provided number of workers. The
+    pools are imported on first use, importing the process pool slows down
+    `import fittie`.
+    """
+    if executor == "process":
+        from concurrent.futures import ProcessPoolExecutor
+
+        return ProcessPoolExecutor(max_workers=workers)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    return ThreadPoolExecutor(max_workers=workers)
+
 
 def decode(
-    source: Union[str, Path, Streamable], calculate_crc: bool = True
+    source: Source,
+    calculate_crc: bool = True,
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    fields: Optional[dict[str, Iterable[str]]] = None,
+    layout: str = "messages",
+    workers: Optional[int] = None,
+    executor: str = "auto",
+    lazy: bool = False,
 ) -> list[FitFile]:
     """
     Decode a fit file into an Iterable of FitFile.
@@ -30,102 +93,216 @@ def decode(
     This is a breaking change over earlier versions of fittie (<1.0.0).
 
     Args:
-        source: a file name, BytesIO or BufferIO.
+        source: a file name, bytes, BytesIO or BufferIO.
         calculate_crc: whether to calculate the CRC
+        include: only decode data messages of these message types
+        exclude: skip data messages of these message types
+        fields: only decode these fields, by message type
+        layout: 'messages' to store a DataMessage per message, or 'columnar' to
+            store the field values per message type in columns, see
+            `FitFile.columns`
+        workers: decode chained fit files in parallel with this number of workers
+        executor: 'process' to decode chained fit files in a process pool, 'thread'
+            to decode them in a thread pool, 'auto' to use a thread pool when the GIL
+            is disabled and a process pool otherwise
+        lazy: decode the fields of data messages on first access, see
+            `LazyDataMessage`
 
     Returns:
         Iterable[FitFile]: one or more instances of FitFile
     """
+    if layout not in LAYOUTS:
+        raise ValueError(f"unsupported layout '{layout}' received")
+
+    executor = resolve_executor(executor)
+
+    if workers is not None and workers > 1:
+        return _decode_parallel(
+            source,
+            workers,
+            executor,
+            {
+                "calculate_crc": calculate_crc,
+                "include": include,
+                "exclude": exclude,
+                "fields": fields,
+                "layout": layout,
+                "lazy": lazy,
+            },
+        )
 
     fitfiles: list[FitFile] = []
 
     with DataStream(source) as data:
-        _decode_next = True
-
-        while _decode_next:
-            total_size = sum([f.header.length + f.header.data_size for f in fitfiles])
-            data.reset_crc()  # Reset the crc calculation here in case of chained fit files.
+        decoder = Decoder(
+            calculate_crc=calculate_crc,
+            include=include,
+            exclude=exclude,
+            fields=fields,
+            lazy=lazy,
+        )
 
+        while True:
             try:
-                if not calculate_crc:
-                    # Don't calculate checksum
-                    data.should_calculate_crc = False
+                decoder.read_header(data)
+                messages: DefaultDict[str, list[DataMessage]] = defaultdict(list)
+                sequence_numbers: DefaultDict[str, array] = defaultdict(
+                    functools.partial(array, "I")
+                )
+                columns: dict[str, MessageColumns] = {}
+
+                for sequence, (message_type, message) in enumerate(
+                    decoder.iter_records(data)
+                ):
+                    if layout == "messages":
+                        messages[message_type].append(message)
+                        sequence_numbers[message_type].append(sequence)
+                    elif (message_columns := columns.get(message_type)) is not None:
+                        message_columns.append(message.fields)
+                    else:
+                        columns[message_type] = MessageColumns(message_type)
+                        columns[message_type].append(message.fields)
+            except EOFError:
+                break
 
-                header = decode_header(data)
+            fitfiles.append(decoder.build_fitfile(messages, columns, sequence_numbers))
 
-                local_message_definitions: dict[int, DefinitionMessage] = {}
-                developer_data: dict[int, dict[str, Any]] = {}
-                messages: DefaultDict[str, list[DataMessage]] = defaultdict(list)
+    return fitfiles
+
+
+def scan_fitfiles(data: DataStream) -> list[tuple[int, int]]:
+    """
+    Returns the byte range (start and end) of every (chained) fit file, from the
+    current position of data.
 
-                while data.tell() < header.length + header.data_size + total_size:
-                    # Read message
-                    message = read_message(
-                        local_message_definitions,
-                        developer_data,
-                        data,
-                    )
-
-                    if isinstance(message, DefinitionMessage):
-                        local_message_definitions[message.header.local_message_type] = (
-                            message
+    Only the headers are decoded, the data of every fit file is skipped with the data
+    size in its header. A fit file that is not complete is left out.
+    """
+    ranges: list[tuple[int, int]] = []
+
+    while True:
+        start = data.tell()
+
+        try:
+            header = decode_header(data)
+            end = start + header.length + header.data_size + CRC_STRUCT.size
+            data.skip(end - data.tell())
+        except EOFError:
+            return ranges
+
+        ranges.append((start, end))
+
+
+def _decode_range(
+    path: Union[str, Path], start: int, end: int, options: dict[str, Any]
+) -> list[FitFile]:
+    """Decodes the fit file in the provided byte range of a file, inside a worker"""
+    with DataStream(path) as data:
+        if (buffer := data.buffer) is None:
+            data.skip(start)
+            return decode(data.read(end - start), **options)
+
+        view = buffer[start:end]
+
+        try:
+            return decode(view, **options)
+        finally:
+            view.release()
+
+
+def _decode_parallel(
+    source: Source,
+    workers: int,
+    executor: str,
+    options: dict[str, Any],
+) -> list[FitFile]:
+    """
+    Decodes chained fit files in parallel. The byte ranges of the chained fit files
+    are found with `scan_fitfiles`, every range is decoded by a worker. Chained fit
+    files are independent, every fit file has its own definitions.
+
+    Workers in a process pool open the file themselves when source is a path,
+    otherwise the bytes of the range are sent to the worker. Workers in a thread pool
+    decode a view on the buffer.
+    """
+    with DataStream(source) as stream:
+        data = stream if stream.is_buffered else DataStream(stream.read(None))
+        data.should_calculate_crc = False
+        ranges = scan_fitfiles(data)
+        buffer = cast(memoryview, data.buffer)
+        views: list[memoryview] = []
+
+        try:
+            with create_executor(executor, workers) as pool:
+                futures = []
+
+                for start, end in ranges:
+                    if executor == "thread":
+                        views.append(buffer[start:end])
+                        futures.append(pool.submit(decode, views[-1], **options))
+                    elif isinstance(source, (str, Path)):
+                        futures.append(
+                            pool.submit(_decode_range, source, start, end, options)
                         )
                     else:
-                        index: int
-                        local_message_definition = local_message_definitions[
-                            message.header.local_message_type
-                        ]
-
-                        if (
-                            global_message_type
-                            := local_message_definition.global_message_type
-                        ) is None:
-                            raise DecodeException(
-                                detail="Missing global message type",
-                                position=data.tell(),
-                            )
-                        elif global_message_type == 207:
-                            # Add developer data index
-                            index = cast(int, message.fields["developer_data_index"])
-                            developer_data[index] = message.fields
-                            developer_data[index].update({"fields": {}})
-                        elif global_message_type == 206:
-                            # Add field descriptions
-                            index = cast(int, message.fields["developer_data_index"])
-                            field = FieldDescription(**message.fields)
-                            developer_data[index]["fields"][
-                                field.field_definition_number
-                            ] = field
-
-                        if global_message_type in MESG_NUMS:
-                            messages[MESG_NUMS[global_message_type]].append(message)
-                        else:
-                            messages[f"unknown_{global_message_type}"].append(message)
-
-                calculated_crc = data.calculated_crc
-                (crc,) = struct.unpack("H", data.read(2))
-
-                if calculate_crc and crc != calculated_crc:
-                    raise DecodeException(
-                        detail=(
-                            "the calculated crc does not match the crc at the end of the file"
-                        ),
-                        position=data.tell(),
-                    )
-
-                fitfile = FitFile(
-                    header=header,
-                    data_messages=messages,
-                    local_message_definitions=local_message_definitions,
-                    developer_data=developer_data,
-                )
-                fitfiles.append(fitfile)
-            except EOFError:
-                _decode_next = False
+                        futures.append(
+                            pool.submit(decode, buffer[start:end].tobytes(), **options)
+                        )
 
-    return fitfiles
+                return [fitfile for future in futures for fitfile in future.result()]
+        finally:
+            for view in views:
+                view.release()
+
+
+def iter_messages(
+    source: Source,
+    calculate_crc: bool = True,
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    fields: Optional[dict[str, Iterable[str]]] = None,
+    lazy: bool = False,
+) -> Iterator[tuple[int, str, DataMessage]]:
+    """
+    Decode a fit file and yield every data message as soon as it is decoded.
+
+    Contrary to `decode`, the messages are not collected, definition messages and
+    developer data are only kept as internal state. This keeps memory usage constant,
+    regardless of the size of the fit file.
+
+    Args:
+        source: a file name, bytes, BytesIO or BufferIO.
+        calculate_crc: whether to calculate the CRC
+        include: only decode data messages of these message types
+        exclude: skip data messages of these message types
+        fields: only decode these fields, by message type
+        lazy: decode the fields of data messages on first access, see
+            `LazyDataMessage`
+
+    Yields:
+        tuple[int, str, DataMessage]: the index of the (chained) fit file, the
+        message type and the data message
+    """
+    with DataStream(source) as data:
+        decoder = Decoder(
+            calculate_crc=calculate_crc,
+            include=include,
+            exclude=exclude,
+            fields=fields,
+            lazy=lazy,
+        )
+
+        while True:
+            try:
+                decoder.read_header(data)
+
+                for message_type, message in decoder.iter_records(data):
+                    yield decoder.fitfile_index, message_type, message
+            except EOFError:
+                return
 
 
-def decode_file_type(source: Union[str, Path, Streamable]) -> str:
+def decode_file_type(source: Source) -> str:
     """
     Only reads the File header, the first definition message and the first data message
     to retrieve the file type (e.g. activity, workout, weight etc.).
@@ -136,7 +313,7 @@ def decode_file_type(source: Union[str, Path, Streamable]) -> str:
     - A definition message for 'file_id'
     - A data message for 'file_id'
     """
-    fields = {}
+    fields: Mapping[str, Any] = {}
 
     with DataStream(source) as data:
         decode_header(data)
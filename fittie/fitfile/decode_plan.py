@@ -0,0 +1,729 @@
+from __future__ import annotations  # Added for type hints
+
+import functools
+import string
+import struct
+from struct import Struct
+from typing import Any, Iterable, Optional, TYPE_CHECKING, cast
+
+from fittie.fitfile.components import (
+    ComponentsPlan,
+    get_accumulated_fields,
+    get_components_plan,
+)
+from fittie.fitfile.subfields import SubfieldTable, get_subfield_table
+from fittie.fitfile.timestamps import TIMESTAMP_FIELD_NUMBER
+from fittie.profile.base_types import BaseType, get_base_type
+from fittie.profile.mesg_nums import MESG_NUMS
+from fittie.profile.util import get_message_profile
+
+if TYPE_CHECKING:
+    from fittie.fitfile.field_definitions import FieldDefinition
+    from fittie.profile import FieldProfile, MessageProfile, SubField
+
+# Field kinds, determines how the unpacked value(s) of a field are converted
+SCALAR = 0
+ARRAY = 1
+STRING = 2
+RAW = 3  # Single byte string, returned as bytes
+PADDING = 4
+
+# Number of developer plans, projected plans and field names of plans that are kept,
+# plans are shared by all files and threads
+DEVELOPER_PLAN_CACHE_SIZE = 1024
+PROJECTED_PLAN_CACHE_SIZE = 1024
+PLAN_FIELD_NAMES_CACHE_SIZE = 4096
+
+
+class FieldNames:
+    """
+    The field names of data messages, with the position of every field name.
+
+    Data messages store their field values as a tuple, the field names are shared by
+    all data messages with the same fields.
+    """
+
+    __slots__ = ("names", "index")
+
+    names: tuple[str, ...]
+    index: dict[str, int]
+
+    def __init__(self, names: tuple[str, ...]):
+        self.names = names
+        self.index = {name: index for index, name in enumerate(names)}
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __str__(self) -> str:
+        return f"FieldNames:{self.names=}".replace("self.", " ")
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+@functools.lru_cache(maxsize=4096)
+def get_field_names(names: tuple[str, ...]) -> FieldNames:
+    """Returns the shared FieldNames for the provided (unique) field names"""
+    return FieldNames(names)
+
+
+def _unique_field_names(names: tuple[str, ...]) -> Optional[FieldNames]:
+    """Returns the FieldNames, or None if a field name occurs more than once"""
+    field_names = get_field_names(names)
+
+    return field_names if len(field_names.index) == len(names) else None
+
+
+class FieldPlan:
+    """
+    Compiled layout of a single field inside a data message.
+
+    `index` is the position of the first value of the field inside the tuple that is
+    returned by unpacking the data message, `count` is the number of values the field
+    occupies in that tuple.
+    """
+
+    __slots__ = (
+        "name",
+        "number",
+        "kind",
+        "index",
+        "count",
+        "size",
+        "fmt",
+        "invalid_value",
+        "scale",
+        "offset",
+        "profile",
+    )
+
+    name: str
+    number: int
+    kind: int
+    index: int
+    count: int
+    size: int
+    fmt: str
+    invalid_value: Any
+    scale: float | int | list[int] | None
+    offset: int | None
+    profile: Optional[FieldProfile]
+
+    def __init__(
+        self,
+        name: str,
+        number: int,
+        kind: int,
+        index: int,
+        count: int,
+        size: int,
+        fmt: str,
+        invalid_value: Any,
+        scale: float | int | list[int] | None = None,
+        offset: int | None = None,
+        profile: Optional[FieldProfile] = None,
+    ):
+        self.name = name
+        self.number = number
+        self.kind = kind
+        self.index = index
+        self.count = count
+        self.size = size
+        self.fmt = fmt
+        self.invalid_value = invalid_value
+        self.scale = scale
+        self.offset = offset
+        self.profile = profile
+
+    def moved(self, index: int) -> "FieldPlan":
+        """Returns a copy of this field plan at another index"""
+        return FieldPlan(
+            self.name,
+            self.number,
+            self.kind,
+            index,
+            self.count,
+            self.size,
+            self.fmt,
+            self.invalid_value,
+            scale=self.scale,
+            offset=self.offset,
+            profile=self.profile,
+        )
+
+    def skipped(self) -> "FieldPlan":
+        """Returns a padding field plan, which steps over the bytes of this field"""
+        return FieldPlan(
+            self.name,
+            self.number,
+            PADDING,
+            self.index,
+            0,
+            self.size,
+            f"{self.size}x",
+            None,
+        )
+
+    @property
+    def is_scaled(self) -> bool:
+        """Check whether scale or offset has to be applied to the field value"""
+        return self.scale is not None or self.offset is not None
+
+    @property
+    def element_size(self) -> int:
+        """Returns the size of a single value of the field, without padding"""
+        return struct.calcsize(self.fmt.lstrip(string.digits)[0])
+
+    def __str__(self) -> str:
+        return f"FieldPlan:{self.name=}{self.kind=}{self.index=}{self.count=}".replace(
+            "self.", " "
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class DecodePlan:
+    """
+    A compiled decode plan for the data messages that belong to a definition message.
+
+    The plan holds a single precompiled struct.Struct that covers all fields of the
+    data message, so a data message can be decoded with one read and one unpack
+    instead of a read and unpack per field.
+
+    A plan can be projected on a set of field names, see `project`. Fields that are
+    not needed are stepped over with pad bytes, and are never unpacked.
+
+    Plans are shared by all files and threads, see `compile_definition`, and are not
+    modified after they are compiled. The plans and field names that are derived from
+    a plan are kept in bounded LRU caches.
+    """
+
+    struct: struct.Struct
+    size: int
+    endianness: str
+    global_message_type: Optional[int]
+    message_name: str
+    message_type: str
+    all_fields: tuple[FieldPlan, ...]
+    fields: tuple[FieldPlan, ...]
+    fields_with_subfields: tuple[tuple[str, SubfieldTable], ...]
+    fields_with_components: tuple[tuple[FieldPlan, ComponentsPlan], ...]
+    # Components that have the same value as their field, as positions of the field
+    # and the destination in names + component_names
+    component_aliases: tuple[tuple[int, int], ...]
+    # Components that are extracted from the bits of their field
+    expanded_components: tuple[tuple[FieldPlan, ComponentsPlan], ...]
+    # Components of subfields by subfield name, with the field of the subfield
+    subfield_components: dict[str, tuple[FieldPlan, ComponentsPlan]]
+    # Fields that are the destination of accumulated components, with the bits,
+    # scale and offset of these components
+    accumulated_fields: tuple[tuple[FieldPlan, tuple[tuple[int, Any, Any], ...]], ...]
+    # Whether components of the fields or subfields are accumulated
+    accumulates: bool
+    layout: tuple[tuple, ...]
+    projection: Optional[frozenset[str]]
+    # Names of the fields that are returned, None if all decoded fields are returned
+    output_names: Optional[frozenset[str]]
+    names: tuple[str, ...]
+    # Names of the destination fields of components that are not decoded fields
+    component_names: tuple[str, ...]
+    # Position of the destination fields of components in names + component_names
+    component_positions: dict[str, int]
+    # Names of the fields, subfields and components that a projection can select
+    projectable_names: frozenset[str]
+    # Timestamp field, its value is the full timestamp for compressed timestamp headers
+    timestamp_field: Optional[FieldPlan]
+    # Unpacks only the timestamp field from the data message
+    timestamp_struct: Optional[Struct]
+
+    def __init__(
+        self,
+        endianness: str,
+        message_name: str,
+        fields: Iterable[FieldPlan],
+        global_message_type: Optional[int] = None,
+        projection: Optional[frozenset[str]] = None,
+    ):
+        self.all_fields = tuple(fields)
+        self.struct = struct.Struct(
+            endianness + "".join(field.fmt for field in self.all_fields)
+        )
+        self.size = self.struct.size
+        self.endianness = endianness
+        self.global_message_type = global_message_type
+        self.message_name = message_name
+        self.message_type = (
+            MESG_NUMS.get(global_message_type, f"unknown_{global_message_type}")
+            if global_message_type is not None
+            else message_name
+        )
+        self.fields = tuple(field for field in self.all_fields if field.kind != PADDING)
+        self.fields_with_subfields = tuple(
+            (field.name, table)
+            for field in self.fields
+            if (table := get_subfield_table(field.profile)) is not None
+        )
+        self.names = tuple(field.name for field in self.fields)
+        self._compile_components(
+            get_message_profile(global_message_type)
+            if global_message_type is not None
+            else None
+        )
+        self._compile_timestamp()
+        self.projectable_names = frozenset(
+            self.decoded_names
+            + tuple(
+                subfield.name
+                for _, table in self.fields_with_subfields
+                for subfield in table.subfields
+            )
+            + tuple(
+                name
+                for _, components in self.subfield_components.values()
+                for name in components.names()
+            )
+            # Data messages with a compressed timestamp header have a timestamp
+            + ("timestamp",)
+        )
+        self.projection = projection
+        self.output_names = None
+
+        if projection is not None and (
+            self.fields_with_subfields
+            or self.component_names
+            or any(field.name not in projection for field in self.fields)
+        ):
+            # Subfields, components or fields that are only decoded as dependency are
+            # removed from the decoded fields
+            self.output_names = projection
+
+        # Flattened version of fields, tuple unpacking is faster than attribute access
+        # in the decode loop
+        self.layout = tuple(
+            (
+                field.name,
+                field.kind,
+                field.index,
+                field.count,
+                field.invalid_value,
+                _plan_scale(field),
+                field.offset or 0,
+                # Whether the value without scale and offset is kept for subfields
+                get_subfield_table(field.profile) is not None,
+            )
+            for field in self.fields
+        )
+
+    def _compile_components(self, message_profile: Optional[MessageProfile]) -> None:
+        """Compiles the components of the fields and subfields of this plan"""
+        self.fields_with_components = tuple(
+            (field, components)
+            for field in self.fields
+            if (components := _field_components(field, field.profile, message_profile))
+            is not None
+        )
+        self.subfield_components = {}
+
+        for field in self.fields:
+            if (table := get_subfield_table(field.profile)) is None:
+                continue
+
+            for subfield in table.subfields:
+                if (
+                    components := _field_components(
+                        field, subfield.profile, message_profile
+                    )
+                ) is not None:
+                    self.subfield_components[subfield.name] = (field, components)
+
+        names = dict.fromkeys(
+            name
+            for _, components in self.fields_with_components
+            for name in components.names()
+        )
+        self.component_names = tuple(name for name in names if name not in self.names)
+        decoded_names = self.names + self.component_names
+        self.component_positions = {name: decoded_names.index(name) for name in names}
+        self.component_aliases = tuple(
+            (
+                decoded_names.index(field.name),
+                self.component_positions[components.components[0].name],
+            )
+            for field, components in self.fields_with_components
+            if _is_alias(field, components)
+        )
+        self.expanded_components = tuple(
+            (field, components)
+            for field, components in self.fields_with_components
+            if not _is_alias(field, components)
+        )
+        accumulated = get_accumulated_fields(message_profile)
+        self.accumulated_fields = tuple(
+            (field, accumulated[field.name])
+            for field in self.fields
+            if field.name in accumulated
+        )
+        self.accumulates = any(
+            components.accumulates
+            for _, components in self.fields_with_components
+            + tuple(self.subfield_components.values())
+        )
+
+    def _compile_timestamp(self) -> None:
+        """Finds the timestamp field of the data messages of this plan"""
+        self.timestamp_field = None
+        self.timestamp_struct = None
+
+        if self.global_message_type is None:
+            # Developer fields can use any field number
+            return
+
+        fmt = ""
+
+        for field in self.all_fields:
+            if field.number == TIMESTAMP_FIELD_NUMBER and field.kind == SCALAR:
+                self.timestamp_field = field
+                self.timestamp_struct = struct.Struct(
+                    f"{self.endianness}{struct.calcsize(self.endianness + fmt)}x"
+                    f"{field.fmt}"
+                )
+                return
+
+            fmt += field.fmt
+
+    @property
+    def decoded_names(self) -> tuple[str, ...]:
+        """Returns the names of the decoded fields, followed by the component names"""
+        return self.names + self.component_names
+
+    def developer_plan(
+        self, developer_fields: tuple[tuple[str, int, int, BaseType], ...]
+    ) -> "DecodePlan":
+        """
+        Returns the compiled plan for the provided developer fields, the developer
+        fields follow the regular fields in a data message.
+
+        Developer fields are provided as (field name, field number, size, base type),
+        compiled plans are reused for data messages with the same developer fields. The
+        number of reused plans is bounded, see DEVELOPER_PLAN_CACHE_SIZE.
+        When this plan is projected, the developer plan has the same projection.
+        """
+        key = tuple(
+            (name, number, size, base_type.number)
+            for name, number, size, base_type in developer_fields
+        )
+
+        return _get_developer_plan(self.endianness, key, self.projection)
+
+    def field_names(
+        self, developer_plan: Optional["DecodePlan"] = None
+    ) -> Optional[FieldNames]:
+        """
+        Returns the shared field names of the decoded fields of this plan, followed by
+        the fields of the developer plan.
+
+        Returns None if a field name occurs more than once, these fields can only be
+        decoded as a dict.
+        """
+        return _get_plan_field_names(self, developer_plan)
+
+    def project(
+        self, names: frozenset[str], developer_fields: bool = False
+    ) -> "DecodePlan":
+        """
+        Returns a plan that only decodes the fields with the provided names, and the
+        fields they depend on. Projected plans are reused for the same names, the
+        number of reused plans is bounded, see PROJECTED_PLAN_CACHE_SIZE.
+
+        When a subfield is requested, the field it belongs to and the reference
+        fields of the subfield are decoded too.
+
+        Names that this plan can not decode are left out, unless developer fields
+        follow the fields of this plan: the names of developer fields are only known
+        from the field descriptions of a file.
+        """
+        if not developer_fields:
+            names = names & self.projectable_names
+
+        return _project_decode_plan(self, names)
+
+    def __str__(self) -> str:
+        return f"DecodePlan:{self.message_name=}{self.size=}{self.fields=}".replace(
+            "self.", " "
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+@functools.lru_cache(maxsize=PLAN_FIELD_NAMES_CACHE_SIZE)
+def _get_plan_field_names(
+    plan: DecodePlan, developer_plan: Optional[DecodePlan]
+) -> Optional[FieldNames]:
+    """Returns the field names of a plan and developer plan, see `field_names`"""
+    names = plan.decoded_names + (developer_plan.names if developer_plan else ())
+
+    return _unique_field_names(names)
+
+
+def get_required_fields(fields: Iterable[FieldPlan], names: frozenset[str]) -> set[str]:
+    """
+    Returns the names of the fields that have to be decoded to retrieve the fields
+    with the provided names.
+    """
+    required = set()
+
+    for field in fields:
+        if field.name in names:
+            required.add(field.name)
+
+        if field.profile is None or not field.profile.subfields:
+            continue
+
+        for subfield in field.profile.subfields:
+            if subfield.field_name not in names:
+                continue
+
+            required.add(field.name)
+            required.update(
+                cast(str, reference["field_name"])
+                for reference in subfield.refs
+                if reference is not None
+            )
+
+    return required
+
+
+@functools.lru_cache(maxsize=PROJECTED_PLAN_CACHE_SIZE)
+def _project_decode_plan(plan: DecodePlan, names: frozenset[str]) -> DecodePlan:
+    # Fields and subfields with components that have a requested destination
+    sources = {
+        field.name
+        for field, components in plan.fields_with_components
+        if not names.isdisjoint(components.names())
+    }
+    sources.update(
+        subfield_name
+        for subfield_name, (_, components) in plan.subfield_components.items()
+        if not names.isdisjoint(components.names())
+    )
+    # The timestamp is always decoded, for data messages with a compressed timestamp
+    # header
+    sources.add("timestamp")
+    required = get_required_fields(plan.fields, names | sources)
+    fields: list[FieldPlan] = []
+    index = 0
+
+    for field in plan.all_fields:
+        if field.kind == PADDING or field.name not in required:
+            fields.append(field.skipped())
+            continue
+
+        fields.append(field.moved(index))
+        index += field.count
+
+    return DecodePlan(
+        plan.endianness,
+        plan.message_name,
+        fields,
+        plan.global_message_type,
+        projection=names,
+    )
+
+
+def _plan_scale(field: FieldPlan) -> float | int | list[int] | None:
+    """Returns the scale for the decode loop, None when no scaling is needed at all"""
+    if not field.is_scaled:
+        return None
+
+    return field.scale if field.scale is not None else 1
+
+
+def _is_alias(field: FieldPlan, components: ComponentsPlan) -> bool:
+    """
+    Check whether the field has a single component with the same value as the field,
+    e.g. speed and enhanced_speed. The value of the field is used for the component.
+    """
+    if len(components.components) != 1 or components.count != 1:
+        return False
+
+    component = components.components[0]
+
+    return (
+        component.shift == 0
+        and component.bits >= components.element_bits
+        and not component.accumulate
+        and component.components is None
+        # Unsigned, the value of signed fields differs from the bits of the component
+        and field.fmt.lstrip(string.digits)[0].isupper()
+        and component.scale == (field.scale if field.scale is not None else 1)
+        and component.offset == (field.offset or 0)
+    )
+
+
+def _field_components(
+    field: FieldPlan,
+    profile: Optional[FieldProfile | SubField],
+    message_profile: Optional[MessageProfile],
+) -> Optional[ComponentsPlan]:
+    """Returns the components of a field or subfield profile for the field"""
+    if (
+        profile is None
+        or profile.components is None
+        or field.kind
+        not in (
+            SCALAR,
+            ARRAY,
+        )
+    ):
+        return None
+
+    return get_components_plan(
+        profile,
+        message_profile,
+        field.count,
+        field.element_size * 8,
+        field.invalid_value,
+    )
+
+
+def _compile_field(
+    name: str,
+    number: int,
+    size: int,
+    base_type: BaseType,
+    index: int,
+    profile: Optional[FieldProfile] = None,
+) -> FieldPlan:
+    """
+    Returns the FieldPlan, including the struct format, for a single field
+
+    A field that has a size which is not a multiple of the base type size is padded
+    with pad bytes, so the remainder of the data message stays aligned.
+    """
+    count = size // base_type.size
+    remainder = size - count * base_type.size
+    padding = f"{remainder}x" if remainder else ""
+
+    if count == 0:
+        return FieldPlan(name, number, PADDING, index, 0, size, f"{size}x", None)
+
+    if base_type.value_type is str:
+        kind = RAW if size == 1 else STRING
+        return FieldPlan(name, number, kind, index, 1, size, f"{size}s{padding}", None)
+
+    kind = SCALAR if count == 1 else ARRAY
+    fmt = base_type.fmt if count == 1 else f"{count}{base_type.fmt}"
+
+    if profile is not None and isinstance(profile.components, list):
+        # The scale and offset of a field with multiple components apply to the
+        # components, not to the field value itself
+        scale, offset = None, None
+    else:
+        scale = profile.scale if profile else None
+        offset = profile.offset if profile else None
+
+    return FieldPlan(
+        name,
+        number,
+        kind,
+        index,
+        count,
+        size,
+        f"{fmt}{padding}",
+        base_type.invalid_value,
+        scale=scale,
+        offset=offset,
+        profile=profile,
+    )
+
+
+def compile_decode_plan(
+    global_message_type: int,
+    endianness: str,
+    field_definitions: Iterable["FieldDefinition"],
+) -> DecodePlan:
+    """
+    Compiles the decode plan for the data messages of a definition message.
+
+    Field names, scale and offset are resolved once from the message profile.
+    """
+    message_profile = get_message_profile(global_message_type)
+    message_name = (
+        message_profile.name if message_profile else f"unknown_{global_message_type}"
+    )
+
+    fields: list[FieldPlan] = []
+    index = 0
+
+    for field_definition in field_definitions:
+        field_profile = (
+            message_profile.fields.get(field_definition.number)
+            if message_profile
+            else None
+        )
+        field_name = (
+            field_profile.field_name
+            if field_profile
+            else f"{message_name}_unknown_field_{field_definition.number}"
+        )
+        field_plan = _compile_field(
+            field_name,
+            field_definition.number,
+            field_definition.size,
+            field_definition.base_type,
+            index,
+            field_profile,
+        )
+        fields.append(field_plan)
+        index += field_plan.count
+
+    return DecodePlan(endianness, message_name, fields, global_message_type)
+
+
+@functools.lru_cache(maxsize=DEVELOPER_PLAN_CACHE_SIZE)
+def _get_developer_plan(
+    endianness: str,
+    developer_fields: tuple[tuple[str, int, int, int], ...],
+    projection: Optional[frozenset[str]],
+) -> DecodePlan:
+    """
+    Returns the compiled plan for developer fields with the number of their base type,
+    see `DecodePlan.developer_plan`
+    """
+    return compile_developer_plan(
+        endianness,
+        (
+            (name, number, size, get_base_type(base_type))
+            for name, number, size, base_type in developer_fields
+        ),
+        projection,
+    )
+
+
+def compile_developer_plan(
+    endianness: str,
+    developer_fields: Iterable[tuple[str, int, int, BaseType]],
+    projection: Optional[frozenset[str]] = None,
+) -> DecodePlan:
+    """
+    Compiles the decode plan for the developer fields of a data message.
+
+    Developer fields are provided as (field name, field number, size, base type).
+    With a projection, developer fields that are not in the projection are skipped.
+    """
+    fields: list[FieldPlan] = []
+    index = 0
+
+    for name, number, size, base_type in developer_fields:
+        field_plan = _compile_field(name, number, size, base_type, index)
+
+        if projection is not None and name not in projection:
+            field_plan = field_plan.skipped()
+
+        fields.append(field_plan)
+        index += field_plan.count
+
+    return DecodePlan(endianness, "developer_data", fields, projection=projection)
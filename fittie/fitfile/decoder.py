@@ -0,0 +1,415 @@
+from __future__ import annotations  # Added for type hints
+
+import struct
+from array import array
+from struct import Struct
+from typing import Any, Iterable, Iterator, Optional, cast
+
+from fittie.fitfile.accumulators import Accumulators
+from fittie.fitfile.columns import MessageColumns
+from fittie.fitfile.data_message import (
+    DataMessage,
+    decode_data_message,
+    read_lazy_data_message,
+)
+from fittie.fitfile.decode_plan import DecodePlan, FieldPlan
+from fittie.fitfile.definition_message import (
+    DefinitionMessage,
+    decode_definition_message,
+)
+from fittie.fitfile.field_description import FieldDescription
+from fittie.fitfile.fitfile import FitFile
+from fittie.fitfile.header import Header, decode_header
+from fittie.fitfile.records import RecordHeader, read_record_header
+from fittie.fitfile.timestamps import TimestampTracker
+from fittie.fitfile.utils.datastream import DataStream
+from fittie.fitfile.utils.exceptions import DecodeException
+from fittie.profile.mesg_nums import MESG_NUMS
+
+CRC_STRUCT = struct.Struct("<H")
+# Developer data id and field description messages are needed to decode developer
+# fields, these are always decoded, even when they are excluded
+DEVELOPER_DATA_MESSAGE_TYPES = frozenset({206, 207})
+
+_MESSAGE_NUMBERS = {name: number for number, name in MESG_NUMS.items()}
+
+
+def get_message_numbers(message_types: Iterable[str]) -> frozenset[int]:
+    """
+    Returns the global message numbers for the provided message type names.
+
+    Message types of unknown messages can be provided as 'unknown_<number>'. If the
+    provided message type is unknown, a ValueError will be raised.
+    """
+    numbers = set()
+
+    for message_type in message_types:
+        if (number := _MESSAGE_NUMBERS.get(message_type)) is None:
+            prefix, _, suffix = message_type.partition("unknown_")
+
+            if prefix or not suffix.isdigit():
+                raise ValueError(f"unknown message type '{message_type}' received")
+
+            number = int(suffix)
+
+        numbers.add(number)
+
+    return frozenset(numbers)
+
+
+class Decoder:
+    """
+    Holds the state that is needed to decode the messages of a FIT file, one record
+    at a time.
+
+    A FIT file can contain one or more chained FIT files, the state (header, local
+    message definitions and developer data) is reset for each chained FIT file when
+    its header is read.
+
+    Data messages of message types that are not included, or are excluded, are
+    skipped without decoding their fields. For message types with a field projection,
+    only the requested fields (and the fields they depend on) are decoded.
+
+    When lazy is set, data messages are read as LazyDataMessage, their fields are
+    decoded on first access. Developer data messages are always decoded.
+
+    Accumulated components (e.g. the distance of compressed_speed_distance) are
+    accumulated over the data messages of a FIT file, with the accumulators of the
+    decoder. Data messages with accumulated components are never read lazily.
+
+    The timestamps keep track of the last timestamp of the FIT file, for data messages
+    with a compressed timestamp header. These are never read lazily either, skipped
+    data messages still update the timestamps.
+    """
+
+    calculate_crc: bool
+    lazy: bool
+    include: Optional[frozenset[int]]
+    exclude: frozenset[int]
+    fields: dict[int, frozenset[str]]
+    fitfile_index: int
+    header: Optional[Header]
+    local_message_definitions: dict[int, DefinitionMessage]
+    developer_data: dict[int, dict[str, Any]]
+    accumulators: Accumulators
+    timestamps: TimestampTracker
+    end: int
+    # Size of the data messages to skip, by local message type, with the plan when the
+    # timestamp of the skipped data messages can be read afterward
+    _skip_sizes: dict[int, tuple[int, Optional[DecodePlan]]]
+    # Projected decode plans, by local message type
+    _projected_plans: dict[int, DecodePlan]
+    # Plan and position of the last skipped data message with a timestamp, the
+    # timestamp is only read when the next data message is read
+    _skipped_timestamp: Optional[tuple[DecodePlan, int]]
+
+    def __init__(
+        self,
+        calculate_crc: bool = True,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        fields: Optional[dict[str, Iterable[str]]] = None,
+        lazy: bool = False,
+    ):
+        self.calculate_crc = calculate_crc
+        self.lazy = lazy
+        self.include = None if include is None else get_message_numbers(include)
+        self.exclude = frozenset() if exclude is None else get_message_numbers(exclude)
+        self.fields = {}
+
+        for message_type, field_names in (fields or {}).items():
+            for number in get_message_numbers([message_type]):
+                self.fields[number] = frozenset(field_names)
+
+        self.fitfile_index = -1
+        self.header = None
+        self.local_message_definitions = {}
+        self.developer_data = {}
+        self.accumulators = Accumulators()
+        self.timestamps = TimestampTracker()
+        self.end = 0
+        self._skip_sizes = {}
+        self._projected_plans = {}
+        self._skipped_timestamp = None
+
+    def read_header(self, data: DataStream) -> Header:
+        """
+        Reads the header of the next (chained) FIT file and resets the decoder state.
+
+        Raises EOFError when there is no next FIT file.
+        """
+        start = data.tell()
+        data.should_calculate_crc = self.calculate_crc
+        # Reset the crc calculation here in case of chained fit files.
+        data.reset_crc()
+
+        header = decode_header(data)
+
+        self.fitfile_index += 1
+        self.header = header
+        self.local_message_definitions = {}
+        self.developer_data = {}
+        self.accumulators = Accumulators()
+        self.timestamps = TimestampTracker()
+        self._skip_sizes = {}
+        self._projected_plans = {}
+        self._skipped_timestamp = None
+        self.end = start + header.length + header.data_size
+
+        return header
+
+    def read_record(self, data: DataStream) -> Optional[tuple[str, DataMessage]]:
+        """
+        Reads a single record and updates the decoder state.
+
+        Returns the message type and the data message for data messages, None for
+        definition messages and skipped data messages.
+        """
+        record_header = read_record_header(data)
+        local_message_type = record_header.local_message_type
+
+        if record_header.is_developer_data or record_header.is_definition_message:
+            self.add_definition(
+                local_message_type,
+                decode_definition_message(record_header, data),
+                data.buffer is not None,
+            )
+            return None
+
+        if (skip := self._skip_sizes.get(local_message_type)) is not None:
+            skip_size, timestamp_plan = skip
+
+            if (
+                timestamp_plan is not None
+                and not record_header.is_compressed_timestamp_message
+            ):
+                # Only the timestamp of the last skipped data message is needed, it
+                # is read from the buffer when the next data message is read
+                self._skipped_timestamp = (timestamp_plan, data.tell())
+                data.skip(skip_size)
+            else:
+                self.skip_data_message(record_header, skip_size, data)
+
+            return None
+
+        if self._skipped_timestamp is not None:
+            self._read_skipped_timestamp(data)
+
+        if (
+            definition_message := self.local_message_definitions.get(local_message_type)
+        ) is None:
+            raise DecodeException(
+                detail=f"did not receive local message definition for number "
+                f"{local_message_type}",
+                position=data.tell(),
+            )
+
+        return self.read_data_message(record_header, definition_message, data)
+
+    def add_definition(
+        self, local_message_type: int, definition: DefinitionMessage, buffered: bool
+    ) -> None:
+        """
+        Sets the definition message of a local message type. The size of skipped data
+        messages and the projected plan are prepared for the filters of the decoder.
+        The timestamp of a skipped data message is only read later if the data is
+        buffered.
+        """
+        self.local_message_definitions[local_message_type] = definition
+
+        if (
+            definition.global_message_type not in DEVELOPER_DATA_MESSAGE_TYPES
+            and self.is_excluded(definition.global_message_type)
+        ):
+            self._skip_sizes[local_message_type] = (
+                definition.plan.size
+                + sum(field.size for field in definition.developer_field_definitions),
+                definition.plan
+                if definition.plan.timestamp_struct is not None and buffered
+                else None,
+            )
+        else:
+            self._skip_sizes.pop(local_message_type, None)
+
+        if (names := self.fields.get(definition.global_message_type)) is not None:
+            self._projected_plans[local_message_type] = definition.plan.project(
+                names, bool(definition.developer_field_definitions)
+            )
+        else:
+            self._projected_plans.pop(local_message_type, None)
+
+    def skip_data_message(
+        self, record_header: RecordHeader, size: int, data: DataStream
+    ) -> None:
+        """
+        Skips a data message of the provided size, only the timestamp is kept to keep
+        track of the timestamps.
+        """
+        if record_header.is_compressed_timestamp_message:
+            if self._skipped_timestamp is not None:
+                self._read_skipped_timestamp(data)
+
+            self.timestamps.rollover(cast(int, record_header.time_offset))
+            data.skip(size)
+            return
+
+        plan = self.local_message_definitions[record_header.local_message_type].plan
+
+        if (timestamp_struct := plan.timestamp_struct) is None:
+            data.skip(size)
+        elif data.buffer is not None:
+            self._skipped_timestamp = (plan, data.tell())
+            data.skip(size)
+        else:
+            self._set_timestamp(plan, data.unpack(timestamp_struct))
+            data.skip(size - timestamp_struct.size)
+
+    def read_skipped_timestamp(self, data: DataStream) -> None:
+        """
+        Reads the timestamp of the last skipped data message, when it is not read yet.
+        This is needed before the buffer of data changes, e.g. between chunks.
+        """
+        if self._skipped_timestamp is not None:
+            self._read_skipped_timestamp(data)
+
+    def _read_skipped_timestamp(self, data: DataStream) -> None:
+        """Reads the timestamp of the last skipped data message from the buffer"""
+        plan, position = cast(tuple[DecodePlan, int], self._skipped_timestamp)
+        self._skipped_timestamp = None
+        self._set_timestamp(
+            plan,
+            cast(Struct, plan.timestamp_struct).unpack_from(
+                cast(memoryview, data.buffer), position
+            ),
+        )
+
+    def _set_timestamp(self, plan: DecodePlan, values: tuple[Any, ...]) -> None:
+        if (value := values[0]) != cast(FieldPlan, plan.timestamp_field).invalid_value:
+            self.timestamps.timestamp = value
+
+    def read_data_message(
+        self,
+        record_header: RecordHeader,
+        definition_message: DefinitionMessage,
+        data: DataStream,
+    ) -> Optional[tuple[str, DataMessage]]:
+        """
+        Decodes a data message with the provided definition message, developer data
+        messages are added to the developer data.
+
+        Returns the message type and the data message, or None if the message is only
+        decoded to keep track of the developer data.
+        """
+        local_message_type = record_header.local_message_type
+
+        if (global_message_type := definition_message.global_message_type) is None:
+            raise DecodeException(
+                detail="Missing global message type",
+                position=data.tell(),
+            )
+
+        plan = self._projected_plans.get(local_message_type, definition_message.plan)
+
+        if (
+            self.lazy
+            and global_message_type not in DEVELOPER_DATA_MESSAGE_TYPES
+            and not plan.accumulates
+            and not record_header.is_compressed_timestamp_message
+        ):
+            return definition_message.plan.message_type, read_lazy_data_message(
+                record_header,
+                definition_message,
+                self.developer_data,
+                data,
+                plan=plan,
+                accumulators=self.accumulators,
+                timestamps=self.timestamps,
+            )
+
+        message = decode_data_message(
+            record_header,
+            definition_message,
+            self.developer_data,
+            data,
+            plan=plan,
+            accumulators=self.accumulators,
+            timestamps=self.timestamps,
+        )
+
+        if global_message_type == 207:
+            # Add developer data index
+            index = cast(int, message.fields["developer_data_index"])
+            self.developer_data[index] = dict(message.fields)
+            self.developer_data[index].update({"fields": {}})
+        elif global_message_type == 206:
+            # Add field descriptions
+            index = cast(int, message.fields["developer_data_index"])
+            field = FieldDescription(**message.fields)
+            self.developer_data[index]["fields"][field.field_definition_number] = field
+
+        if global_message_type in DEVELOPER_DATA_MESSAGE_TYPES and self.is_excluded(
+            global_message_type
+        ):
+            # Only decoded to keep track of the developer data
+            return None
+
+        return definition_message.plan.message_type, message
+
+    def is_excluded(self, global_message_type: int) -> bool:
+        """Check whether data messages of the global message type are filtered out"""
+        if self.include is not None and global_message_type not in self.include:
+            return True
+
+        return global_message_type in self.exclude
+
+    def read_crc(self, data: DataStream) -> int:
+        """
+        Reads the crc at the end of the FIT file and compares it with the calculated
+        crc, returns the crc.
+        """
+        calculated_crc = data.calculated_crc
+        (crc,) = data.unpack(CRC_STRUCT)
+
+        if self.calculate_crc and crc != calculated_crc:
+            raise DecodeException(
+                detail=(
+                    "the calculated crc does not match the crc at the end of the file"
+                ),
+                position=data.tell(),
+            )
+
+        return crc
+
+    def iter_records(self, data: DataStream) -> Iterator[tuple[str, DataMessage]]:
+        """
+        Yields the message type and data message of all data messages in the current
+        FIT file, until the end of its data is reached. Then the crc is checked.
+        """
+        while data.tell() < self.end:
+            if (record := self.read_record(data)) is not None:
+                yield record
+
+        self.read_crc(data)
+
+    def build_fitfile(
+        self,
+        data_messages: dict[str, list[DataMessage]],
+        message_columns: Optional[dict[str, MessageColumns]] = None,
+        sequence_numbers: Optional[dict[str, array]] = None,
+    ) -> FitFile:
+        """
+        Creates a FitFile of the current decoder state with provided data messages, or
+        with the provided message columns when decoded with the columnar layout. The
+        sequence numbers are the positions of the data messages in the FIT file.
+        """
+        if self.header is None:
+            raise ValueError("no header was read, can not create a FitFile")
+
+        return FitFile(
+            header=self.header,
+            data_messages=data_messages,
+            local_message_definitions=self.local_message_definitions,
+            developer_data=self.developer_data,
+            message_columns=message_columns,
+            sequence_numbers=sequence_numbers,
+        )
@@ -1,9 +1,12 @@
 from __future__ import annotations  # Added for type hints
 
+import functools
 import struct
-from typing import TYPE_CHECKING, Optional
+from io import BytesIO
+from typing import TYPE_CHECKING, Any, Optional
 
-from fittie.fitfile.utils.datastream import Streamable
+from fittie.fitfile.decode_plan import DecodePlan, compile_decode_plan
+from fittie.fitfile.utils.datastream import Streamable, read_struct
 from fittie.fitfile.utils.exceptions import DecodeException
 from fittie.fitfile.field_definitions import (
     FieldDefinition,
@@ -16,6 +19,15 @@ from fittie.fitfile.utils.endianness import Endianness
 if TYPE_CHECKING:
     from fittie.fitfile.records import RecordHeader
 
+BYTE_STRUCT = struct.Struct("B")
+GLOBAL_MESSAGE_TYPE_STRUCTS = {
+    Endianness.LITTLE: struct.Struct(f"{Endianness.LITTLE}H"),
+    Endianness.BIG: struct.Struct(f"{Endianness.BIG}H"),
+}
+
+# Maximum number of distinct definitions that are kept in the definition cache
+DEFINITION_CACHE_SIZE = 1024
+
 
 class DefinitionMessage:
     """
@@ -31,8 +43,22 @@ class DefinitionMessage:
     - Architecture: 1 Byte
     - Global message number: 2 bytes
     - Number of fields: 1 byte
+
+    The decode plan for the data messages of this definition is compiled once, either
+    while decoding the definition message or on first use, see `plan`.
     """
 
+    __slots__ = (
+        "header",
+        "endianness",
+        "global_message_type",
+        "number_of_fields",
+        "field_definitions",
+        "number_of_developer_fields",
+        "developer_field_definitions",
+        "_plan",
+    )
+
     header: "RecordHeader"
     endianness: str
     global_message_type: int
@@ -40,6 +66,7 @@ class DefinitionMessage:
     field_definitions: list[FieldDefinition]
     number_of_developer_fields: int
     developer_field_definitions: list[DeveloperFieldDefinition]
+    _plan: Optional[DecodePlan]
 
     def __init__(
         self,
@@ -48,6 +75,7 @@ class DefinitionMessage:
         global_message_type: int,
         field_definitions: list[FieldDefinition],
         developer_field_definitions: Optional[list[DeveloperFieldDefinition]] = None,
+        plan: Optional[DecodePlan] = None,
     ):
         self.header = header
         self.endianness = endianness
@@ -60,6 +88,27 @@ class DefinitionMessage:
 
         self.number_of_developer_fields = len(developer_field_definitions)
         self.developer_field_definitions = developer_field_definitions
+        self._plan = plan
+
+    def __getstate__(self) -> dict:
+        # The decode plan is not pickled, it is compiled again on first use
+        return {name: getattr(self, name) for name in self.__slots__ if name != "_plan"}
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+        self._plan = None
+
+    @property
+    def plan(self) -> DecodePlan:
+        """Returns the compiled decode plan for the data messages of this definition"""
+        if self._plan is None:
+            self._plan = compile_decode_plan(
+                self.global_message_type, self.endianness, self.field_definitions
+            )
+
+        return self._plan
 
     def get_developer_field_definition(
         self, data_index: int, number: int
@@ -84,9 +133,120 @@ class DefinitionMessage:
         return str(self)
 
 
+class CompiledDefinition:
+    """
+    The decoded content of a definition message, without its record header, and the
+    compiled decode plan for its data messages.
+
+    Compiled definitions are shared by all definition messages with the same content,
+    across files, see `compile_definition`. They should not be modified.
+    """
+
+    __slots__ = (
+        "endianness",
+        "global_message_type",
+        "field_definitions",
+        "developer_field_definitions",
+        "plan",
+    )
+
+    endianness: str
+    global_message_type: int
+    field_definitions: tuple[FieldDefinition, ...]
+    developer_field_definitions: tuple[DeveloperFieldDefinition, ...]
+    plan: DecodePlan
+
+    def __init__(
+        self,
+        endianness: str,
+        global_message_type: int,
+        field_definitions: tuple[FieldDefinition, ...],
+        developer_field_definitions: tuple[DeveloperFieldDefinition, ...],
+    ):
+        self.endianness = endianness
+        self.global_message_type = global_message_type
+        self.field_definitions = field_definitions
+        self.developer_field_definitions = developer_field_definitions
+        self.plan = compile_decode_plan(
+            global_message_type, endianness, field_definitions
+        )
+
+    def __str__(self) -> str:
+        return (
+            f"CompiledDefinition:{self.endianness=}{self.global_message_type=}"
+            f"{self.field_definitions=}{self.developer_field_definitions=}"
+        ).replace("self.", " ")
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+@functools.lru_cache(maxsize=DEFINITION_CACHE_SIZE)
+def compile_definition(content: bytes) -> CompiledDefinition:
+    """
+    Decodes and compiles the content of a definition message: the architecture,
+    global message number, number of fields, the field definitions and, if present,
+    the number of developer fields and the developer field definitions.
+
+    The result is cached by content in a process wide LRU cache, a device writes the
+    same definitions in every file. See `definition_cache_info`.
+
+    Raises a DecodeException with the position inside the content for invalid data.
+    """
+    data = BytesIO(content)
+    (architecture,) = read_struct(data, BYTE_STRUCT)
+    endianness = Endianness.BIG if bool(architecture) else Endianness.LITTLE
+    (global_message_type,) = read_struct(data, GLOBAL_MESSAGE_TYPE_STRUCTS[endianness])
+    (number_of_fields,) = read_struct(data, BYTE_STRUCT)
+
+    field_definitions = tuple(
+        decode_field_definition(data) for _ in range(number_of_fields)
+    )
+    developer_field_definitions: tuple[DeveloperFieldDefinition, ...] = ()
+
+    if data.tell() < len(content):
+        (number_of_developer_fields,) = read_struct(data, BYTE_STRUCT)
+        developer_field_definitions = tuple(
+            decode_developer_field_definition(data)
+            for _ in range(number_of_developer_fields)
+        )
+
+    return CompiledDefinition(
+        endianness, global_message_type, field_definitions, developer_field_definitions
+    )
+
+
+def definition_cache_info() -> Any:
+    """
+    Returns the hits, misses, maximum size and current size of the definition cache,
+    see `compile_definition`.
+    """
+    return compile_definition.cache_info()
+
+
+def clear_definition_cache() -> None:
+    """Clears the definition cache and its statistics"""
+    compile_definition.cache_clear()
+
+
+def _read_content(data: Streamable, size: int) -> bytes:
+    """Reads part of the content of a definition message"""
+    if len(content := data.read(size)) != size:
+        raise DecodeException(
+            detail="could not decode definition message with provided data",
+            position=data.tell(),
+        )
+
+    return content
+
+
 def decode_definition_message(
     header: "RecordHeader", data: Streamable
 ) -> DefinitionMessage:
+    """
+    Decodes a definition message, the content of the definition message is compiled
+    once per process and shared, see `compile_definition`.
+    """
     if not header.is_definition_message:
         raise DecodeException(
             detail="tried to decode definition message with a non-definition message "
@@ -95,44 +255,38 @@ def decode_definition_message(
         )
 
     try:
-        (reserved,) = struct.unpack("B", data.read(1))
-
-        if bool(reserved):
-            raise DecodeException(
-                detail="received invalid data for a definition message",
-                position=data.tell(),
-            )
-
-        (architecture,) = struct.unpack("B", data.read(1))
-        endianness = Endianness.BIG if bool(architecture) else Endianness.LITTLE
-        (global_message_type,) = struct.unpack(f"{endianness}H", data.read(2))
-        (number_of_fields,) = struct.unpack("B", data.read(1))
-
-        field_definitions: list[FieldDefinition] = []
-        developer_field_definitions: Optional[list[DeveloperFieldDefinition]] = None
-
-        for field in range(number_of_fields):
-            field_definitions.append(decode_field_definition(data))
-
-        if header.is_developer_data:
-            developer_field_definitions = []
-            (number_of_developer_fields,) = struct.unpack("B", data.read(1))
-
-            for field in range(number_of_developer_fields):
-                developer_field_definitions.append(
-                    decode_developer_field_definition(data)
-                )
-
-        return DefinitionMessage(
-            header=header,
-            endianness=endianness,
-            global_message_type=global_message_type,
-            field_definitions=field_definitions,
-            developer_field_definitions=developer_field_definitions,
-        )
-
+        (reserved,) = read_struct(data, BYTE_STRUCT)
     except struct.error as exc:
         raise DecodeException(
             detail="could not decode definition message with provided data",
             position=data.tell(),
         ) from exc
+
+    if bool(reserved):
+        raise DecodeException(
+            detail="received invalid data for a definition message",
+            position=data.tell(),
+        )
+
+    # Architecture, global message number and number of fields
+    content = _read_content(data, 4)
+    content += _read_content(data, 3 * content[3])
+
+    if header.is_developer_data:
+        number_of_developer_fields = _read_content(data, 1)
+        content += number_of_developer_fields
+        content += _read_content(data, 3 * number_of_developer_fields[0])
+
+    try:
+        compiled = compile_definition(content)
+    except DecodeException as exc:
+        raise DecodeException(detail=exc.detail, position=data.tell()) from None
+
+    return DefinitionMessage(
+        header=header,
+        endianness=compiled.endianness,
+        global_message_type=compiled.global_message_type,
+        field_definitions=list(compiled.field_definitions),
+        developer_field_definitions=list(compiled.developer_field_definitions),
+        plan=compiled.plan,
+    )
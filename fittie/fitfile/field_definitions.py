@@ -3,7 +3,7 @@ from __future__ import annotations  # Added for type hints
 import struct
 from typing import Any, cast, TypeVar
 
-from fittie.fitfile.utils.datastream import Streamable
+from fittie.fitfile.utils.datastream import Streamable, read_struct
 from fittie.fitfile.utils.exceptions import DecodeException
 from fittie.fitfile.field_description import FieldDescription
 from fittie.profile.base_types import BaseType, BASE_TYPES
@@ -11,6 +11,8 @@ from fittie.profile.base_types import BaseType, BASE_TYPES
 
 T = TypeVar("T")
 
+FIELD_DEFINITION_STRUCT = struct.Struct("3B")
+
 
 class DeveloperFieldDefinition:
     """
@@ -22,6 +24,8 @@ class DeveloperFieldDefinition:
     Byte 2 Developer Data Index
     """
 
+    __slots__ = ("number", "size", "data_index")
+
     number: int
     size: int
     data_index: int
@@ -49,6 +53,8 @@ class FieldDefinition:
     Byte 2 Base Type
     """
 
+    __slots__ = ("number", "size", "base_type")
+
     number: int
     size: int
     base_type: BaseType
@@ -72,7 +78,7 @@ def decode_developer_field_definition(data: Streamable) -> DeveloperFieldDefinit
     Decode data into a DeveloperFieldDefinition
     """
     try:
-        number, size, data_index = struct.unpack("3B", data.read(3))
+        number, size, data_index = read_struct(data, FIELD_DEFINITION_STRUCT)
     except struct.error as exc:
         raise DecodeException(
             detail="could not decode developer field definition with provided data",
@@ -95,7 +101,7 @@ def decode_field_definition(data: Streamable) -> FieldDefinition:
     raised
     """
     try:
-        number, size, base_type_number = struct.unpack("3B", data.read(3))
+        number, size, base_type_number = read_struct(data, FIELD_DEFINITION_STRUCT)
     except struct.error as exc:
         raise DecodeException(
             detail="could not decode field definition with provided data",
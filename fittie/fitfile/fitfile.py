@@ -1,72 +1,171 @@
 from __future__ import annotations  # Added for type hints
 
 import functools
+import heapq
 import itertools
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional, Iterable, cast, TypedDict
+from array import array
+from operator import itemgetter
+from typing import Any, Callable, Iterator, Mapping, Optional, Iterable, cast
 
 from fittie.profile.messages import MESSAGES
+from fittie.fitfile.columns import MessageColumns
 from fittie.fitfile.data_message import DataMessage
+from fittie.fitfile.decode_plan import get_field_names
 from fittie.fitfile.definition_message import DefinitionMessage
 from fittie.fitfile.header import Header
+from fittie.fitfile.records import RecordHeader
 from fittie.profile.fit_types import FIT_TYPES
 from fittie.profile.mesg_nums import MESG_NUMS
 from fittie.fitfile.util import datetime_from_timestamp
 
 
+class MessageCursor:
+    """
+    An independent position in the iteration over data messages, returns the fields
+    of every data message as a dict. When fields are provided, only these fields are
+    returned.
+
+    Every iteration creates a new cursor, so nested or concurrent iterations over the
+    same FitFile do not share any state.
+    """
+
+    __slots__ = ("_messages", "_fields")
+
+    _messages: Iterator[DataMessage]
+    _fields: list[str]
+
+    def __init__(
+        self, messages: Iterable[DataMessage], fields: Optional[list[str]] = None
+    ):
+        self._messages = iter(messages)
+        self._fields = fields or []
+
+    def __iter__(self) -> "MessageCursor":
+        return self
+
+    def __next__(self) -> dict:
+        value = next(self._messages)
+
+        if fields := self._fields:
+            return {field: value.fields.get(field) for field in fields}
+
+        return dict(value.fields)
+
+    def __str__(self) -> str:
+        return f"MessageCursor:{self._fields=}".replace("self.", " ")
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
 class _IterableMixin(ABC):
     @property
     @abstractmethod
     def _iter_collection(self):
         """
-        Defines which collection of data the __next__ method should use.
+        Defines which collection of data messages is iterated, e.g. a list or a
+        generator. Every iteration gets a new cursor on this collection, see
+        `MessageCursor`.
 
         Make sure to decorate this with @cached_property if it is an expensive
-        calculation.
+        calculation, and returns a collection that can be iterated more than once.
 
         Also make sure to add __dict__ to  __slots__ if slots are used and the
         property is cached, because  __dict__ has to be mutable.
         """
         ...
 
-    def __next__(self) -> dict:
-        if self._iter_index >= len(self._iter_collection):
-            # Remove _iter_collection value from cache, if it exists.
-            # If _iter_collection is cached, then it should exist and be cleared
-            # as soon as the collection has been fully iterated.
-            if "_iter_collection" in self.__dict__:
-                del self.__dict__["_iter_collection"]
+    def __iter__(self) -> MessageCursor:
+        return MessageCursor(self._iter_collection)
 
-            # Remove _iter_file from dict, because it is only used in iterations
-            if "_iter_filter" in self.__dict__:
-                del self.__dict__["_iter_filter"]
 
-            raise StopIteration
+class MessageFilter(_IterableMixin):
+    """The data messages of a single message type, see `FitFile.__call__`"""
 
-        value = self._iter_collection[self._iter_index]
-        self._iter_index += 1
+    __slots__ = ("messages", "fields")
 
-        if hasattr(self, "_iter_filter") and (fields := self._iter_filter["fields"]):
-            return {field: value.fields.get(field) for field in fields}
+    messages: list[DataMessage]
+    fields: list[str]
 
-        return value.fields
+    def __init__(self, messages: list[DataMessage], fields: Optional[list[str]] = None):
+        self.messages = messages
+        self.fields = fields or []
 
-    def __iter__(self):
-        self._iter_index = 0
-        return self
+    @property
+    def _iter_collection(self) -> list[DataMessage]:
+        return self.messages
 
+    def __iter__(self) -> MessageCursor:
+        return MessageCursor(self.messages, self.fields)
 
-class IterFilter(TypedDict):
-    fields: list[str]
-    message_type: str
+    def __str__(self) -> str:
+        return f"MessageFilter:{self.fields=}".replace("self.", " ")
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+PackedMessages = tuple[list[tuple], list[tuple[str, ...]], list[tuple]]
+
+ORDERS = ("file", "timestamp", "type")
+
+
+def _pack_messages(messages: list[DataMessage]) -> PackedMessages:
+    """
+    Packs data messages into a compact format for pickling.
+
+    Record headers and field names are shared by many messages, these are stored
+    once. Every message is stored as a tuple of the index of its record header, the
+    index of its field names and its field values.
+    """
+    headers: dict[tuple, int] = {}
+    names: dict[tuple[str, ...], int] = {}
+    rows = []
+
+    for message in messages:
+        header = message.header
+        fields = message.fields
+        header_index = headers.setdefault(
+            (
+                header.is_definition_message,
+                header.is_developer_data,
+                header.local_message_type,
+                header.is_compressed_timestamp_message,
+                header.time_offset,
+            ),
+            len(headers),
+        )
+        names_index = names.setdefault(tuple(fields), len(names))
+        rows.append((header_index, names_index, *fields.values()))
+
+    return list(headers), list(names), rows
+
+
+def _unpack_messages(
+    headers: list[tuple], names: list[tuple[str, ...]], rows: list[tuple]
+) -> list[DataMessage]:
+    """Unpacks data messages that are packed with `_pack_messages`"""
+    record_headers = [RecordHeader(*header) for header in headers]
+    field_names = [get_field_names(message_names) for message_names in names]
+
+    return [
+        DataMessage.from_values(record_headers[row[0]], field_names[row[1]], row[2:])
+        for row in rows
+    ]
 
 
 class FitFile(_IterableMixin):
     header: Header
     data_messages: dict[str, list[DataMessage]]
-    local_message_definitions: dict[int, DefinitionMessage] = {}
-    developer_data: dict[int, dict[str, Any]] = {}  # TODO: add typing
+    local_message_definitions: dict[int, DefinitionMessage]
+    developer_data: dict[int, dict[str, Any]]  # TODO: add typing
+    # Messages decoded with the columnar layout, by message type
+    message_columns: dict[str, MessageColumns]
+    # Position of the data messages in the FIT file, by message type, see
+    # `iter_messages`
+    sequence_numbers: dict[str, array]
 
     def __init__(
         self,
@@ -74,36 +173,142 @@ class FitFile(_IterableMixin):
         data_messages: dict[str, list[DataMessage]],
         local_message_definitions: dict[int, DefinitionMessage],
         developer_data: dict[int, dict[str, Any]],
+        message_columns: Optional[dict[str, MessageColumns]] = None,
+        sequence_numbers: Optional[dict[str, array]] = None,
     ):
         self.header = header
         self.data_messages = data_messages
         self.local_message_definitions = local_message_definitions
         self.developer_data = developer_data
+        self.message_columns = message_columns or {}
+        self.sequence_numbers = sequence_numbers or {}
 
-    @functools.cached_property
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Returns the state of the FitFile for pickling. Data messages are packed into a
+        compact format, see `_pack_messages`, cached values are left out.
+        """
+        return {
+            "header": self.header,
+            "data_messages": {
+                message_type: _pack_messages(messages)
+                for message_type, messages in self.data_messages.items()
+            },
+            "local_message_definitions": self.local_message_definitions,
+            "developer_data": self.developer_data,
+            "message_columns": self.message_columns,
+            "sequence_numbers": self.sequence_numbers,
+        }
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__dict__.setdefault("sequence_numbers", {})
+        self.data_messages = {
+            message_type: _unpack_messages(*packed_messages)
+            for message_type, packed_messages in state["data_messages"].items()
+        }
+
+    @property
     def _iter_collection(self) -> Iterable[DataMessage]:
-        if hasattr(self, "_iter_filter"):
-            # Entered through __call__, filter messages
-            message_type = self._iter_filter["message_type"]
-            return self.data_messages.get(message_type, [])
+        return (message for _, message in self.iter_messages())
 
-        return list(itertools.chain(*self.data_messages.values()))
+    def iter_messages(
+        self,
+        order: str = "file",
+        message_types: Optional[Iterable[str]] = None,
+    ) -> Iterator[tuple[str, DataMessage]]:
+        """
+        Yields the message type and data message of the data messages, without
+        copying them into a new list.
+
+        Args:
+            order: 'file' for the order of the FIT file, 'timestamp' to merge the
+                message types by timestamp, or 'type' to group the messages by message
+                type
+            message_types: only yield data messages of these message types
+
+        In timestamp order, a message without a timestamp gets the timestamp of the
+        previous message of its message type. Messages with the same timestamp are
+        yielded in file order. When the positions of the data messages in the FIT
+        file are unknown, e.g. for a FitFile that is created without them, the 'file'
+        and 'timestamp' orders use the order of the messages within their message type.
+        """
+        if order not in ORDERS:
+            raise ValueError(f"unsupported order '{order}' received")
+
+        message_types = (
+            list(self.data_messages)
+            if message_types is None
+            else [
+                message_type
+                for message_type in message_types
+                if message_type in self.data_messages
+            ]
+        )
+
+        if order == "type":
+            for message_type in message_types:
+                for message in self.data_messages[message_type]:
+                    yield message_type, message
+            return
+
+        streams: list[Iterator[tuple]]
+        key: Callable[[tuple], Any]
+
+        if order == "file":
+            streams = [
+                zip(
+                    self._sequence(message_type),
+                    itertools.repeat(message_type),
+                    self.data_messages[message_type],
+                )
+                for message_type in message_types
+            ]
+            key = itemgetter(0)
+        else:
+            streams = [
+                self._timestamped(message_type) for message_type in message_types
+            ]
+            key = itemgetter(0, 1)
+
+        for *_, message_type, message in heapq.merge(*streams, key=key):
+            yield message_type, message
+
+    def _sequence(self, message_type: str) -> Iterable[int]:
+        """
+        Returns the position of every data message of the message type in the FIT
+        file, or the position within the message type if it is unknown
+        """
+        if (sequence := self.sequence_numbers.get(message_type)) is not None:
+            return sequence
+
+        return range(len(self.data_messages[message_type]))
 
-    def __call__(self, *, message_type: str, fields: list[str] | None = None):
+    def _timestamped(
+        self, message_type: str
+    ) -> Iterator[tuple[int, int, str, DataMessage]]:
         """
-        Makes the instance callable and adds filter options for a specific message
-        type and keywords of field values to return while iterating
+        Yields the timestamp, position, message type and data message of every data
+        message of the message type, see `iter_messages`
         """
+        timestamp = 0
 
-        if fields is None:
-            fields = []
+        for sequence, message in zip(
+            self._sequence(message_type), self.data_messages[message_type]
+        ):
+            if (value := message.fields.get("timestamp")) is not None:
+                timestamp = value
 
-        self._iter_filter: IterFilter = {
-            "fields": fields,
-            "message_type": message_type,
-        }
+            yield timestamp, sequence, message_type, message
 
-        return self
+    def __call__(
+        self, *, message_type: str, fields: list[str] | None = None
+    ) -> MessageFilter:
+        """
+        Returns the data messages of a specific message type, to iterate over the
+        values of the provided fields. The FitFile itself is not changed.
+        """
+        return MessageFilter(self.data_messages.get(message_type, []), fields)
 
     @property
     def file_id(self) -> Optional[dict[str, Any]]:
@@ -113,15 +318,21 @@ class FitFile(_IterableMixin):
         Raw values from the FIT file will be filled with information from the Garmin
         FIT SDK Fit Types
         """
-        if not (file_id_messages := self.data_messages.get("file_id")):
+        fields: Mapping[str, Any]
+
+        if file_id_messages := self.data_messages.get("file_id"):
+            # Should be just one file_id, but to be sure use latest from list
+            fields = file_id_messages[-1].fields
+        elif file_id_columns := self.message_columns.get("file_id"):
+            fields = file_id_columns.row(-1)
+        else:
             raise ValueError(
                 "no file_id message detected, FIT file is possible incorrect"
             )
 
         file_id: dict[str, Any] = {}
 
-        # Should be just one file_id, but to be sure use latest from list
-        for key, value in file_id_messages[-1].fields.items():
+        for key, value in fields.items():
             if not value:
                 continue
             if key == "time_created":
@@ -150,7 +361,7 @@ class FitFile(_IterableMixin):
     @property
     def available_message_types(self) -> list[str]:
         """Returns a list of all message types that this FIT file contains"""
-        return list(self.data_messages.keys())
+        return list(dict.fromkeys([*self.data_messages, *self.message_columns]))
 
     @functools.cached_property
     def available_fields(self) -> dict[str, str | None]:
@@ -184,3 +395,22 @@ class FitFile(_IterableMixin):
             raise ValueError(f"unknown message type '{message_type}' received")
 
         return self.data_messages.get(message_type, [])
+
+    def columns(self, message_type: str) -> MessageColumns:
+        """
+        Returns the messages of the provided type as columns, one column per field.
+
+        When the FIT file is decoded with the columnar layout, the decoded columns are
+        returned. Otherwise the columns are created from the data messages.
+
+        If the provided message type is unknown, a ValueError will be raised.
+        """
+        if (message_columns := self.message_columns.get(message_type)) is not None:
+            return message_columns
+
+        message_columns = MessageColumns(message_type)
+
+        for message in self.get_messages_by_type(message_type):
+            message_columns.append(message.fields)
+
+        return message_columns
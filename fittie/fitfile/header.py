@@ -17,6 +17,15 @@ class Header:
     Computing the CRC is optional and 0x0000 is a permissible CRC value
     """
 
+    __slots__ = (
+        "length",
+        "protocol_version",
+        "profile_version",
+        "data_size",
+        "data_type",
+        "crc",
+    )
+
     fmt: str = "BBHI4s"
     length: int
     protocol_version: int
@@ -51,11 +60,13 @@ class Header:
             self.data_type.encode("utf-8"),
         )
 
+        fmt = self.fmt
+
         if self.length == 14:
-            self.fmt += "H"  # add additional 2 bytes for CRC
+            fmt += "H"  # add additional 2 bytes for CRC
             values += (self.crc,)  # type: ignore[assignment]
 
-        return struct.pack(self.fmt, *values)
+        return struct.pack(fmt, *values)
 
     def __str__(self) -> str:
         return (
@@ -0,0 +1,599 @@
+from __future__ import annotations  # Added for type hints
+
+import bisect
+import functools
+import struct
+import sys
+from array import array
+from collections import defaultdict
+from pathlib import Path
+from typing import DefaultDict, Iterable, Iterator, Optional, Union, cast
+
+from fittie.fitfile.data_message import DataMessage
+from fittie.fitfile.decode_plan import FieldPlan
+from fittie.fitfile.decoder import (
+    CRC_STRUCT,
+    DEVELOPER_DATA_MESSAGE_TYPES,
+    Decoder,
+)
+from fittie.fitfile.definition_message import (
+    DefinitionMessage,
+    decode_definition_message,
+)
+from fittie.fitfile.fitfile import FitFile
+from fittie.fitfile.records import read_record_header
+from fittie.fitfile.utils.datastream import DataStream, Source
+from fittie.fitfile.utils.exceptions import DecodeException
+
+# Timestamp of indexed data messages without a timestamp, the invalid uint32 value
+NO_TIMESTAMP = 0xFFFFFFFF
+
+INDEX_MAGIC = b"FITIDX"
+INDEX_VERSION = 1
+# Magic, version and number of fit files
+INDEX_HEADER_STRUCT = struct.Struct("<6sHI")
+# Start, end, crc, number of definition messages and number of data messages
+FITFILE_INDEX_STRUCT = struct.Struct("<QQHII")
+
+# Definition flags, the plan of the definition accumulates components, or has fields
+# that set accumulated values
+ACCUMULATES = 0b01
+SETS_ACCUMULATED = 0b10
+
+# Arrays of a FitFileIndex with their type codes, in the order they are saved
+DEFINITION_ARRAYS = (("definition_offsets", "Q"), ("definition_flags", "B"))
+MESSAGE_ARRAYS = (
+    ("offsets", "Q"),
+    ("message_numbers", "H"),
+    ("local_types", "B"),
+    ("timestamps", "I"),
+    ("definitions", "I"),
+)
+
+
+class FitFileIndex:
+    """
+    The index of a single (chained) FIT file: the byte offset of every definition
+    message, and the byte offset, global message number, local message type,
+    timestamp and definition of every data message.
+
+    The values are stored in arrays, a data message takes 19 bytes of the index. The
+    timestamp of a data message without a timestamp is NO_TIMESTAMP, data messages
+    with a compressed timestamp header have their full timestamp.
+    """
+
+    __slots__ = (
+        "start",
+        "end",
+        "crc",
+        "definition_offsets",
+        "definition_flags",
+        "offsets",
+        "message_numbers",
+        "local_types",
+        "timestamps",
+        "definitions",
+        "_replayed",
+        "_by_timestamp",
+    )
+
+    start: int
+    end: int
+    crc: int
+    definition_offsets: array
+    definition_flags: array
+    offsets: array
+    message_numbers: array
+    local_types: array
+    timestamps: array
+    # Index of the definition message of every data message
+    definitions: array
+    # Data messages that are decoded before the selected data messages, see `replayed`
+    _replayed: Optional[list[int]]
+    # Positions of the data messages sorted by timestamp and their timestamps, by
+    # global message number, see `select`
+    _by_timestamp: Optional[dict[int, tuple[array, array]]]
+
+    def __init__(self, start: int, end: int = 0, crc: int = 0):
+        self.start = start
+        self.end = end
+        self.crc = crc
+
+        for name, typecode in DEFINITION_ARRAYS + MESSAGE_ARRAYS:
+            setattr(self, name, array(typecode))
+
+        self._replayed = None
+        self._by_timestamp = None
+
+    def __len__(self) -> int:
+        return len(self.offsets)
+
+    @property
+    def first_timestamp(self) -> Optional[int]:
+        """Returns the first timestamp of the FIT file, None if there is none"""
+        for timestamp in self.timestamps:
+            if timestamp != NO_TIMESTAMP:
+                return timestamp
+
+        return None
+
+    @property
+    def last_timestamp(self) -> Optional[int]:
+        """Returns the last timestamp of the FIT file, None if there is none"""
+        for timestamp in reversed(self.timestamps):
+            if timestamp != NO_TIMESTAMP:
+                return timestamp
+
+        return None
+
+    def select(
+        self,
+        message_numbers: Optional[frozenset[int]] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+    ) -> list[int]:
+        """
+        Returns the positions of the data messages of the provided global message
+        numbers, with a timestamp from start (inclusive) until end (exclusive). Data
+        messages without a timestamp are left out when start or end is provided.
+        """
+        if message_numbers is None and start is None and end is None:
+            return list(range(len(self)))
+
+        by_timestamp = self.sorted_by_timestamp()
+        selected: list[int] = []
+        by_time = start is not None or end is not None
+        # Data messages without a timestamp are sorted last, their timestamp is
+        # NO_TIMESTAMP
+        lower = 0 if start is None else start
+        upper = NO_TIMESTAMP if end is None else min(end, NO_TIMESTAMP)
+
+        for number in by_timestamp if message_numbers is None else message_numbers:
+            if (sorted_positions := by_timestamp.get(number)) is None:
+                continue
+
+            positions, timestamps = sorted_positions
+
+            if by_time:
+                first = bisect.bisect_left(timestamps, lower)
+                positions = positions[first : bisect.bisect_left(timestamps, upper)]
+
+            selected.extend(positions)
+
+        selected.sort()
+
+        return selected
+
+    def sorted_by_timestamp(self) -> dict[int, tuple[array, array]]:
+        """
+        Returns the positions of the data messages sorted by timestamp, and their
+        timestamps, by global message number. Data messages with the same timestamp
+        are in file order.
+        """
+        if self._by_timestamp is not None:
+            return self._by_timestamp
+
+        timestamps = self.timestamps
+        positions: DefaultDict[int, list[int]] = defaultdict(list)
+
+        for position, number in enumerate(self.message_numbers):
+            positions[number].append(position)
+
+        self._by_timestamp = {}
+
+        for number, numbered in positions.items():
+            numbered.sort(key=timestamps.__getitem__)
+            self._by_timestamp[number] = (
+                array("I", numbered),
+                array("I", [timestamps[position] for position in numbered]),
+            )
+
+        return self._by_timestamp
+
+    def replayed(self) -> list[int]:
+        """
+        Returns the positions of the data messages that the decoding of other data
+        messages depends on: developer data messages and, when the FIT file has
+        accumulated components, the data messages that accumulate or set accumulated
+        values.
+        """
+        if self._replayed is not None:
+            return self._replayed
+
+        flags = self.definition_flags
+        # Fields that set accumulated values only matter when a component accumulates
+        mask = (
+            SETS_ACCUMULATED | ACCUMULATES
+            if any(flag & ACCUMULATES for flag in flags)
+            else 0
+        )
+        definitions = self.definitions
+
+        self._replayed = [
+            position
+            for position, number in enumerate(self.message_numbers)
+            if number in DEVELOPER_DATA_MESSAGE_TYPES
+            or flags[definitions[position]] & mask
+        ]
+
+        return self._replayed
+
+    def append_definition(self, offset: int, flags: int) -> int:
+        """Adds a definition message, returns the index of the definition message"""
+        self.definition_offsets.append(offset)
+        self.definition_flags.append(flags)
+
+        return len(self.definition_offsets) - 1
+
+    def append_message(
+        self,
+        offset: int,
+        message_number: int,
+        local_type: int,
+        timestamp: Optional[int],
+        definition: int,
+    ) -> None:
+        """Adds a data message with the index of its definition message"""
+        self.offsets.append(offset)
+        self.message_numbers.append(message_number)
+        self.local_types.append(local_type)
+        self.timestamps.append(NO_TIMESTAMP if timestamp is None else timestamp)
+        self.definitions.append(definition)
+
+    def __str__(self) -> str:
+        return f"FitFileIndex:{self.start=}{self.end=}{self.crc=}".replace("self.", " ")
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class FitIndex:
+    """
+    A random access index of a FIT file, with a FitFileIndex per (chained) FIT file.
+    See `build_index`.
+
+    With the index, only the selected data messages of the FIT file are decoded, e.g.
+    the records of a time range. The definition messages of the selected data messages
+    are replayed from their indexed position, the CRC is not calculated.
+    """
+
+    __slots__ = ("fitfiles",)
+
+    fitfiles: list[FitFileIndex]
+
+    def __init__(self, fitfiles: list[FitFileIndex]):
+        self.fitfiles = fitfiles
+
+    def __len__(self) -> int:
+        return len(self.fitfiles)
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Saves the index to the provided path, e.g. next to the FIT file"""
+        with open(path, "wb") as file:
+            file.write(INDEX_HEADER_STRUCT.pack(INDEX_MAGIC, INDEX_VERSION, len(self)))
+
+            for fitfile in self.fitfiles:
+                file.write(
+                    FITFILE_INDEX_STRUCT.pack(
+                        fitfile.start,
+                        fitfile.end,
+                        fitfile.crc,
+                        len(fitfile.definition_offsets),
+                        len(fitfile),
+                    )
+                )
+
+                for name, _ in DEFINITION_ARRAYS + MESSAGE_ARRAYS:
+                    values = getattr(fitfile, name)
+
+                    if sys.byteorder == "big":
+                        values = array(values.typecode, values)
+                        values.byteswap()
+
+                    file.write(values.tobytes())
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "FitIndex":
+        """
+        Loads an index that is saved with `save`. Raises a ValueError if the file is
+        not a FIT index, or has an unsupported version.
+        """
+        with open(path, "rb") as file:
+            content = memoryview(file.read())
+
+        if len(content) < INDEX_HEADER_STRUCT.size:
+            raise ValueError(f"{path} is not a fit index")
+
+        magic, version, count = INDEX_HEADER_STRUCT.unpack_from(content)
+
+        if magic != INDEX_MAGIC:
+            raise ValueError(f"{path} is not a fit index")
+
+        if version != INDEX_VERSION:
+            raise ValueError(f"unsupported fit index version {version} received")
+
+        position = INDEX_HEADER_STRUCT.size
+        fitfiles = []
+
+        for _ in range(count):
+            (
+                start,
+                end,
+                crc,
+                definition_count,
+                message_count,
+            ) = FITFILE_INDEX_STRUCT.unpack_from(content, position)
+            position += FITFILE_INDEX_STRUCT.size
+            fitfile = FitFileIndex(start, end, crc)
+
+            for arrays, size in (
+                (DEFINITION_ARRAYS, definition_count),
+                (MESSAGE_ARRAYS, message_count),
+            ):
+                for name, _ in arrays:
+                    values = getattr(fitfile, name)
+                    end = position + size * values.itemsize
+                    values.frombytes(content[position:end])
+                    position = end
+
+                    if sys.byteorder == "big":
+                        values.byteswap()
+
+            fitfiles.append(fitfile)
+
+        return cls(fitfiles)
+
+    def iter_messages(
+        self,
+        source: Source,
+        include: Optional[Iterable[str]] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        fields: Optional[dict[str, Iterable[str]]] = None,
+        lazy: bool = False,
+    ) -> Iterator[tuple[int, str, DataMessage]]:
+        """
+        Decodes the selected data messages of the indexed FIT file, in file order.
+
+        Args:
+            source: the indexed fit file, a file name, bytes or a seekable file
+            include: only decode data messages of these message types
+            start: only decode data messages with a timestamp from start
+            end: only decode data messages with a timestamp before end
+            fields: only decode these fields, by message type
+            lazy: decode the fields of data messages on first access, see
+                `LazyDataMessage`
+
+        Yields:
+            tuple[int, str, DataMessage]: the index of the (chained) fit file, the
+            message type and the data message
+        """
+        with DataStream(source) as data:
+            for fitfile_index, fitfile in enumerate(self.fitfiles):
+                decoder = Decoder(
+                    calculate_crc=False, include=include, fields=fields, lazy=lazy
+                )
+
+                for message_type, message in _decode_messages(
+                    fitfile, decoder, data, start, end
+                ):
+                    yield fitfile_index, message_type, message
+
+    def decode(
+        self,
+        source: Source,
+        include: Optional[Iterable[str]] = None,
+        start: Optional[int] = None,
+        end: Optional[int] = None,
+        fields: Optional[dict[str, Iterable[str]]] = None,
+        lazy: bool = False,
+    ) -> list[FitFile]:
+        """
+        Decodes the selected data messages of the indexed FIT file into a FitFile per
+        (chained) FIT file, see `iter_messages` for the arguments.
+
+        The local message definitions of a FitFile only contain the definitions that
+        are replayed for the selected data messages.
+        """
+        fitfiles: list[FitFile] = []
+
+        with DataStream(source) as data:
+            for fitfile in self.fitfiles:
+                decoder = Decoder(
+                    calculate_crc=False, include=include, fields=fields, lazy=lazy
+                )
+                messages: DefaultDict[str, list[DataMessage]] = defaultdict(list)
+                sequence_numbers: DefaultDict[str, array] = defaultdict(
+                    functools.partial(array, "I")
+                )
+
+                for sequence, (message_type, message) in enumerate(
+                    _decode_messages(fitfile, decoder, data, start, end)
+                ):
+                    messages[message_type].append(message)
+                    sequence_numbers[message_type].append(sequence)
+
+                fitfiles.append(
+                    decoder.build_fitfile(messages, sequence_numbers=sequence_numbers)
+                )
+
+        return fitfiles
+
+    def __str__(self) -> str:
+        return f"FitIndex:{self.fitfiles=}".replace("self.", " ")
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+def _decode_messages(
+    fitfile: FitFileIndex,
+    decoder: Decoder,
+    data: DataStream,
+    start: Optional[int],
+    end: Optional[int],
+) -> Iterator[tuple[str, DataMessage]]:
+    """
+    Decodes the data messages of an indexed FIT file that are selected with the
+    message types of the decoder, start and end.
+
+    Replayed data messages (see `FitFileIndex.replayed`) before the last selected data
+    message are decoded too, to keep track of the developer data and accumulated
+    values, but are not yielded.
+    """
+    try:
+        data.seek(fitfile.end - CRC_STRUCT.size)
+        (crc,) = data.unpack(CRC_STRUCT)
+    except EOFError:
+        crc = None
+
+    if crc != fitfile.crc:
+        raise DecodeException(
+            detail="the index does not match the fit file, the crc is different",
+            position=data.tell(),
+        )
+
+    data.seek(fitfile.start)
+    decoder.read_header(data)
+
+    if not (selected := fitfile.select(decoder.include, start, end)):
+        return
+
+    replayed = fitfile.replayed()
+    replayed = replayed[: bisect.bisect_left(replayed, selected[-1])]
+    positions = sorted(set(selected).union(replayed)) if replayed else selected
+    yielded = frozenset(selected) if replayed else None
+
+    definition_offsets = fitfile.definition_offsets
+    definitions = fitfile.definitions
+    local_types = fitfile.local_types
+    timestamps = fitfile.timestamps
+    offsets = fitfile.offsets
+    # Index of the replayed definition message, by local message type
+    replayed_definitions: dict[int, int] = {}
+
+    for position in positions:
+        local_type = local_types[position]
+        definition = definitions[position]
+
+        if replayed_definitions.get(local_type) != definition:
+            data.seek(definition_offsets[definition])
+            decoder.read_record(data)
+            replayed_definitions[local_type] = definition
+
+        if (timestamp := timestamps[position]) != NO_TIMESTAMP:
+            # A compressed timestamp header rolls over to the indexed timestamp, other
+            # data messages replace the timestamp with their own
+            decoder.timestamps.timestamp = timestamp
+
+        data.seek(offsets[position])
+
+        if (record := decoder.read_record(data)) is not None and (
+            yielded is None or position in yielded
+        ):
+            yield record
+
+
+def _index_fitfile(decoder: Decoder, data: DataStream, start: int) -> FitFileIndex:
+    """
+    Indexes the records of the FIT file of which the header was just read. Data
+    messages are skipped, only their timestamp is read.
+    """
+    fitfile = FitFileIndex(start)
+    buffer = data.buffer
+    timestamps = decoder.timestamps
+    # Index, data message size and definition message by local message type
+    current: dict[int, tuple[int, int, DefinitionMessage]] = {}
+
+    while data.tell() < decoder.end:
+        offset = data.tell()
+        record_header = read_record_header(data)
+        local_type = record_header.local_message_type
+
+        if record_header.is_definition_message or record_header.is_developer_data:
+            definition = decode_definition_message(record_header, data)
+            plan = definition.plan
+            current[local_type] = (
+                fitfile.append_definition(
+                    offset,
+                    (ACCUMULATES if plan.accumulates else 0)
+                    | (SETS_ACCUMULATED if plan.accumulated_fields else 0),
+                ),
+                plan.size
+                + sum(field.size for field in definition.developer_field_definitions),
+                definition,
+            )
+            continue
+
+        if (entry := current.get(local_type)) is None:
+            raise DecodeException(
+                detail=f"did not receive local message definition for number "
+                f"{local_type}",
+                position=data.tell(),
+            )
+
+        definition_index, size, definition = entry
+        plan = definition.plan
+        timestamp: Optional[int] = None
+
+        if record_header.is_compressed_timestamp_message:
+            timestamp = timestamps.rollover(cast(int, record_header.time_offset))
+            data.skip(size)
+        elif (timestamp_struct := plan.timestamp_struct) is None:
+            data.skip(size)
+        else:
+            if buffer is not None:
+                data.skip(size)
+                (timestamp,) = timestamp_struct.unpack_from(buffer, offset + 1)
+            else:
+                (timestamp,) = data.unpack(timestamp_struct)
+                data.skip(size - timestamp_struct.size)
+
+            if timestamp == cast(FieldPlan, plan.timestamp_field).invalid_value:
+                timestamp = None
+            else:
+                timestamps.timestamp = timestamp
+
+        fitfile.append_message(
+            offset,
+            definition.global_message_type,
+            local_type,
+            timestamp,
+            definition_index,
+        )
+
+    fitfile.crc = decoder.read_crc(data)
+    fitfile.end = data.tell()
+
+    return fitfile
+
+
+def build_index(source: Source, calculate_crc: bool = True) -> FitIndex:
+    """
+    Builds a random access index of a FIT file, see `FitIndex`.
+
+    Only the headers, definition messages and the timestamps of the data messages are
+    decoded, the fields of data messages are skipped.
+
+    Args:
+        source: a file name, bytes, BytesIO or BufferIO.
+        calculate_crc: whether to calculate the CRC
+
+    Returns:
+        FitIndex: the index of every (chained) fit file
+    """
+    fitfiles: list[FitFileIndex] = []
+
+    with DataStream(source) as data:
+        decoder = Decoder(calculate_crc=calculate_crc)
+
+        while True:
+            start = data.tell()
+
+            try:
+                decoder.read_header(data)
+                fitfiles.append(_index_fitfile(decoder, data, start))
+            except EOFError:
+                break
+
+    return FitIndex(fitfiles)
@@ -0,0 +1,433 @@
+from __future__ import annotations  # Added for type hints
+
+import copy
+from typing import Callable, Iterable, Optional
+
+from fittie.fitfile.checkpoint import Checkpoint
+from fittie.fitfile.crc import crc16, crc16_combine
+from fittie.fitfile.data_message import DataMessage
+from fittie.fitfile.decoder import CRC_STRUCT, Decoder
+from fittie.fitfile.header import Header, decode_header
+from fittie.fitfile.records import RECORD_HEADERS
+from fittie.fitfile.timestamps import TimestampTracker
+from fittie.fitfile.utils.datastream import DataStream, Source
+from fittie.fitfile.utils.exceptions import DecodeException
+
+# Minimum size of a file header, the first byte of the header is its size
+MINIMUM_HEADER_SIZE = 12
+# Size of the record header and the fixed content of a definition message, up to and
+# including the number of fields
+DEFINITION_FIXED_SIZE = 6
+FIELD_DEFINITION_SIZE = 3
+
+# What the parser expects next
+HEADER = 0
+RECORDS = 1
+CRC = 2
+
+
+class FitPushParser:
+    """
+    Decodes a FIT file from chunks of bytes, e.g. a chunked upload or a transfer from
+    a device, without the need for the complete file.
+
+    Every `feed` returns the data messages that are complete with the provided bytes.
+    Only the bytes of the last, incomplete, record are kept until the next chunk. The
+    decoder state (header, definitions, developer data, accumulators and timestamps)
+    and the crc are kept between chunks. Chained FIT files are supported.
+
+    Use `close` after the last chunk, to check that the last FIT file is complete.
+    When provided, `on_fitfile` is called with the decoder when a FIT file is complete,
+    while the decoder state is still the state of that FIT file.
+
+    The state can be saved between chunks with `checkpoint`, to resume decoding later
+    with `from_checkpoint`.
+    """
+
+    __slots__ = (
+        "calculate_crc",
+        "decoder",
+        "on_fitfile",
+        "_buffer",
+        "_offset",
+        "_start",
+        "_header_bytes",
+        "_state",
+        "_remaining",
+        "_crc",
+        "_closed",
+    )
+
+    calculate_crc: bool
+    decoder: Decoder
+    on_fitfile: Optional[Callable[[Decoder], None]]
+    # Bytes that are received, but not decoded yet
+    _buffer: bytearray
+    # Position of the first byte of the buffer in the received bytes
+    _offset: int
+    # Position and bytes of the header of the current FIT file
+    _start: int
+    _header_bytes: bytes
+    _state: int
+    # Number of bytes of records that are left in the current FIT file
+    _remaining: int
+    _crc: int
+    _closed: bool
+
+    def __init__(
+        self,
+        calculate_crc: bool = True,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        fields: Optional[dict[str, Iterable[str]]] = None,
+        lazy: bool = False,
+        on_fitfile: Optional[Callable[[Decoder], None]] = None,
+    ):
+        self.calculate_crc = calculate_crc
+        # The crc is calculated over the chunks by the parser
+        self.decoder = Decoder(
+            calculate_crc=False,
+            include=include,
+            exclude=exclude,
+            fields=fields,
+            lazy=lazy,
+        )
+        self.on_fitfile = on_fitfile
+        self._buffer = bytearray()
+        self._offset = 0
+        self._start = 0
+        self._header_bytes = b""
+        self._state = HEADER
+        self._remaining = 0
+        self._crc = 0
+        self._closed = False
+
+    @property
+    def header(self) -> Optional[Header]:
+        """Returns the header of the current FIT file, None before the first header"""
+        return self.decoder.header
+
+    @property
+    def position(self) -> int:
+        """Returns the number of bytes that are decoded"""
+        return self._offset
+
+    def feed(
+        self, chunk: bytes | bytearray | memoryview
+    ) -> list[tuple[int, str, DataMessage]]:
+        """
+        Adds a chunk of bytes, returns the data messages that are completed by it.
+
+        Returns:
+            list[tuple[int, str, DataMessage]]: the index of the (chained) fit file,
+            the message type and the data message
+        """
+        if self._closed:
+            raise ValueError("can not feed a closed parser")
+
+        self._buffer += chunk
+        messages: list[tuple[int, str, DataMessage]] = []
+        position = 0
+
+        with DataStream(self._buffer) as data:
+            data.should_calculate_crc = False
+
+            try:
+                while (size := self._next_size(position)) is not None:
+                    state = self._state
+                    data.seek(position)
+                    self._read(data, messages)
+
+                    if data.tell() != position + size:
+                        raise DecodeException(
+                            detail="could not decode record with provided data",
+                            position=data.tell(),
+                        )
+
+                    if self.calculate_crc and state == RECORDS:
+                        self._crc = crc16(
+                            self._buffer[position : position + size], self._crc
+                        )
+
+                    position += size
+
+                # Skipped data messages refer to the buffer, which changes
+                self.decoder.read_skipped_timestamp(data)
+            except DecodeException as exc:
+                raise DecodeException(
+                    detail=exc.detail, position=self._offset + (exc.position or 0)
+                ) from None
+
+        del self._buffer[:position]
+        self._offset += position
+
+        return messages
+
+    def _next_size(self, position: int) -> Optional[int]:
+        """
+        Returns the size of the next header, record or crc at position in the buffer,
+        or None when not all of its bytes are received yet.
+        """
+        buffer = self._buffer
+        available = len(buffer) - position
+
+        if self._state == HEADER:
+            if available < 1:
+                return None
+
+            size = max(buffer[position], MINIMUM_HEADER_SIZE)
+        elif self._state == CRC:
+            size = CRC_STRUCT.size
+        elif available < 1:
+            return None
+        elif (record_header := RECORD_HEADERS[buffer[position]]) is None:
+            # Invalid record header, raised while reading the record
+            size = 1
+        elif record_header.is_definition_message:
+            if available < DEFINITION_FIXED_SIZE:
+                return None
+
+            size = DEFINITION_FIXED_SIZE + FIELD_DEFINITION_SIZE * buffer[position + 5]
+
+            if record_header.is_developer_data:
+                if available < size + 1:
+                    return None
+
+                size += 1 + FIELD_DEFINITION_SIZE * buffer[position + size]
+        elif (
+            definition := self.decoder.local_message_definitions.get(
+                record_header.local_message_type
+            )
+        ) is None:
+            # Missing definition, raised while reading the record
+            size = 1
+        else:
+            size = (
+                1
+                + definition.plan.size
+                + sum(field.size for field in definition.developer_field_definitions)
+            )
+
+        return size if size <= available else None
+
+    def _read(
+        self, data: DataStream, messages: list[tuple[int, str, DataMessage]]
+    ) -> None:
+        """Reads the header, record or crc at the current position of data"""
+        start = data.tell()
+        decoder = self.decoder
+
+        if self._state == HEADER:
+            header = decoder.read_header(data)
+            self._start = self._offset + start
+            self._header_bytes = bytes(self._buffer[start : data.tell()])
+            self._remaining = header.data_size
+            self._crc = 0
+            self._state = RECORDS if self._remaining > 0 else CRC
+        elif self._state == CRC:
+            (crc,) = data.unpack(CRC_STRUCT)
+
+            if self.calculate_crc and crc != self._file_crc(self._offset + start):
+                raise DecodeException(
+                    detail=(
+                        "the calculated crc does not match the crc at the end of the "
+                        "file"
+                    ),
+                    position=data.tell(),
+                )
+
+            self._state = HEADER
+
+            if self.on_fitfile is not None:
+                self.on_fitfile(decoder)
+        else:
+            if (record := decoder.read_record(data)) is not None:
+                messages.append((decoder.fitfile_index, *record))
+
+            self._remaining -= data.tell() - start
+
+            if self._remaining <= 0:
+                self._state = CRC
+
+    def checkpoint(self) -> Checkpoint:
+        """
+        Returns a copy of the state after the last complete record. Bytes of an
+        incomplete record are not part of the checkpoint, they are fed again when
+        decoding is resumed.
+        """
+        decoder = self.decoder
+
+        return Checkpoint(
+            position=self._offset,
+            fitfile_index=decoder.fitfile_index,
+            start=self._start,
+            header_bytes=self._header_bytes,
+            header=decoder.header,
+            state=self._state,
+            remaining=self._remaining,
+            crc=self._crc,
+            local_message_definitions=dict(decoder.local_message_definitions),
+            developer_data=copy.deepcopy(decoder.developer_data),
+            accumulators=copy.deepcopy(decoder.accumulators),
+            timestamp=decoder.timestamps.timestamp,
+        )
+
+    @classmethod
+    def from_checkpoint(
+        cls,
+        checkpoint: Checkpoint,
+        calculate_crc: bool = True,
+        include: Optional[Iterable[str]] = None,
+        exclude: Optional[Iterable[str]] = None,
+        fields: Optional[dict[str, Iterable[str]]] = None,
+        lazy: bool = False,
+        on_fitfile: Optional[Callable[[Decoder], None]] = None,
+    ) -> FitPushParser:
+        """
+        Returns a parser that continues after the position of the checkpoint, the next
+        chunk has to start at that position. The checkpoint is not changed.
+        """
+        parser = cls(
+            calculate_crc=calculate_crc,
+            include=include,
+            exclude=exclude,
+            fields=fields,
+            lazy=lazy,
+            on_fitfile=on_fitfile,
+        )
+        parser._offset = checkpoint.position
+        parser._start = checkpoint.start
+        parser._header_bytes = checkpoint.header_bytes
+        parser._state = checkpoint.state
+        parser._remaining = checkpoint.remaining
+        parser._crc = checkpoint.crc
+
+        decoder = parser.decoder
+        decoder.fitfile_index = checkpoint.fitfile_index
+        decoder.header = checkpoint.header
+        decoder.developer_data = copy.deepcopy(checkpoint.developer_data)
+        decoder.accumulators = copy.deepcopy(checkpoint.accumulators)
+        decoder.timestamps = TimestampTracker()
+        decoder.timestamps.timestamp = checkpoint.timestamp
+
+        for (
+            local_message_type,
+            definition,
+        ) in checkpoint.local_message_definitions.items():
+            decoder.add_definition(local_message_type, definition, buffered=True)
+
+        return parser
+
+    def _file_crc(self, position: int) -> int:
+        """
+        Returns the crc of the current FIT file up to position, the crc of the header
+        is combined with the running crc of the records.
+        """
+        return crc16_combine(
+            crc16(self._header_bytes),
+            self._crc,
+            position - self._start - len(self._header_bytes),
+        )
+
+    def _replace_header(self, header_bytes: bytes) -> None:
+        """
+        Replaces the header of the current FIT file, e.g. when its data size is updated
+        while records are appended. The running crc of the records does not change.
+        """
+        if header_bytes[0] != self._header_bytes[0]:
+            raise DecodeException(
+                detail="the size of the header of the fit file changed",
+                position=self._start,
+            )
+
+        with DataStream(header_bytes) as data:
+            data.should_calculate_crc = False
+            header = decode_header(data)
+
+        self.decoder.header = header
+        self._header_bytes = header_bytes
+        self._remaining = header.data_size - (
+            self._offset - self._start - len(header_bytes)
+        )
+        self._state = RECORDS if self._remaining > 0 else CRC
+
+    def close(self) -> None:
+        """
+        Closes the parser after the last chunk. Raises a DecodeException when the last
+        FIT file is not complete.
+        """
+        self._closed = True
+
+        if self._buffer or self._state != HEADER:
+            raise DecodeException(
+                detail="the fit file is not complete",
+                position=self._offset + len(self._buffer),
+            )
+
+    def __str__(self) -> str:
+        return f"FitPushParser:{self.position=}{self.header=}".replace("self.", " ")
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+def decode_appended(
+    source: Source,
+    checkpoint: Optional[Checkpoint] = None,
+    calculate_crc: bool = True,
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    fields: Optional[dict[str, Iterable[str]]] = None,
+    lazy: bool = False,
+) -> tuple[list[tuple[int, str, DataMessage]], Checkpoint]:
+    """
+    Decode the bytes of a fit file that are appended after the checkpoint, e.g. of an
+    activity file that is still being recorded. Without a checkpoint the fit file is
+    decoded from the start.
+
+    The header of the current fit file is read again, so a data size that is updated
+    in the header while records are appended is taken into account. An incomplete
+    record at the end of source is decoded by the next call.
+
+    Args:
+        source: a file name, bytes, or a seekable file
+        checkpoint: the checkpoint of the previous call
+        calculate_crc: whether to calculate the CRC
+        include: only decode data messages of these message types
+        exclude: skip data messages of these message types
+        fields: only decode these fields, by message type
+        lazy: decode the fields of data messages on first access, see
+            `LazyDataMessage`
+
+    Returns:
+        tuple[list[tuple[int, str, DataMessage]], Checkpoint]: the appended data
+        messages, like `iter_messages`, and the checkpoint to continue from
+    """
+    with DataStream(source) as data:
+        data.should_calculate_crc = False
+        parser = (
+            FitPushParser(calculate_crc, include, exclude, fields, lazy)
+            if checkpoint is None
+            else FitPushParser.from_checkpoint(
+                checkpoint, calculate_crc, include, exclude, fields, lazy
+            )
+        )
+
+        try:
+            if checkpoint is not None and checkpoint.state != HEADER:
+                data.seek(checkpoint.start)
+
+                header_bytes = data.read(len(checkpoint.header_bytes))
+
+                if header_bytes != checkpoint.header_bytes:
+                    parser._replace_header(header_bytes)
+
+            data.seek(parser.position)
+            appended = data.read(None)
+        except EOFError:
+            raise DecodeException(
+                detail="the fit file is shorter than the checkpoint",
+                position=parser.position,
+            ) from None
+
+    return parser.feed(appended), parser.checkpoint()
@@ -3,13 +3,16 @@ from __future__ import annotations  # Added for type hints
 import struct
 from typing import Optional, Any
 
-from fittie.fitfile.utils.datastream import Streamable
+from fittie.fitfile.utils.datastream import Streamable, read_struct
 from fittie.fitfile.utils.exceptions import DecodeException
 from fittie.fitfile.data_message import decode_data_message, DataMessage
 from fittie.fitfile.definition_message import (
     DefinitionMessage,
     decode_definition_message,
 )
+from fittie.fitfile.timestamps import TimestampTracker
+
+RECORD_HEADER_STRUCT = struct.Struct("B")
 
 
 class RecordHeader:
@@ -28,8 +31,19 @@ class RecordHeader:
     - Bit 0-4, Value 0-31, Time offset
     - Bit 5-6, Value 0-3: Local Message Type
     - Bit 7, Value 1: Compressed timestamp header
+
+    Record headers are interned, every distinct header byte is decoded once into a
+    shared RecordHeader, see `RECORD_HEADERS`.
     """
 
+    __slots__ = (
+        "is_definition_message",
+        "is_developer_data",
+        "local_message_type",
+        "is_compressed_timestamp_message",
+        "time_offset",
+    )
+
     is_definition_message: bool
     is_developer_data: bool
     local_message_type: int
@@ -57,69 +71,82 @@ class RecordHeader:
         ).replace("self.", " ")
 
 
+def _decode_record_header(value: int) -> Optional[RecordHeader]:
+    """Decodes a record header byte, returns None if the byte is not valid"""
+    # Use a bit mask to get bit 7 to determine if this is a normal (0) or
+    # compressed timestamp header (1)
+    if is_compressed_timestamp_message := bool(value >> 7):
+        is_definition_message = False
+        is_developer_data = False
+
+        # Shift 5 places to the right to get bits 7, 6 and 5
+        # then apply mask 0b011 to get bits 6 and 5
+        local_message_type = (value >> 5) & 0b011
+
+        # Apply mask 0b11111 to get bit 4, 3, 2, 1 and 0
+        time_offset: Optional[int] = value & 0b11111
+    else:
+        # Apply mask 0b1000000 to get bit 6 to determine if the message
+        # is a definition message
+        is_definition_message = bool(value & 0b1000000)
+
+        # Apply mask 0b100000 to determine if message contains developer data
+        is_developer_data = bool(value & 0b100000)
+
+        # Bit 4 is reserved and always 0, extra validity check
+        if bool(value & 0b10000):
+            return None
+
+        # Apply mask 0b1111 to get bit 3, 2, 1, and 0
+        local_message_type = value & 0b1111
+        time_offset = None
+
+    return RecordHeader(
+        is_definition_message=is_definition_message,
+        is_developer_data=is_developer_data,
+        local_message_type=local_message_type,
+        is_compressed_timestamp_message=is_compressed_timestamp_message,
+        time_offset=time_offset,
+    )
+
+
+# Shared record headers by header byte, None for invalid header bytes
+RECORD_HEADERS: tuple[Optional[RecordHeader], ...] = tuple(
+    _decode_record_header(value) for value in range(256)
+)
+
+
 def read_record_header(data: Streamable) -> RecordHeader:
     try:
-        (value,) = struct.unpack("B", data.read(1))
-
-        # Use a bit mask to get bit 7 to determine if this is a normal (0) or
-        # compressed timestamp header (1)
-        if is_compressed_timestamp_message := bool(value >> 7):
-            is_definition_message = False
-            is_developer_data = False
-
-            # Shift 5 places to the right to get bits 7, 6 and 5
-            # then apply mask 0b011 to get bits 6 and 5
-            local_message_type = (value >> 5) & 0b011
-
-            # Apply mask 0b11111 to get bit 4, 3, 2, 1 and 0
-            time_offset = value & 0b111111
-        else:
-            # Apply mask 0b1000000 to get bit 6 to determine if the message
-            # is a definition message
-            is_definition_message = bool(value & 0b1000000)
-
-            # Apply mask 0b100000 to determine if message contains developer data
-            is_developer_data = bool(value & 0b100000)
-
-            # Bit 4 is reserved and always 0, extra validity check
-            if bool(value & 0b10000):
-                raise DecodeException(
-                    detail="invalid byte received for record header",
-                    position=data.tell(),
-                )
-
-            # Apply mask 0b1111 to get bit 3, 2, 1, and 0
-            local_message_type = value & 0b1111
-            time_offset = None
-
-        return RecordHeader(
-            is_definition_message=is_definition_message,
-            is_developer_data=is_developer_data,
-            local_message_type=local_message_type,
-            is_compressed_timestamp_message=is_compressed_timestamp_message,
-            time_offset=time_offset,
-        )
-
+        (value,) = read_struct(data, RECORD_HEADER_STRUCT)
     except struct.error as exc:
         raise DecodeException(
             detail="could not decode record header with provided data",
             position=data.tell(),
         ) from exc
 
+    if (record_header := RECORD_HEADERS[value]) is None:
+        raise DecodeException(
+            detail="invalid byte received for record header",
+            position=data.tell(),
+        )
+
+    return record_header
+
 
 def read_message(
     local_message_definitions: dict[int, DefinitionMessage],
     developer_data: dict[int, dict[str, Any]],
     data: Streamable,
+    timestamps: Optional[TimestampTracker] = None,
 ) -> DefinitionMessage | DataMessage:
+    """
+    Reads a definition message or a data message. A data message with a compressed
+    timestamp header gets a timestamp when timestamps are provided.
+    """
     record_header = read_record_header(data)
     definition_message = local_message_definitions.get(record_header.local_message_type)
 
-    if record_header.is_compressed_timestamp_message:
-        # TODO
-        ...
-        return  # type:ignore[return-value]
-
     if record_header.is_developer_data or record_header.is_definition_message:
         return decode_definition_message(record_header, data)
 
@@ -132,7 +159,7 @@ def read_message(
         )
 
     message = decode_data_message(
-        record_header, definition_message, developer_data, data
+        record_header, definition_message, developer_data, data, timestamps=timestamps
     )
 
     return message
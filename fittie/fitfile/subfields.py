@@ -0,0 +1,101 @@
+from __future__ import annotations  # Added for type hints
+
+from typing import TYPE_CHECKING, Any, Optional, cast
+
+if TYPE_CHECKING:
+    from fittie.profile import FieldProfile, SubField
+
+
+class SubfieldPlan:
+    """The precomputed name, scale and offset of a subfield"""
+
+    __slots__ = ("name", "scale", "offset", "is_scaled", "has_components", "profile")
+
+    name: str
+    scale: float | int | list[int] | None
+    offset: int | None
+    is_scaled: bool
+    has_components: bool
+    profile: SubField
+
+    def __init__(self, profile: SubField):
+        self.name = profile.field_name
+        self.scale = profile.scale
+        self.offset = profile.offset
+        # The scale and offset of a subfield with multiple components apply to the
+        # components, not to the subfield value itself
+        self.is_scaled = not isinstance(profile.components, list) and (
+            profile.scale is not None or profile.offset is not None
+        )
+        self.has_components = profile.has_components
+        self.profile = profile
+
+    def __str__(self) -> str:
+        return f"SubfieldPlan:{self.name=}{self.scale=}{self.offset=}".replace(
+            "self.", " "
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class SubfieldTable:
+    """
+    Precomputed subfield resolution of a field with subfields.
+
+    For every reference field, `references` contains a lookup from the value of the
+    reference field to the subfields that apply. Resolving the subfields of a data
+    message is a single dict lookup per reference field, instead of walking all
+    subfields and their references.
+    """
+
+    __slots__ = ("field_name", "subfields", "references")
+
+    field_name: str
+    subfields: tuple[SubfieldPlan, ...]
+    references: tuple[tuple[str, dict[Any, tuple[SubfieldPlan, ...]]], ...]
+
+    def __init__(self, profile: FieldProfile):
+        self.field_name = profile.field_name
+        self.subfields = tuple(
+            SubfieldPlan(subfield) for subfield in profile.subfields or []
+        )
+        references: dict[str, dict[Any, tuple[SubfieldPlan, ...]]] = {}
+
+        for subfield_plan in self.subfields:
+            for reference in subfield_plan.profile.refs:
+                if reference is None:
+                    continue
+
+                lookup = references.setdefault(cast(str, reference["field_name"]), {})
+                value = reference["value_number"]
+                lookup[value] = lookup.get(value, ()) + (subfield_plan,)
+
+        self.references = tuple(references.items())
+
+    def __str__(self) -> str:
+        return f"SubfieldTable:{self.field_name=}{self.references=}".replace(
+            "self.", " "
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+# Subfield tables by id of the field profile, with the field profile to make sure the
+# id is not reused by another field profile
+_SUBFIELD_TABLES: dict[int, tuple[FieldProfile, SubfieldTable]] = {}
+
+
+def get_subfield_table(profile: Optional[FieldProfile]) -> Optional[SubfieldTable]:
+    """
+    Returns the subfield table of the field profile, or None if the field has no
+    subfields. The table is computed once per field profile.
+    """
+    if profile is None or not profile.has_subfields:
+        return None
+
+    if (entry := _SUBFIELD_TABLES.get(id(profile))) is None or entry[0] is not profile:
+        entry = _SUBFIELD_TABLES[id(profile)] = (profile, SubfieldTable(profile))
+
+    return entry[1]
@@ -0,0 +1,64 @@
+from __future__ import annotations  # Added for type hints
+
+from typing import Optional
+
+# Field number of the timestamp field, the same in every message
+TIMESTAMP_FIELD_NUMBER = 253
+
+
+def rollover_timestamp(previous_timestamp: int, offset: int) -> int:
+    """
+    Apply the compressed timestamp offset to the previous timestamp
+
+    The offset is a 5-bit offset which rolls over every 32 seconds
+    (0b11111 == 31). This means that consecutive compressed timestamps may
+    never be more than 32 seconds apart
+
+    The actual timestamp is calculated by concatenating the most significant 27 bits
+    of the previous timestamp value and the 5 bit value of the offset field
+    """
+    max_length = 0b11111  # 0x0000001F
+
+    if offset >= previous_timestamp & max_length:
+        # Offset value is greater than least significant 5 bits of previous timestamp
+        timestamp = (previous_timestamp & 0xFFFFFFE0) + offset
+    else:
+        # Offset is less than least significant 5 bits of previous timestamp
+        timestamp = (previous_timestamp & 0xFFFFFFE0) + offset + 0x20
+
+    return timestamp
+
+
+class TimestampTracker:
+    """
+    Keeps track of the last full timestamp of a FIT file, the timestamp of a data
+    message with a compressed timestamp header is an offset to this timestamp.
+
+    The timestamp is updated with the timestamp field of every data message that has
+    one, and with every compressed timestamp.
+    """
+
+    __slots__ = ("timestamp",)
+
+    timestamp: Optional[int]
+
+    def __init__(self) -> None:
+        self.timestamp = None
+
+    def rollover(self, offset: int) -> Optional[int]:
+        """
+        Returns the timestamp of a compressed timestamp header with the provided time
+        offset, or None if no full timestamp was received yet.
+        """
+        if self.timestamp is None:
+            return None
+
+        self.timestamp = rollover_timestamp(self.timestamp, offset)
+
+        return self.timestamp
+
+    def __str__(self) -> str:
+        return f"TimestampTracker:{self.timestamp=}".replace("self.", " ")
+
+    def __repr__(self) -> str:
+        return str(self)
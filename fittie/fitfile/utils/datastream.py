@@ -1,8 +1,13 @@
+import mmap
 import os.path
+import struct
 from pathlib import Path
 from typing import Protocol, Optional, BinaryIO, Any, Union
 
-from fittie.fitfile.crc import apply_crc
+from fittie.fitfile.crc import crc16
+
+# Number of read bytes after which pending bytes are added to the crc
+CRC_CHUNK_SIZE = 64 * 1024
 
 
 class Streamable(Protocol):
@@ -13,30 +18,57 @@ class Streamable(Protocol):
     def close(self) -> None: ...
 
 
+# Values that a DataStream can be created with
+Source = Union[str, Path, bytes, bytearray, memoryview, Streamable]
+
+
 class DataStream:
     """
-    A thin wrapper around a BinaryIO
+    A thin wrapper around a BinaryIO or a buffer
 
     It allows a path, file content or a BinaryIO/Streamable to be provided as
     initial value.
 
-    TODO: include CRC check
+    When a path or a bytes-like value (bytes, bytearray, memoryview) is provided, the
+    DataStream is backed by a buffer. A path is memory mapped. Values are then
+    unpacked directly from the buffer at the current position, see `unpack`, without
+    allocating new bytes for every read.
+
+    The crc is calculated lazily: read bytes are added to the crc in bulk, once
+    enough bytes are pending or when the calculated crc is requested.
     """
 
     _data: BinaryIO
     _path: Optional[Union[str, Path]]
+    _buffer: Optional[memoryview]
+    _mmap: Optional[mmap.mmap]
+    _buffered: bool
+    _position: int
     _calculated_crc: int
+    _crc_position: int
+    _pending_crc: list[bytes]
+    _pending_crc_size: int
 
     should_calculate_crc: bool
 
     def __init__(self, value: Any):
         self.should_calculate_crc = True
         self._calculated_crc = 0
+        self._crc_position = 0
+        self._pending_crc = []
+        self._pending_crc_size = 0
+        self._buffer = None
+        self._mmap = None
+        self._buffered = False
+        self._position = 0
 
         if DataStream.is_file(value):
             self._data = value
         elif DataStream.is_path(value):
             self._path = value
+        elif DataStream.is_buffer(value):
+            self._buffer = memoryview(value).cast("B")
+            self._buffered = True
         elif DataStream.is_streamable(value):
             self._data = value
         else:
@@ -44,47 +76,179 @@ class DataStream:
                 f"unsupported value received as stream input: {type(value)}"
             )
 
+    @property
+    def is_buffered(self) -> bool:
+        """Returns whether the DataStream is backed by a buffer"""
+        return self._buffered
+
+    @property
+    def buffer(self) -> Optional[memoryview]:
+        """Returns the buffer backing the DataStream, None if it is not buffered"""
+        return self._buffer
+
     @property
     def calculated_crc(self) -> int:
         """Returns the calculated crc, or 0 if crc calculation is disabled"""
+        self._update_crc()
         return self._calculated_crc
 
     def reset_crc(self) -> None:
         """Resets the calculated crc back to 0"""
         self._calculated_crc = 0
+        self._crc_position = self._position
+        self._pending_crc.clear()
+        self._pending_crc_size = 0
+
+    def _update_crc(self) -> None:
+        """Adds all pending bytes to the calculated crc in a single pass"""
+        if self._buffer is not None:
+            if self.should_calculate_crc and self._crc_position < self._position:
+                self._calculated_crc = crc16(
+                    self._buffer[self._crc_position : self._position],
+                    self._calculated_crc,
+                )
+            self._crc_position = self._position
+            return
+
+        if not self._pending_crc:
+            return
+
+        self._calculated_crc = crc16(b"".join(self._pending_crc), self._calculated_crc)
+        self._pending_crc.clear()
+        self._pending_crc_size = 0
+
+    def read(self, size: Optional[int] = 1) -> bytes:
+        """
+        Reads the provided number of bytes from the wrapped BinaryIO data or buffer,
+        when size is None all remaining bytes are read.
+
+        Raises EOFError when less bytes than requested are available. If a crc should
+        be calculated, the read bytes are added to the pending crc bytes.
+        """
+        if self._buffer is not None:
+            if size is None:
+                size = len(self._buffer) - self._position
+
+            end = self._position + size
+
+            if end > len(self._buffer):
+                raise EOFError
+
+            value = self._buffer[self._position : end].tobytes()
+            self._position = end
+            return value
+
+        value = self._data.read() if size is None else self._data.read(size)
+
+        if size is not None and len(value) != size:
+            raise EOFError
+
+        if self.should_calculate_crc:
+            self._pending_crc.append(value)
+            self._pending_crc_size += len(value)
+
+            if self._pending_crc_size >= CRC_CHUNK_SIZE:
+                self._update_crc()
+
+        return value
+
+    def skip(self, size: int) -> None:
+        """
+        Advances the position with the provided number of bytes, without returning
+        them. The skipped bytes are still part of the calculated crc.
+
+        Raises EOFError when less bytes than requested are available.
+        """
+        if self._buffer is None:
+            self.read(size)
+            return
 
-    def read(self, size: int = 1) -> bytes:
+        end = self._position + size
+
+        if end > len(self._buffer):
+            raise EOFError
+
+        self._position = end
+
+    def unpack(self, fmt: struct.Struct) -> tuple[Any, ...]:
         """
-        Reads the provided number of bits from the wrapped BinaryIO data
+        Unpacks the provided struct at the current position and advances the position
+        with the size of the struct.
 
-        If a crc should be calculated, the internal crc property will be calculated
-        for each byte that was read.
+        When the DataStream is backed by a buffer, the values are unpacked directly
+        from the buffer. Raises EOFError when not enough bytes are available.
         """
-        if not self.should_calculate_crc:
-            return self._data.read(size)
+        if self._buffer is None:
+            return fmt.unpack(self.read(fmt.size))
 
-        value = self._data.read(size)
+        end = self._position + fmt.size
 
-        if len(value) != size:
+        if end > len(self._buffer):
             raise EOFError
 
-        for idx in range(0, size):
-            self._calculated_crc = apply_crc(self._calculated_crc, value[idx])
+        value = fmt.unpack_from(self._buffer, self._position)
+        self._position = end
         return value
 
+    def seek(self, position: int) -> None:
+        """
+        Moves to the provided position, e.g. to decode a single message with an index.
+        The calculated crc starts over at the new position.
+
+        Raises EOFError when the position is beyond the end of the buffer, streams
+        without a seek method raise a ValueError.
+        """
+        if self._buffer is not None:
+            if position > len(self._buffer):
+                raise EOFError
+
+            self._position = position
+        elif not hasattr(self._data, "seek"):
+            raise ValueError("can not seek in a stream without a seek method")
+        else:
+            self._data.seek(position)
+
+        self.reset_crc()
+
     def tell(self) -> int:
         """Returns the current stream position"""
+        if self._buffered:
+            return self._position
+
         return self._data.tell()
 
     def __enter__(self):
-        if not hasattr(self, "_path"):
+        if not hasattr(self, "_path") or self._buffer is not None:
             return self
 
         self._data = open(self._path, "rb")
+
+        try:
+            self._mmap = mmap.mmap(self._data.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files or file systems that do not support mmap, read as stream
+            return self
+
+        self._buffer = memoryview(self._mmap)
+        self._buffered = True
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        self._data.close()
+        self.close()
+
+    def close(self) -> None:
+        """Closes the wrapped data, a memory map is unmapped"""
+        if self._buffer is not None:
+            # Release the view on the buffer, so the buffer can be closed or resized
+            self._buffer.release()
+            self._buffer = None
+
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+        if hasattr(self, "_data"):
+            self._data.close()
 
     @staticmethod
     def is_file(value) -> bool:
@@ -118,7 +282,23 @@ class DataStream:
 
         return True
 
+    @staticmethod
+    def is_buffer(value: Any) -> bool:
+        """Check if the provided value is bytes, a bytearray or a memoryview"""
+        return isinstance(value, (bytes, bytearray, memoryview))
+
     @staticmethod
     def is_streamable(value: Streamable) -> bool:
         """Check if the provided value has a read and tell method"""
         return hasattr(value, "read") and hasattr(value, "tell")
+
+
+def read_struct(data: Streamable, fmt: struct.Struct) -> tuple[Any, ...]:
+    """
+    Unpacks the provided struct from data, a DataStream unpacks it without allocating
+    the intermediate bytes.
+    """
+    if isinstance(data, DataStream):
+        return data.unpack(fmt)
+
+    return fmt.unpack(data.read(fmt.size))
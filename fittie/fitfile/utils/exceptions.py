@@ -1,17 +1,42 @@
-from typing import Optional
+import functools
+from pathlib import Path
+from typing import Optional, Union
 
 
 class DecodeException(Exception):
     default_detail = "could not decode provided data"
     position: int
+    path: Optional[Union[str, Path]]
 
-    def __init__(self, *, detail: Optional[str], position: int):
+    def __init__(
+        self,
+        *,
+        detail: Optional[str],
+        position: int,
+        path: Optional[Union[str, Path]] = None,
+    ):
         if not detail:
             self.detail = self.default_detail
         else:
             self.detail = detail
 
         self.position = position
+        self.path = path
 
     def __str__(self):
+        if self.path is not None:
+            return f"{self.detail} at position {self.position} in {self.path}"
+
         return f"{self.detail} at position {self.position}"
+
+    def __reduce__(self):
+        # The keyword only arguments are not part of args, which is used by default
+        return (
+            functools.partial(
+                self.__class__,
+                detail=self.detail,
+                position=self.position,
+                path=self.path,
+            ),
+            (),
+        )
@@ -0,0 +1,606 @@
+from __future__ import annotations  # Added for type hints
+
+import array
+import string
+from typing import Any, Iterable, Mapping, Optional, cast
+
+from fittie.fitfile.columns import Column, MessageColumns, object_array
+from fittie.fitfile.components import ComponentsPlan
+from fittie.fitfile.data_message import (
+    DataMessage,
+    apply_scale_and_offset,
+    get_developer_plan,
+)
+from fittie.fitfile.decode_plan import (
+    ARRAY,
+    PADDING,
+    SCALAR,
+    STRING,
+    DecodePlan,
+    FieldPlan,
+)
+from fittie.fitfile.decoder import DEVELOPER_DATA_MESSAGE_TYPES, Decoder
+from fittie.fitfile.definition_message import DefinitionMessage
+from fittie.fitfile.fitfile import FitFile
+from fittie.fitfile.header import Header
+from fittie.fitfile.records import RecordHeader
+from fittie.fitfile.utils.datastream import DataStream, Source
+
+# NumPy is imported inside the functions that use it, so `import fittie` does not
+# import it
+
+# Decoded field values and their validity mask, as NumPy arrays
+FieldColumn = tuple[Any, Any]
+
+
+class MessageGroup:
+    """
+    Data messages that belong to the same definition message, all these data messages
+    have the same size and layout.
+
+    Only the offsets of the data messages are recorded while scanning, the messages
+    are decoded all at once by gathering them from the buffer, see `gather`. Data
+    messages that can not be decoded per field (e.g. developer data messages and
+    messages with subfields, which depend on the values of other fields) are decoded
+    message by message while scanning.
+    """
+
+    definition_message: DefinitionMessage
+    plan: DecodePlan
+    developer_plan: Optional[DecodePlan]
+    size: int
+    offsets: array.array
+    messages: Optional[list[Mapping[str, Any]]]
+
+    def __init__(
+        self,
+        definition_message: DefinitionMessage,
+        plan: DecodePlan,
+        developer_plan: Optional[DecodePlan],
+        gather: bool,
+    ):
+        self.definition_message = definition_message
+        self.plan = plan
+        self.developer_plan = developer_plan
+        self.size = plan.size + (developer_plan.size if developer_plan else 0)
+        self.offsets = array.array("q")
+        self.messages = None if gather else []
+
+    @property
+    def message_type(self) -> str:
+        return self.plan.message_type
+
+    def __str__(self) -> str:
+        return (
+            f"MessageGroup:{self.message_type=}{self.size=}count={len(self.offsets)}"
+        ).replace("self.", " ")
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+class VectorizedDecoder(Decoder):
+    """
+    Decoder that scans the records of a FIT file and only records the offsets of the
+    data messages, grouped by definition message. The data messages of a group are
+    decoded afterward, see `gather_message_groups`.
+
+    Definition messages and developer data messages are decoded while scanning.
+    """
+
+    groups: list[MessageGroup]
+    # Current message group, by local message type
+    _local_groups: dict[int, MessageGroup]
+    # Current message group of data messages with a compressed timestamp header, by
+    # local message type
+    _compressed_groups: dict[int, MessageGroup]
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.groups = []
+        self._local_groups = {}
+        self._compressed_groups = {}
+
+    def read_header(self, data: DataStream) -> Header:
+        header = super().read_header(data)
+        self.groups = []
+        self._local_groups = {}
+        self._compressed_groups = {}
+
+        return header
+
+    def read_data_message(
+        self,
+        record_header: RecordHeader,
+        definition_message: DefinitionMessage,
+        data: DataStream,
+    ) -> Optional[tuple[str, DataMessage]]:
+        local_message_type = record_header.local_message_type
+        # The timestamp of a compressed timestamp header depends on the previous
+        # messages, these messages are decoded while scanning
+        compressed = record_header.is_compressed_timestamp_message
+        local_groups = self._compressed_groups if compressed else self._local_groups
+        group = local_groups.get(local_message_type)
+
+        if group is None or group.definition_message is not definition_message:
+            plan = self._projected_plans.get(
+                local_message_type, definition_message.plan
+            )
+            group = MessageGroup(
+                definition_message,
+                plan,
+                get_developer_plan(plan, definition_message, self.developer_data, data),
+                gather=(
+                    definition_message.global_message_type
+                    not in DEVELOPER_DATA_MESSAGE_TYPES
+                    and not compressed
+                    and can_gather(plan)
+                ),
+            )
+            local_groups[local_message_type] = group
+            self.groups.append(group)
+
+        offset = data.tell()
+
+        if group.messages is None:
+            group.offsets.append(offset)
+            plan = group.plan
+
+            if plan.accumulated_fields:
+                # Accumulated values depend on the order of the messages
+                values = data.unpack(plan.struct)
+                self.accumulators.update(plan, values)
+                timestamp = (
+                    values[plan.timestamp_field.index]
+                    if plan.timestamp_field is not None
+                    else None
+                )
+                data.skip(group.size - plan.size)
+            elif plan.timestamp_struct is not None:
+                (timestamp,) = data.unpack(plan.timestamp_struct)
+                data.skip(group.size - plan.timestamp_struct.size)
+            else:
+                data.skip(group.size)
+                return None
+
+            if (
+                timestamp is not None
+                and timestamp != cast(FieldPlan, plan.timestamp_field).invalid_value
+            ):
+                self.timestamps.timestamp = timestamp
+
+            return None
+
+        record = super().read_data_message(record_header, definition_message, data)
+
+        if record is not None:
+            group.offsets.append(offset)
+            group.messages.append(record[1].fields)
+
+        return None
+
+
+def can_gather(plan: DecodePlan) -> bool:
+    """
+    Check whether the fields of the plan can be decoded independent of each other.
+    Accumulated components depend on the previous messages, they are decoded in order.
+    """
+    return (
+        not plan.fields_with_subfields
+        and not plan.accumulates
+        and all(
+            _can_gather_components(components)
+            for _, components in plan.fields_with_components
+        )
+    )
+
+
+def _can_gather_components(components: ComponentsPlan) -> bool:
+    """
+    Check whether the components can be expanded per column: the field value fits in
+    an unsigned 64-bit integer and every component has a single value.
+    """
+    return components.bits <= 64 and all(
+        not component.is_array
+        and (
+            component.components is None or _can_gather_components(component.components)
+        )
+        for component in components.components
+    )
+
+
+def _field_dtype(field: FieldPlan, endianness: str) -> Any:
+    """Returns the NumPy dtype of a field"""
+    import numpy
+
+    if field.kind == SCALAR or field.kind == ARRAY:
+        # The struct format of the field is '<count><format><padding>'
+        fmt = field.fmt.lstrip(string.digits)[0]
+        dtype = numpy.dtype(endianness + fmt)
+
+        return dtype if field.kind == SCALAR else (dtype, (field.count,))
+
+    return numpy.dtype(f"V{field.size}")
+
+
+def _gather_records(buffer: Any, group: MessageGroup) -> tuple[Any, list[FieldPlan]]:
+    """
+    Gathers the data messages of the group from the buffer as a NumPy array with a
+    structured dtype, one record per data message.
+
+    When the data messages are evenly spaced (e.g. consecutive messages of the same
+    type), the records are a view on the buffer, otherwise the data messages are
+    copied from the buffer.
+    """
+    import numpy
+
+    names: list[str] = []
+    formats: list[Any] = []
+    offsets: list[int] = []
+    fields: list[FieldPlan] = []
+    position = 0
+
+    for prefix, plan in (("field", group.plan), ("developer", group.developer_plan)):
+        if plan is None:
+            continue
+
+        for field in plan.all_fields:
+            if field.kind != PADDING:
+                # Field names are not used, developer fields could have the same name
+                names.append(f"{prefix}_{len(fields)}")
+                formats.append(_field_dtype(field, plan.endianness))
+                offsets.append(position)
+                fields.append(field)
+
+            position += field.size
+
+    dtype = numpy.dtype(
+        {
+            "names": names,
+            "formats": formats,
+            "offsets": offsets,
+            "itemsize": group.size,
+        }
+    )
+    message_offsets = numpy.frombuffer(group.offsets, dtype=numpy.int64)
+    strides = numpy.diff(message_offsets)
+
+    if len(strides) == 0 or numpy.all(strides == strides[0]):
+        records = numpy.ndarray(
+            shape=(len(message_offsets),),
+            dtype=dtype,
+            buffer=buffer,
+            offset=int(message_offsets[0]),
+            strides=(int(strides[0]) if len(strides) else group.size,),
+        )
+    else:
+        rows = buffer[message_offsets[:, None] + numpy.arange(group.size)]
+        records = rows.view(dtype).reshape(-1)
+
+    return records, fields
+
+
+def _decode_column(field: FieldPlan, values: Any) -> FieldColumn:
+    """
+    Converts the gathered values of a field into field values and a validity mask.
+
+    Invalid values are masked and scale and offset are applied to the whole column.
+    Array and string fields are converted per value.
+    """
+    import numpy
+
+    scale = field.scale if field.scale is not None else 1
+    offset = field.offset or 0
+
+    if field.kind == SCALAR and not isinstance(scale, list):
+        if values.dtype.kind == "f":
+            values = values.astype(numpy.float64)
+
+        valid = values != field.invalid_value
+
+        if field.is_scaled:
+            values = values.astype(numpy.float64) / scale - offset
+
+        return values, valid
+
+    decoded: list[Any] = []
+
+    for value in values.tolist():
+        if field.kind == SCALAR:
+            value = None if value == field.invalid_value else value
+        elif field.kind == ARRAY:
+            value = [None if item == field.invalid_value else item for item in value]
+
+            if not any(filter(None, value)):
+                value = None
+        elif field.kind == STRING:
+            raw = value.replace(b"\x00", b"")
+            value = raw.decode("utf-8") if raw else None
+
+        if field.is_scaled and value is not None:
+            value = apply_scale_and_offset(value, scale, offset)
+
+        decoded.append(value)
+
+    return object_array(decoded), numpy.array([v is not None for v in decoded])
+
+
+def _component_source(components: ComponentsPlan, values: Any) -> FieldColumn:
+    """
+    Returns the gathered values of a field with components as unsigned 64-bit
+    integers, array values are combined with the first value in the lowest bits.
+    """
+    import numpy
+
+    if values.ndim == 1:
+        return values.astype(numpy.uint64), values != components.invalid_value
+
+    raw = numpy.zeros(len(values), dtype=numpy.uint64)
+
+    for position in range(values.shape[1]):
+        raw |= values[:, position].astype(numpy.uint64) << numpy.uint64(
+            position * components.element_bits
+        )
+
+    return raw, ~numpy.all(values == components.invalid_value, axis=1)
+
+
+def _expand_columns(
+    components: ComponentsPlan,
+    raw: Any,
+    valid: Any,
+    expanded: dict[str, FieldColumn],
+) -> None:
+    """Expands the components of a column of raw field values, see `expand`"""
+    import numpy
+
+    for component in components.components:
+        bits = (raw >> numpy.uint64(component.shift)) & numpy.uint64(component.mask)
+        values = (
+            bits.astype(numpy.float64) / component.scale - component.offset
+            if component.is_scaled
+            else bits.astype(numpy.int64)
+        )
+
+        if (previous := expanded.get(component.name)) is not None:
+            # The first expanded value of a destination field is used
+            values = numpy.where(previous[1], previous[0], values)
+            expanded[component.name] = (values, valid | previous[1])
+        else:
+            expanded[component.name] = (values, valid)
+
+        if component.components is not None:
+            if (
+                component.scale == component.destination_scale
+                and component.offset == component.destination_offset
+            ):
+                destination_raw = bits
+            else:
+                destination_raw = numpy.rint(
+                    (values + component.destination_offset)
+                    * component.destination_scale
+                ).astype(numpy.uint64)
+
+            _expand_columns(component.components, destination_raw, valid, expanded)
+
+
+def _expand_component_columns(
+    plan: DecodePlan, field_values: dict[FieldPlan, Any], columns: dict
+) -> None:
+    """
+    Expands the components of the fields of the plan into columns. A component value
+    is only used when the destination field has no valid value.
+    """
+    decoded_names = plan.decoded_names
+
+    for source, destination in plan.component_aliases:
+        _fill_column(
+            columns, decoded_names[destination], columns[decoded_names[source]]
+        )
+
+    expanded: dict[str, FieldColumn] = {}
+
+    for field, components in plan.expanded_components:
+        _expand_columns(
+            components, *_component_source(components, field_values[field]), expanded
+        )
+
+    for name, column in expanded.items():
+        _fill_column(columns, name, column)
+
+    for name in plan.component_names:
+        # Keep the order of the fields of decoded data messages
+        columns[name] = columns.pop(name)
+
+
+def _fill_column(columns: dict, name: str, column: FieldColumn) -> None:
+    """Fills the invalid values of a column with the values of another column"""
+    import numpy
+
+    if (existing := columns.get(name)) is None:
+        columns[name] = column
+    elif (fill := ~existing[1] & column[1]).any():
+        columns[name] = (
+            numpy.where(fill, column[0], existing[0]),
+            existing[1] | column[1],
+        )
+
+
+def gather(buffer: Any, group: MessageGroup) -> dict[str, FieldColumn]:
+    """
+    Decodes all data messages of a message group at once, returns the decoded field
+    values and validity mask by field name.
+    """
+    if group.messages is not None:
+        message_columns = MessageColumns(group.message_type)
+
+        for message_fields in group.messages:
+            message_columns.append(message_fields)
+
+        return {
+            name: (column.to_numpy(), column.valid_mask())
+            for name, column in message_columns.columns.items()
+        }
+
+    records, fields = _gather_records(buffer, group)
+    columns: dict[str, FieldColumn] = {}
+    developer_columns: dict[str, FieldColumn] = {}
+
+    for name, field in zip(records.dtype.names, fields, strict=True):
+        target = developer_columns if name.startswith("developer_") else columns
+        target[field.name] = _decode_column(field, records[name])
+
+    if group.plan.fields_with_components:
+        # Component columns follow the fields, like in decoded data messages
+        _expand_component_columns(
+            group.plan,
+            {
+                field: records[name]
+                for name, field in zip(records.dtype.names, fields, strict=True)
+            },
+            columns,
+        )
+
+    columns.update(developer_columns)
+
+    if (output_names := group.plan.output_names) is not None:
+        columns = {
+            name: column for name, column in columns.items() if name in output_names
+        }
+
+    return columns
+
+
+def gather_message_groups(
+    buffer: Any, groups: Iterable[MessageGroup]
+) -> dict[str, MessageColumns]:
+    """
+    Decodes the data messages of all message groups, and combines the groups of the
+    same message type into columns. Rows are in the order of the FIT file.
+    """
+    import numpy
+
+    parts: dict[str, list[tuple[Any, dict[str, FieldColumn]]]] = {}
+
+    for group in groups:
+        if not group.offsets:
+            continue
+
+        parts.setdefault(group.message_type, []).append(
+            (numpy.frombuffer(group.offsets, dtype=numpy.int64), gather(buffer, group))
+        )
+
+    return {
+        message_type: _combine(message_type, message_type_parts)
+        for message_type, message_type_parts in parts.items()
+    }
+
+
+def _combine(
+    message_type: str, parts: list[tuple[Any, dict[str, FieldColumn]]]
+) -> MessageColumns:
+    """Combines the decoded columns of message groups in the order of the FIT file"""
+    import numpy
+
+    message_columns = MessageColumns(message_type)
+    order = (
+        numpy.argsort(numpy.concatenate([offsets for offsets, _ in parts]))
+        if len(parts) > 1
+        else None
+    )
+    names = dict.fromkeys(name for _, columns in parts for name in columns)
+
+    for name in names:
+        values_parts = []
+        valid_parts = []
+
+        for offsets, columns in parts:
+            if (column := columns.get(name)) is None:
+                column = (
+                    numpy.zeros(len(offsets), dtype=numpy.int64),
+                    numpy.zeros(len(offsets), dtype=bool),
+                )
+
+            values_parts.append(column[0])
+            valid_parts.append(column[1])
+
+        values = numpy.concatenate(values_parts)
+        valid = numpy.concatenate(valid_parts)
+
+        if order is not None:
+            values = values[order]
+            valid = valid[order]
+
+        message_columns.columns[name] = Column.from_numpy(name, values, valid)
+
+    message_columns.length = sum(len(offsets) for offsets, _ in parts)
+
+    return message_columns
+
+
+def decode_vectorized(
+    source: Source,
+    calculate_crc: bool = True,
+    include: Optional[Iterable[str]] = None,
+    exclude: Optional[Iterable[str]] = None,
+    fields: Optional[dict[str, Iterable[str]]] = None,
+) -> list[FitFile]:
+    """
+    Decode a fit file into FitFiles with columns, in two passes.
+
+    The first pass scans the records and only records the offsets of the data
+    messages, grouped by definition message. The second pass decodes each group at
+    once with NumPy, invalid values are masked and scale and offset are applied per
+    column. The result is the same as `decode` with the columnar layout.
+
+    Requires NumPy, a source that is not a path or bytes is read into memory.
+
+    Args:
+        source: a file name, bytes, BytesIO or BufferIO.
+        calculate_crc: whether to calculate the CRC
+        include: only decode data messages of these message types
+        exclude: skip data messages of these message types
+        fields: only decode these fields, by message type
+
+    Returns:
+        Iterable[FitFile]: one or more instances of FitFile
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("numpy is required for vectorized decoding") from None
+
+    fitfiles: list[FitFile] = []
+
+    with DataStream(source) as stream:
+        data = stream if stream.is_buffered else DataStream(stream.read(None))
+        buffer = numpy.frombuffer(cast(memoryview, data.buffer), dtype=numpy.uint8)
+        decoder = VectorizedDecoder(
+            calculate_crc=calculate_crc,
+            include=include,
+            exclude=exclude,
+            fields=fields,
+        )
+
+        try:
+            while True:
+                try:
+                    decoder.read_header(data)
+
+                    # Data messages are collected in the message groups of the decoder
+                    for _ in decoder.iter_records(data):
+                        pass
+                except EOFError:
+                    break
+
+                fitfiles.append(
+                    decoder.build_fitfile(
+                        {}, gather_message_groups(buffer, decoder.groups)
+                    )
+                )
+        finally:
+            # Release the buffer, a memory mapped file can only be closed without
+            # references to its buffer
+            del buffer
+
+    return fitfiles
@@ -1 +1,17 @@
-from .message_profile import MessageProfile, FieldProfile, SubField  # noqa
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .message_profile import MessageProfile, FieldProfile, SubField  # noqa
+
+# The profile dataclasses are imported on first use, importing dataclasses (and
+# inspect) slows down `import fittie`
+LAZY_EXPORTS = ("MessageProfile", "FieldProfile", "SubField")
+
+
+def __getattr__(name: str) -> Any:
+    if name in LAZY_EXPORTS:
+        from . import message_profile
+
+        return getattr(message_profile, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
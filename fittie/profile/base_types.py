@@ -46,6 +46,10 @@ class BaseType(Generic[T]):
     def __repr__(self) -> str:
         return str(self)
 
+    def __reduce__(self):
+        # Base types are shared instances, pickle them by reference
+        return get_base_type, (self.number,)
+
     def get_value(self, endianness: str, data: Streamable) -> T | None:
         # TODO: check for endian ability before creating fmt_string?
         fmt_string = f"{endianness}{self.fmt}"
@@ -230,3 +234,12 @@ BASE_TYPES: dict[int, BaseType] = {
         comment="",
     ),
 }
+
+_BASE_TYPES_BY_NUMBER = {
+    base_type.number: base_type for base_type in BASE_TYPES.values()
+}
+
+
+def get_base_type(number: int) -> BaseType:
+    """Returns the base type with the provided base type number"""
+    return _BASE_TYPES_BY_NUMBER[number]
@@ -0,0 +1,75 @@
+from __future__ import annotations  # Added for type hints
+
+import pickle
+from typing import Any, Generic, Hashable, Iterator, Mapping, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+# Protocol of the pickled profile data, protocol 4 is supported by all supported
+# Python versions
+PICKLE_PROTOCOL = 4
+
+
+class ProfileData(Mapping[K, V], Generic[K, V]):
+    """
+    Read-only mapping of profile data (e.g. messages or FIT types) that is loaded on
+    demand from a data file of the package.
+
+    The data file is a pickled dict with a separately pickled value per key. The
+    data file is read when the mapping is first used, a value is unpickled when it
+    is first retrieved and is cached afterward.
+    """
+
+    filename: str
+    _data: Optional[dict[K, bytes]]
+    _values: dict[K, V]
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._data = None
+        self._values = {}
+
+    def _load(self) -> dict[K, bytes]:
+        if self._data is None:
+            # Imported here, importlib.resources slows down `import fittie`
+            from importlib import resources
+
+            path = resources.files("fittie.profile") / "data" / self.filename
+            self._data = pickle.loads(path.read_bytes())
+
+        return self._data
+
+    def __getitem__(self, key: K) -> V:
+        if (value := self._values.get(key)) is None:
+            value = self._values[key] = pickle.loads(self._load()[key])
+
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._load()
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __str__(self) -> str:
+        return f"ProfileData:{self.filename=}loaded={len(self._values)}".replace(
+            "self.", " "
+        )
+
+    def __repr__(self) -> str:
+        return str(self)
+
+
+def dump_profile_data(values: Mapping[Any, Any]) -> bytes:
+    """Pickles profile data to the format that is read by ProfileData"""
+    return pickle.dumps(
+        {
+            key: pickle.dumps(value, protocol=PICKLE_PROTOCOL)
+            for key, value in values.items()
+        },
+        protocol=PICKLE_PROTOCOL,
+    )
@@ -1,14 +1,14 @@
+from __future__ import annotations  # Added for type hints
+
 import logging
-from dataclasses import fields
 from functools import cache
+from typing import TYPE_CHECKING
 
-from fittie.profile.message_profile import (
-    MessageProfile,
-    FieldProfile,
-    SubField,
-)
 from fittie.profile.messages import MESSAGES
 
+if TYPE_CHECKING:
+    from fittie.profile.message_profile import MessageProfile, FieldProfile
+
 logger = logging.getLogger("fittie")
 
 
@@ -30,6 +30,10 @@ def dict_to_message_profile(source: dict) -> MessageProfile:
     """
     Converts a nested dict to a MessageProfile, with FieldProfiles
     """
+    from dataclasses import fields
+
+    from fittie.profile.message_profile import MessageProfile
+
     raw = {}
     field_types = {f.name: f.type for f in fields(MessageProfile)}
 
@@ -51,6 +55,10 @@ def dict_to_field_profile(source: dict) -> FieldProfile:
     """
     Converts a nested dict to a FieldProfile, with SubFields
     """
+    from dataclasses import fields
+
+    from fittie.profile.message_profile import FieldProfile, SubField
+
     raw = {}
     field_types = {f.name: f.type for f in fields(FieldProfile)}
 
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+
+"""
+Measures the memory that is retained by the decoded messages of a FIT file that
+mostly contains record messages.
+
+The FIT file is generated, run from the root of the repository:
+
+    python scripts/benchmark_memory.py --records 36000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import struct
+import tracemalloc
+
+from fittie import decode
+from fittie.fitfile.crc import crc16
+
+FIT_EPOCH_START = 1_000_000_000
+
+# Field number, size and base type of the record fields, the fields that a cycling
+# computer typically writes
+RECORD_FIELDS = [
+    (253, 4, 0x86),  # timestamp
+    (0, 4, 0x85),  # position_lat
+    (1, 4, 0x85),  # position_long
+    (5, 4, 0x86),  # distance
+    (78, 4, 0x86),  # enhanced_altitude
+    (73, 4, 0x86),  # enhanced_speed
+    (3, 1, 0x02),  # heart_rate
+    (4, 1, 0x02),  # cadence
+    (13, 1, 0x01),  # temperature
+    (7, 2, 0x84),  # power
+    (29, 4, 0x86),  # accumulated_power
+    (30, 1, 0x02),  # left_right_balance
+    (31, 1, 0x02),  # gps_accuracy
+    (53, 1, 0x02),  # fractional_cadence
+]
+RECORD_STRUCT = struct.Struct("<IiiIIIBBbHIBBB")
+
+
+def _definition_message(
+    local_message_type: int,
+    global_message_type: int,
+    fields: list[tuple[int, int, int]],
+) -> bytes:
+    content = struct.pack("<BBHB", 0, 0, global_message_type, len(fields))
+    content += b"".join(struct.pack("BBB", *field) for field in fields)
+
+    return bytes([0x40 | local_message_type]) + content
+
+
+def generate_activity(records: int) -> bytes:
+    """Generates a FIT file with a file_id message and the provided number of records"""
+    data = bytearray()
+    data += _definition_message(0, 0, [(0, 1, 0x00), (1, 2, 0x84), (4, 4, 0x86)])
+    data += b"\x00" + struct.pack("<BHI", 4, 1, FIT_EPOCH_START)
+    data += _definition_message(1, 20, RECORD_FIELDS)
+
+    for index in range(records):
+        data += b"\x01" + RECORD_STRUCT.pack(
+            FIT_EPOCH_START + index,
+            600_000_000 + index * 10,
+            60_000_000 - index * 10,
+            index * 700,
+            3000 + index % 100,
+            7000 + index % 1000,
+            120 + index % 60,
+            80 + index % 20,
+            18,
+            200 + index % 150,
+            index * 200,
+            0xFF,  # invalid, no left right balance
+            3,
+            0,
+        )
+
+    header = struct.pack("<BBHI4s", 12, 0x20, 2158, len(data), b".FIT")
+    content = header + bytes(data)
+
+    return content + struct.pack("<H", crc16(content))
+
+
+def measure(content: bytes, **options) -> int:
+    """Returns the number of bytes that are retained by the decoded FIT files"""
+    gc.collect()
+    tracemalloc.start()
+    fitfiles = decode(content, **options)
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    del fitfiles
+
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=36_000)
+    args = parser.parse_args()
+
+    content = generate_activity(args.records)
+
+    print(f"FIT file with {args.records} records, {len(content)} bytes")
+
+    for name, options in [
+        ("messages", {}),
+        ("lazy messages", {"lazy": True}),
+        ("columnar", {"layout": "columnar"}),
+    ]:
+        size = measure(content, **options)
+        print(f"{name:>16}: {size:>12} bytes, {size / args.records:8.1f} per record")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+"""
+Measures the throughput of `decode_many` with a pool of threads and a pool of
+processes, for generated FIT files that mostly contain record messages.
+
+Threads only decode in parallel when the GIL is disabled, run the benchmark with a
+free-threaded build (e.g. python3.13t) and a regular build to compare them. Run it
+from the root of the repository:
+
+    PYTHONPATH=. python scripts/benchmark_threads.py --files 32 --records 36000
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from benchmark_memory import generate_activity
+
+from fittie import decode_many
+from fittie.fitfile.decode import is_gil_enabled, resolve_executor
+
+
+def measure(paths: list[Path], executor: str, workers: int) -> float:
+    """Returns the number of seconds it takes to decode all paths"""
+    start = time.perf_counter()
+
+    for result in decode_many(paths, workers=workers, executor=executor):
+        if not result.ok:
+            raise RuntimeError(f"could not decode {result.path}: {result.error}")
+
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=32)
+    parser.add_argument("--records", type=int, default=36_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    content = generate_activity(args.records)
+    size = args.files * len(content) / 1024 / 1024
+
+    print(f"Python {sys.version.split()[0]}, GIL enabled: {is_gil_enabled()}")
+    print(f"{args.files} FIT files with {args.records} records, {size:.1f} MB")
+    print(f"executor 'auto' decodes with a {resolve_executor('auto')} pool")
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+
+        for index in range(args.files):
+            paths.append(Path(directory) / f"activity_{index}.fit")
+            paths[-1].write_bytes(content)
+
+        for executor in ("thread", "process"):
+            for workers in args.workers:
+                seconds = measure(paths, executor, workers)
+                print(
+                    f"{executor:>8} x {workers:<3}: {seconds:8.3f} s, "
+                    f"{size / seconds:8.1f} MB/s, {args.files / seconds:8.1f} files/s"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,25 +1,21 @@
 import dataclasses
 import fileinput
 import logging
-import pprint
 import re
 
-from black import format_str, FileMode
 from csv import DictReader
-from datetime import datetime
 from typing import Any, Optional, Union
 
 from fittie.profile import MessageProfile, FieldProfile, SubField
 from fittie.profile.field_type import FieldType, FieldTypeValue
 from fittie.profile.mesg_nums import MESG_NUMS
 from fittie.profile.fit_types import FIT_TYPES
+from fittie.profile.profile_data import dump_profile_data
 
 logging.basicConfig()
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
-WIDTH = 88
-
 DELIMITER = ";"
 TYPES_TYPE_NAME_COLUMN = "Type Name"
 TYPES_BASE_TYPE_COLUMN = "Base Type"
@@ -45,14 +41,6 @@ MESSAGES_PRODUCTS_COLUMN = "Products:"
 MESSAGES_EXAMPLE_COLUMN = "EXAMPLE"
 
 
-def get_file_header() -> str:
-    text = f"This file is auto generated at {datetime.now()}, do not edit this file"
-    prepend = f"#{' ' * int((WIDTH - len(text)) / 2 - 1)}"
-    padding = "#" * WIDTH
-
-    return "\n".join([padding, f"{prepend}{text}{prepend[::-1]}", padding])
-
-
 def get_value(row: dict[str, Any], key: str) -> Optional[Union[str, int, list[int]]]:
     value = row.get(key)
 
@@ -313,27 +301,16 @@ def read_types() -> dict[str, Any]:
 
 
 def write_types_to_file(types: dict[str, Any]) -> None:
-    import_text = "from fittie.profile.field_type import FieldType, FieldTypeValue"
-    __write_to_file(types, "../fittie/profile/fit_types.py", "FIT_TYPES", import_text)
+    __write_to_file(types, "../fittie/profile/data/fit_types.pickle")
 
 
 def write_messages_to_file(messages: dict[str, Any]) -> None:
-    import_text = "from fittie.profile.message_profile import MessageProfile, FieldProfile, SubField"
-    __write_to_file(messages, "../fittie/profile/messages.py", "MESSAGES", import_text)
-
-
-def __write_to_file(
-    dict_value: dict[str, Any], filename: str, variable_name: str, import_text: str
-) -> None:
-    with open(filename, "w") as f:
-        file_header = get_file_header()
-        pretty = pprint.pformat(dict_value, width=WIDTH, compact=True, sort_dicts=False)
-        f.write(
-            format_str(
-                f"{file_header}\n{import_text}\n{variable_name} = {pretty}",
-                mode=FileMode(),
-            )
-        )
+    __write_to_file(messages, "../fittie/profile/data/messages.pickle")
+
+
+def __write_to_file(dict_value: dict[str, Any], filename: str) -> None:
+    with open(filename, "wb") as f:
+        f.write(dump_profile_data(dict_value))
 
 
 def write_profile_version():
@@ -1,6 +1,8 @@
+import struct
 from pathlib import Path
 
 import pytest
+from fittie.fitfile.crc import crc16
 from fittie.fitfile.data_message import DataMessage
 from fittie.fitfile.definition_message import DefinitionMessage
 from fittie.fitfile.field_definitions import FieldDefinition
@@ -124,6 +126,143 @@ def record_5_definition_message():
     )
 
 
+def _definition(local_message_type: int, global_message_type: int, fields) -> bytes:
+    content = struct.pack("<BBHB", 0, 0, global_message_type, len(fields))
+    content += b"".join(struct.pack("BBB", *field) for field in fields)
+
+    return bytes([0x40 | local_message_type]) + content
+
+
+def _file_id(time_created: int = 1_000_000_000) -> bytes:
+    """Definition and data message of a file_id of an activity"""
+    data = _definition(0, 0, [(0, 1, 0x00), (1, 2, 0x84), (4, 4, 0x86)])
+
+    return data + b"\x00" + struct.pack("<BHI", 4, 1, time_created)
+
+
+def _fit_file(data: bytes) -> bytes:
+    """FIT file of the records in data, with a header of 12 bytes and the crc"""
+    content = struct.pack("<BBHI4s", 12, 0x20, 2158, len(data), b".FIT") + data
+
+    return content + struct.pack("<H", crc16(content))
+
+
+@pytest.fixture
+def components_fit_file() -> bytes:
+    """
+    FIT file with fields that have components: record speed, altitude and
+    compressed_speed_distance, event data (gear change) and monitoring
+    current_activity_type_intensity
+    """
+    record = struct.Struct("<IHH3sI")
+    monitoring = struct.Struct("<IB")
+    data = _file_id()
+    data += _definition(
+        1,
+        20,
+        [(253, 4, 0x86), (6, 2, 0x84), (2, 2, 0x84), (8, 3, 0x0D), (73, 4, 0x86)],
+    )
+    data += _definition(2, 21, [(253, 4, 0x86), (0, 1, 0x00), (3, 4, 0x86)])
+    data += _definition(3, 55, [(253, 4, 0x86), (24, 1, 0x0D)])
+
+    for index in range(6):
+        timestamp = 1_000_000_000 + index
+        # Speed of 12 bits and distance of 12 bits
+        compressed = (400 + index | (index * 16) << 12).to_bytes(3, "little")
+
+        if index % 2:
+            # Speed is only available in compressed_speed_distance
+            data += b"\x01" + record.pack(
+                timestamp, 0xFFFF, 3000 + index, compressed, 0xFFFFFFFF
+            )
+        else:
+            data += b"\x01" + record.pack(
+                timestamp, 5000 + index, 0xFFFF, b"\xff\xff\xff", 0xFFFFFFFF
+            )
+
+        if index % 3 == 0:
+            # Activity type 6 and intensity 2
+            data += b"\x03" + monitoring.pack(timestamp, 6 | 2 << 5)
+
+    # Rear gear change, rear gear 3 of 28 teeth, front gear 2 of 50 teeth
+    data += b"\x02" + struct.pack(
+        "<IBI", 1_000_000_010, 43, 3 | 28 << 8 | 2 << 16 | 50 << 24
+    )
+
+    return _fit_file(data)
+
+
+@pytest.fixture
+def accumulated_fit_file() -> bytes:
+    """
+    FIT file with records that have accumulated components: distance of
+    compressed_speed_distance and total_cycles of cycles, both rolling over. The
+    first record has the distance itself, with another definition message.
+    """
+    record = struct.Struct("<I3sB")
+    data = _file_id()
+    data += _definition(1, 20, [(253, 4, 0x86), (5, 4, 0x86)])
+    data += _definition(2, 20, [(253, 4, 0x86), (8, 3, 0x0D), (18, 1, 0x02)])
+    # Distance of 100 m, the compressed distance continues from it
+    data += b"\x01" + struct.pack("<II", 1_000_000_000, 10_000)
+
+    for index, (compressed_distance, cycles) in enumerate(
+        [(1680, 250), (4680 & 0xFFF, 4), (None, 20)], start=1
+    ):
+        compressed = (
+            b"\xff\xff\xff"
+            if compressed_distance is None
+            else (400 | compressed_distance << 12).to_bytes(3, "little")
+        )
+        data += b"\x02" + record.pack(1_000_000_000 + index, compressed, cycles)
+
+    return _fit_file(data)
+
+
+@pytest.fixture
+def compressed_timestamp_fit_file() -> bytes:
+    """
+    FIT file with records with a compressed timestamp header, and records and an
+    event with a full timestamp
+    """
+    timestamp = 1_000_000_000  # the 5 least significant bits are 0
+    data = _file_id(timestamp)
+    data += _definition(1, 20, [(253, 4, 0x86), (3, 1, 0x02)])
+    data += _definition(2, 20, [(3, 1, 0x02)])
+    data += _definition(3, 21, [(253, 4, 0x86), (0, 1, 0x00), (1, 1, 0x00)])
+
+    data += b"\x01" + struct.pack("<IB", timestamp, 100)
+
+    for offset, heart_rate in [(5, 101), (20, 102), (3, 103)]:
+        # Compressed timestamp header of local message type 2
+        data += bytes([0x80 | 2 << 5 | offset, heart_rate])
+
+    # Event with a full timestamp, followed by a record with a compressed timestamp
+    data += b"\x03" + struct.pack("<IBB", timestamp + 40, 0, 0)
+    data += bytes([0x80 | 2 << 5 | (timestamp + 42) & 0x1F, 104])
+
+    return _fit_file(data)
+
+
+def message_fields(messages) -> list:
+    """The fields of the data messages of `iter_messages`, to compare decodes"""
+    return [
+        (fitfile_index, message_type, dict(message.fields))
+        for fitfile_index, message_type, message in messages
+    ]
+
+
+def fitfile_fields(fitfiles) -> list:
+    """The fields of the data messages of fit files, to compare decodes"""
+    return [
+        {
+            message_type: [dict(message.fields) for message in messages]
+            for message_type, messages in fitfile.data_messages.items()
+        }
+        for fitfile in fitfiles
+    ]
+
+
 @pytest.fixture
 def data_dir() -> Path:
     return DATA_DIR
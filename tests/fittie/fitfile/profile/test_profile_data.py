@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+from fittie.profile import MessageProfile
+from fittie.profile.field_type import FieldType
+from fittie.profile.profile_data import ProfileData
+
+
+def test_profile_data_is_loaded_on_demand():
+    messages = ProfileData("messages.pickle")
+    assert messages._data is None
+
+    assert 20 in messages
+    assert messages._values == {}
+
+    record = messages[20]
+    assert isinstance(record, MessageProfile)
+    assert record.name == "record"
+    assert messages[20] is record
+    assert list(messages._values) == [20]
+    assert messages.get(-1) is None
+
+
+def test_fit_types():
+    fit_types = ProfileData("fit_types.pickle")
+
+    assert isinstance(fit_types["file"], FieldType)
+    assert fit_types["file"].values[4].value_name == "activity"
+    assert len(fit_types) == len(list(fit_types))
+
+
+def test_import_does_not_load_profile():
+    code = (
+        "import fittie\n"
+        "from fittie.profile.messages import MESSAGES\n"
+        "from fittie.profile.fit_types import FIT_TYPES\n"
+        "assert MESSAGES._data is None and FIT_TYPES._data is None\n"
+        "import sys\n"
+        "for module in ('numpy', 'inspect', 'concurrent.futures.process'):\n"
+        "    assert module not in sys.modules, module\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
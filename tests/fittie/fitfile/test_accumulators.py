@@ -0,0 +1,103 @@
+import pytest
+
+from fittie.fitfile.accumulators import Accumulator, Accumulators
+from fittie.fitfile.data_message import LazyDataMessage
+from fittie.fitfile.decode import decode, iter_messages
+from fittie.fitfile.decode_plan import compile_decode_plan
+from fittie.fitfile.field_definitions import FieldDefinition
+from fittie.fitfile.utils.endianness import Endianness
+from fittie.profile.base_types import BASE_TYPES
+
+# Distance and total cycles of the records of the accumulated fit file
+EXPECTED_DISTANCE = [100.0, 105.0, 292.5, None]
+EXPECTED_TOTAL_CYCLES = [None, 250, 260, 276]
+
+
+def test_accumulator():
+    accumulator = Accumulator(bits=8)
+
+    assert accumulator.accumulate(250) == 250
+    # Rolled over
+    assert accumulator.accumulate(4) == 260
+    assert accumulator.accumulate(4) == 260
+
+    accumulator.set(1000)
+    assert accumulator.accumulate((1000 + 30) & 0xFF) == 1030
+
+
+def test_accumulators():
+    accumulators = Accumulators()
+
+    assert accumulators.accumulate(20, "total_cycles", 8, 200) == 200
+    assert accumulators.accumulate(20, "total_cycles", 8, 10) == 266
+    # Accumulated per message number
+    assert accumulators.accumulate(21, "total_cycles", 8, 10) == 10
+
+    accumulators.set(20, "distance", 12, 5000)
+    assert accumulators.accumulate(20, "distance", 12, (5000 + 10) & 0xFFF) == 5010
+    assert len(accumulators) == 3
+
+
+def test_accumulators_update():
+    plan = compile_decode_plan(
+        20,
+        Endianness.LITTLE,
+        [FieldDefinition(number=5, size=4, base_type=BASE_TYPES[0x86])],  # distance
+    )
+    accumulators = Accumulators()
+
+    accumulators.update(plan, (10_000,))
+    # Invalid values do not replace the distance
+    accumulators.update(plan, (0xFFFFFFFF,))
+
+    # Distance of 100 m, in units of the 12 bits compressed distance (1 / 16 m)
+    assert accumulators.accumulate(20, "distance", 12, 1680) == 1680
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_decode_accumulated(accumulated_fit_file, lazy):
+    fitfile = decode(accumulated_fit_file, lazy=lazy)[0]
+    messages = fitfile.data_messages["record"]
+
+    if lazy:
+        # Only messages with accumulated components are decoded right away
+        assert [isinstance(message, LazyDataMessage) for message in messages] == [
+            True,
+            False,
+            False,
+            False,
+        ]
+
+    records = [message.fields for message in messages]
+
+    assert [record["distance"] for record in records] == EXPECTED_DISTANCE
+    assert [record["total_cycles"] for record in records[1:]] == [250, 260, 276]
+    assert records[1]["speed"] == 4.0
+    assert "total_cycles" not in records[0]
+
+
+def test_decode_accumulated_columnar(accumulated_fit_file):
+    records = decode(accumulated_fit_file, layout="columnar")[0].columns("record")
+
+    assert records["distance"].to_list() == EXPECTED_DISTANCE
+    assert records["total_cycles"].to_list() == EXPECTED_TOTAL_CYCLES
+
+
+def test_iter_messages_accumulated(accumulated_fit_file):
+    distances = [
+        message.fields["distance"]
+        for _, message_type, message in iter_messages(accumulated_fit_file)
+        if message_type == "record"
+    ]
+
+    assert distances == EXPECTED_DISTANCE
+
+
+def test_decode_accumulated_chained(accumulated_fit_file):
+    # Every chained fit file starts with new accumulators
+    fitfiles = decode(accumulated_fit_file + accumulated_fit_file)
+
+    for fitfile in fitfiles:
+        assert [
+            message.fields["distance"] for message in fitfile.data_messages["record"]
+        ] == EXPECTED_DISTANCE
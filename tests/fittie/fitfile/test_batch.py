@@ -0,0 +1,147 @@
+import pickle
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fittie.fitfile.batch import decode_many
+from fittie.fitfile.decode import decode, is_gil_enabled, resolve_executor
+from fittie.fitfile.utils.exceptions import DecodeException
+from tests.conftest import fitfile_fields
+
+FILENAMES = [
+    "fittie_chained_file.fit",
+    "fittie_developer_fields.fit",
+    "fittie_minimal_file.fit",
+    "fittie_monitoring_file.fit",
+    "fittie_settings_file.fit",
+]
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+@pytest.mark.parametrize("chunksize", [1, 2])
+def test_decode_many(data_dir, executor, chunksize):
+    paths = [data_dir / filename for filename in FILENAMES]
+
+    results = list(
+        decode_many(paths, workers=2, executor=executor, chunksize=chunksize)
+    )
+
+    assert [result.path for result in results] == paths
+    assert all(result.ok for result in results)
+
+    for result in results:
+        assert fitfile_fields(result.fitfiles) == fitfile_fields(decode(result.path))
+
+
+def test_decode_many_unordered(data_dir):
+    paths = [data_dir / filename for filename in FILENAMES]
+
+    results = list(decode_many(paths, workers=2, executor="thread", ordered=False))
+
+    assert sorted(result.path for result in results) == sorted(paths)
+
+
+def test_decode_many_options(data_dir):
+    paths = [data_dir / "fittie_developer_fields.fit"]
+
+    (result,) = decode_many(paths, workers=1, include=["record"])
+
+    assert result.fitfiles[0].available_message_types == ["record"]
+
+
+def test_decode_many_errors(data_dir, tmp_path):
+    content = (data_dir / "fittie_minimal_file.fit").read_bytes()
+    invalid_path = tmp_path / "invalid.fit"
+    # Corrupt the crc at the end of the file
+    invalid_path.write_bytes(content[:-1] + bytes([content[-1] ^ 0xFF]))
+    paths = [invalid_path, data_dir / "fittie_minimal_file.fit"]
+
+    results = list(decode_many(paths, workers=2))
+
+    assert [result.ok for result in results] == [False, True]
+    assert isinstance(results[0].error, DecodeException)
+    assert results[0].error.path == invalid_path
+    assert str(invalid_path) in str(results[0].error)
+    assert results[0].fitfiles == []
+
+
+def test_decode_many_other_errors(data_dir, tmp_path):
+    missing_path = tmp_path / "missing.fit"
+    paths = [missing_path, data_dir / "fittie_minimal_file.fit"]
+
+    results = list(decode_many(paths, workers=2, executor="thread"))
+
+    assert [result.ok for result in results] == [False, True]
+    assert isinstance(results[0].error, FileNotFoundError)
+
+
+def test_decode_many_unsupported(data_dir):
+    with pytest.raises(ValueError) as exc_info:
+        decode_many([], executor="bananas")
+
+    assert "unsupported executor 'bananas' received" in str(exc_info.value)
+
+    with pytest.raises(TypeError):
+        decode_many([], bananas=True)
+
+
+@pytest.mark.parametrize(
+    "gil_enabled, executor", [(True, "process"), (False, "thread")]
+)
+def test_resolve_executor(monkeypatch, gil_enabled, executor):
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: gil_enabled, raising=False)
+
+    assert is_gil_enabled() is gil_enabled
+    assert resolve_executor("auto") == executor
+    assert resolve_executor("process") == "process"
+
+
+def test_decode_many_auto_executor(data_dir, monkeypatch):
+    # Free-threaded builds decode in a thread pool, without pickling the results
+    monkeypatch.setattr(sys, "_is_gil_enabled", lambda: False, raising=False)
+    paths = [data_dir / filename for filename in FILENAMES]
+
+    results = list(decode_many(paths, workers=2))
+
+    assert all(result.ok for result in results)
+
+    # Decoded in this process, the definitions share the compiled plans
+    definitions = results[1].fitfiles[0].local_message_definitions
+    expected = decode(paths[1])[0].local_message_definitions
+
+    assert all(definitions[number].plan is expected[number].plan for number in expected)
+
+
+def test_threads_share_plans(data_dir):
+    # Threads decode with the shared plans, and the developer plans, projected plans
+    # and field names that are derived from them
+    path = data_dir / "fittie_developer_fields.fit"
+    names = ["bananas_traversed", "heart_rate", "power", "bananas"]
+    options = [{"fields": {"record": ["timestamp", name]}} for name in names] * 8
+    options += [{}, {"lazy": True}] * 8
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        fitfiles = list(executor.map(lambda kwargs: decode(path, **kwargs), options))
+
+    assert [fitfile_fields(decoded) for decoded in fitfiles] == [
+        fitfile_fields(decode(path, **kwargs)) for kwargs in options
+    ]
+
+
+def test_pickle_fitfile(data_dir):
+    fitfile = decode(data_dir / "fittie_developer_fields.fit")[0]
+
+    unpickled = pickle.loads(pickle.dumps(fitfile))
+
+    assert fitfile_fields([unpickled]) == fitfile_fields([fitfile])
+    assert unpickled.file_id == fitfile.file_id
+    assert unpickled.developer_data.keys() == fitfile.developer_data.keys()
+
+
+def test_pickle_decode_exception():
+    exception = DecodeException(detail="bananas", position=12, path="bananas.fit")
+
+    unpickled = pickle.loads(pickle.dumps(exception))
+
+    assert str(unpickled) == "bananas at position 12 in bananas.fit"
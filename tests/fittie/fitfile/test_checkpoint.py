@@ -0,0 +1,200 @@
+import pickle
+import struct
+from io import BytesIO
+
+import pytest
+
+from fittie.fitfile.checkpoint import Checkpoint
+from fittie.fitfile.crc import crc16
+from fittie.fitfile.decode import iter_messages
+from fittie.fitfile.push import FitPushParser, decode_appended
+from fittie.fitfile.utils.exceptions import DecodeException
+from tests.conftest import message_fields
+
+
+def _decode_in_parts(content: bytes, sizes: list[int], **kwargs) -> list:
+    messages: list = []
+    checkpoint = None
+
+    for size in sizes:
+        appended, checkpoint = decode_appended(content[:size], checkpoint, **kwargs)
+        messages.extend(appended)
+        # Checkpoints are stored between decodes
+        checkpoint = Checkpoint.from_bytes(checkpoint.to_bytes())
+
+    return messages
+
+
+@pytest.mark.parametrize(
+    "fixture",
+    [
+        "compressed_timestamp_fit_file",
+        "accumulated_fit_file",
+        "components_fit_file",
+    ],
+)
+def test_decode_appended(request, fixture):
+    content = request.getfixturevalue(fixture)
+    expected = message_fields(iter_messages(content))
+
+    for size in range(len(content)):
+        messages = _decode_in_parts(content, [size, len(content)])
+
+        assert message_fields(messages) == expected
+
+
+@pytest.mark.parametrize(
+    "file_name", ["fittie_chained_file.fit", "fittie_developer_fields.fit"]
+)
+def test_decode_appended_files(data_dir, file_name):
+    content = (data_dir / file_name).read_bytes()
+    sizes = list(range(0, len(content), 97)) + [len(content)]
+
+    assert message_fields(_decode_in_parts(content, sizes)) == message_fields(
+        iter_messages(content)
+    )
+
+
+def test_decode_appended_path(tmp_path, compressed_timestamp_fit_file):
+    path = tmp_path / "activity.fit"
+    path.write_bytes(compressed_timestamp_fit_file[:40])
+    messages, checkpoint = decode_appended(path, include=["record"])
+
+    with path.open("ab") as f:
+        f.write(compressed_timestamp_fit_file[40:])
+
+    appended, checkpoint = decode_appended(path, checkpoint, include=["record"])
+
+    assert message_fields(messages + appended) == message_fields(
+        iter_messages(compressed_timestamp_fit_file, include=["record"])
+    )
+    assert checkpoint.position == len(compressed_timestamp_fit_file)
+    assert decode_appended(path, checkpoint)[0] == []
+
+
+def test_decode_appended_updated_header(compressed_timestamp_fit_file):
+    content = compressed_timestamp_fit_file
+    data = content[12:-2]
+    # The file is recorded, the data size in the header is updated with every write
+    in_progress = struct.pack("<BBHI4s", 12, 0x20, 2158, 44, b".FIT") + data[:44]
+
+    messages, checkpoint = decode_appended(in_progress)
+
+    assert checkpoint.position == len(in_progress)
+
+    appended, checkpoint = decode_appended(content, checkpoint)
+
+    assert message_fields(messages + appended) == message_fields(iter_messages(content))
+    assert checkpoint.position == len(content)
+
+
+class CountingReader(BytesIO):
+    def __init__(self, value: bytes):
+        super().__init__(value)
+        self.read_size = 0
+
+    def read(self, size=-1):
+        value = super().read(size)
+        self.read_size += len(value)
+        return value
+
+
+def test_decode_appended_reads_only_appended_bytes(data_dir):
+    content = (data_dir / "fittie_monitoring_file.fit").read_bytes()
+    header_size = content[0]
+    data = content[header_size:-2]
+    messages: list = []
+    checkpoint = None
+
+    for size in range(0, len(data), 500):
+        # The data size in the header is updated with every write
+        header = bytearray(content[:header_size])
+        header[4:8] = struct.pack("<I", size)
+        header[12:14] = struct.pack("<H", crc16(header[:12]))
+        reader = CountingReader(bytes(header) + data[:size])
+        appended, next_checkpoint = decode_appended(reader, checkpoint)
+
+        if checkpoint is not None:
+            # Only the header and the bytes after the checkpoint are read
+            assert reader.read_size == header_size + len(reader.getvalue()) - (
+                checkpoint.position
+            )
+
+        messages += appended
+        checkpoint = next_checkpoint
+
+    appended, _ = decode_appended(content, checkpoint)
+
+    assert message_fields(messages + appended) == message_fields(iter_messages(content))
+
+
+def test_decode_appended_crc_mismatch(compressed_timestamp_fit_file):
+    content = bytearray(compressed_timestamp_fit_file)
+    _, checkpoint = decode_appended(bytes(content[:50]))
+    content[-1] ^= 0xFF
+
+    with pytest.raises(DecodeException, match="the calculated crc does not match"):
+        decode_appended(bytes(content), checkpoint)
+
+
+def test_decode_appended_shorter_file(compressed_timestamp_fit_file):
+    _, checkpoint = decode_appended(compressed_timestamp_fit_file[:50])
+
+    with pytest.raises(DecodeException, match="shorter than the checkpoint"):
+        decode_appended(compressed_timestamp_fit_file[:40], checkpoint)
+
+
+def test_checkpoint_is_a_copy(data_dir):
+    content = (data_dir / "fittie_developer_fields.fit").read_bytes()
+    parser = FitPushParser()
+    messages = parser.feed(content[:200])
+    checkpoint = parser.checkpoint()
+    developer_data = str(checkpoint.developer_data)
+
+    parser.feed(content[200:])
+    parser.close()
+
+    assert str(checkpoint.developer_data) == developer_data
+
+    resumed = FitPushParser.from_checkpoint(checkpoint)
+    messages += resumed.feed(content[checkpoint.position :])
+    resumed.close()
+
+    assert message_fields(messages) == message_fields(iter_messages(content))
+
+
+def test_checkpoint_pickle(accumulated_fit_file):
+    parser = FitPushParser()
+    # Up to and including the first record with an accumulated distance
+    messages = parser.feed(accumulated_fit_file[:80])
+    checkpoint = pickle.loads(pickle.dumps(parser.checkpoint()))
+
+    assert checkpoint.position == 80
+    assert checkpoint.timestamp == 1_000_000_001
+    assert len(checkpoint.accumulators) == 2
+
+    resumed = FitPushParser.from_checkpoint(checkpoint)
+    messages += resumed.feed(accumulated_fit_file[80:])
+
+    assert message_fields(messages) == message_fields(
+        iter_messages(accumulated_fit_file)
+    )
+
+
+def test_checkpoint_from_bytes_invalid():
+    with pytest.raises(ValueError, match="value is not a checkpoint"):
+        Checkpoint.from_bytes(b"not a checkpoint")
+
+    with pytest.raises(ValueError, match="value is not a checkpoint of version"):
+        Checkpoint.from_bytes(pickle.dumps((0, None)))
+
+
+def test_checkpoint_crc(compressed_timestamp_fit_file):
+    # The crc of the checkpoint is the crc of the records, without the header
+    parser = FitPushParser()
+    parser.feed(compressed_timestamp_fit_file[:50])
+    checkpoint = parser.checkpoint()
+
+    assert checkpoint.crc == crc16(
+        compressed_timestamp_fit_file[12 : checkpoint.position]
+    )
@@ -0,0 +1,79 @@
+import array
+
+import pytest
+
+from fittie.fitfile.columns import Column, MessageColumns
+
+
+def test_column_int():
+    column = Column("heart_rate")
+
+    for value in [120, None, 130]:
+        column.append(value)
+
+    assert column.typecode == "q"
+    assert column.values == array.array("q", [120, 0, 130])
+    assert column.valid == array.array("B", [1, 0, 1])
+    assert column.to_list() == [120, None, 130]
+
+
+def test_column_widen_to_float():
+    column = Column("speed")
+
+    for value in [1, None, 2.5]:
+        column.append(value)
+
+    assert column.typecode == "d"
+    assert column.to_list() == [1.0, None, 2.5]
+
+
+@pytest.mark.parametrize("value", ["bananas", [1, 2], 2**64 - 2])
+def test_column_widen_to_list(value):
+    column = Column("name")
+
+    for item in [1, None, value]:
+        column.append(item)
+
+    assert column.typecode is None
+    assert column.values == [1, None, value]
+    assert column.to_list() == [1, None, value]
+
+
+def test_message_columns_missing_fields():
+    columns = MessageColumns("record")
+
+    columns.append({"timestamp": 1, "heart_rate": 120})
+    columns.append({"timestamp": 2})
+    columns.append({"timestamp": 3, "cadence": 80})
+
+    assert len(columns) == 3
+    assert list(columns.keys()) == ["timestamp", "heart_rate", "cadence"]
+    assert all(len(columns[name]) == 3 for name in columns.keys())
+    assert columns["heart_rate"].to_list() == [120, None, None]
+    assert columns["cadence"].to_list() == [None, None, 80]
+    assert columns.row(1) == {"timestamp": 2, "heart_rate": None, "cadence": None}
+
+
+def test_message_columns_to_numpy():
+    numpy = pytest.importorskip("numpy")
+    columns = MessageColumns("record")
+
+    columns.append({"timestamp": 1, "speed": 1.5, "name": "a"})
+    columns.append({"timestamp": 2, "speed": None, "name": None})
+
+    values = columns.to_numpy()
+
+    assert values["timestamp"].dtype == numpy.int64
+    assert values["speed"].dtype == numpy.float64
+    assert values["name"].dtype == object
+    assert values["timestamp"].tolist() == [1, 2]
+    assert columns["speed"].valid_mask().tolist() == [True, False]
+
+
+def test_fitfile_columns(small_fitfile):
+    columns = small_fitfile.columns("record")
+
+    assert len(columns) == len(small_fitfile.get_messages_by_type("record"))
+
+    with pytest.raises(ValueError):
+        small_fitfile.columns("bananas")
@@ -0,0 +1,107 @@
+import pytest
+
+from fittie.fitfile.components import get_components_plan
+from fittie.fitfile.decode import decode
+from fittie.fitfile.decode_plan import compile_decode_plan
+from fittie.fitfile.field_definitions import FieldDefinition
+from fittie.fitfile.utils.endianness import Endianness
+from fittie.profile.base_types import BASE_TYPES
+from fittie.profile.util import get_message_profile
+
+
+def test_get_components_plan():
+    record = get_message_profile(20)
+    profile = record.fields[8]  # compressed_speed_distance
+    plan = get_components_plan(profile, record, 3, 8, 0xFF)
+
+    assert plan is get_components_plan(profile, record, 3, 8, 0xFF)
+    assert [
+        (component.name, component.shift, component.mask, component.scale)
+        for component in plan.components
+    ] == [("speed", 0, 0xFFF, 100), ("distance", 12, 0xFFF, 16)]
+    assert plan.components[1].accumulate
+
+    # Speed has a component itself
+    assert plan.components[0].components.components[0].name == "enhanced_speed"
+
+
+def test_get_components_plan_not_enough_bits():
+    record = get_message_profile(20)
+    plan = get_components_plan(record.fields[8], record, 2, 8, 0xFF)
+
+    assert [component.name for component in plan.components] == ["speed"]
+
+
+def test_components_plan_expand():
+    monitoring = get_message_profile(55)
+    plan = get_components_plan(monitoring.fields[24], monitoring, 1, 8, 0xFF)
+    expanded = {}
+
+    assert plan.source(0xFF) is None
+
+    plan.expand(plan.source(6 | 2 << 5), expanded)
+    assert expanded == {"activity_type": 6, "intensity": 2}
+
+
+def test_decode_plan_component_aliases():
+    plan = compile_decode_plan(
+        20,
+        Endianness.LITTLE,
+        [
+            FieldDefinition(number=6, size=2, base_type=BASE_TYPES[0x84]),  # speed
+            FieldDefinition(number=2, size=2, base_type=BASE_TYPES[0x84]),  # altitude
+            # compressed_speed_distance
+            FieldDefinition(number=8, size=3, base_type=BASE_TYPES[0x0D]),
+        ],
+    )
+    names = plan.decoded_names
+
+    # Speed and altitude have the same value as enhanced_speed and enhanced_altitude
+    assert [
+        (names[source], names[destination])
+        for source, destination in plan.component_aliases
+    ] == [("speed", "enhanced_speed"), ("altitude", "enhanced_altitude")]
+    assert [field.name for field, _ in plan.expanded_components] == [
+        "compressed_speed_distance"
+    ]
+
+
+def test_decode_components(components_fit_file):
+    fitfile = decode(components_fit_file)[0]
+    records = [message.fields for message in fitfile.data_messages["record"]]
+
+    assert records[0]["speed"] == 5.0
+    assert records[0]["enhanced_speed"] == 5.0
+    assert records[0]["altitude"] is None
+    assert records[0]["enhanced_altitude"] is None
+
+    # Speed and enhanced speed are expanded from compressed_speed_distance
+    assert records[1]["speed"] == 4.01
+    assert records[1]["enhanced_speed"] == 4.01
+    assert records[1]["altitude"] == pytest.approx(100.2)
+    assert records[1]["enhanced_altitude"] == pytest.approx(100.2)
+
+    monitoring = fitfile.data_messages["monitoring"][0].fields
+    assert monitoring["activity_type"] == 6
+    assert monitoring["intensity"] == 2
+
+    event = fitfile.data_messages["event"][0].fields
+    assert event["gear_change_data"] == 3 | 28 << 8 | 2 << 16 | 50 << 24
+    assert (
+        event["rear_gear_num"],
+        event["rear_gear"],
+        event["front_gear_num"],
+        event["front_gear"],
+    ) == (3, 28, 2, 50)
+
+
+def test_decode_components_projected(components_fit_file):
+    fitfile = decode(
+        components_fit_file,
+        fields={"record": ["enhanced_speed"], "event": ["rear_gear"]},
+    )[0]
+
+    assert [dict(message.fields) for message in fitfile.data_messages["record"]][
+        :2
+    ] == [{"enhanced_speed": 5.0}, {"enhanced_speed": 4.01}]
+    assert dict(fitfile.data_messages["event"][0].fields) == {"rear_gear": 28}
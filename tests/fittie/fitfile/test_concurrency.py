@@ -0,0 +1,92 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from fittie.fitfile.decode import decode
+from fittie.fitfile.fitfile import FitFile
+
+READERS = 8
+ROUNDS = 50
+
+
+@pytest.fixture(autouse=True)
+def switch_often():
+    # Switch threads as often as possible, to interleave the readers
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def _read(fitfile: FitFile) -> tuple:
+    return (
+        [message for message in fitfile],
+        [message for message in fitfile(message_type="record", fields=["heart_rate"])],
+        [
+            (message_type, dict(message.fields))
+            for message_type, message in fitfile.iter_messages(order="timestamp")
+        ],
+    )
+
+
+def _run_readers(function, *args) -> list:
+    with ThreadPoolExecutor(max_workers=READERS) as pool:
+        futures = [pool.submit(function, *args) for _ in range(READERS * ROUNDS)]
+        return [future.result() for future in futures]
+
+
+@pytest.mark.parametrize(
+    "file_name", ["fittie_gearshifts.fit", "fittie_chained_file.fit"]
+)
+def test_concurrent_iteration(data_dir, file_name):
+    fitfiles = decode(data_dir / file_name)
+    expected = [_read(fitfile) for fitfile in fitfiles]
+
+    for fitfile, expected_result in zip(fitfiles, expected):
+        assert _run_readers(_read, fitfile) == [expected_result] * READERS * ROUNDS
+
+
+def test_concurrent_lazy_fields(data_dir):
+    path = data_dir / "fittie_monitoring_file.fit"
+    expected = _read(decode(path)[0])
+
+    for _ in range(ROUNDS):
+        # Lazy messages are decoded on first access, by any of the readers
+        fitfile = decode(path, lazy=True)[0]
+
+        with ThreadPoolExecutor(max_workers=READERS) as pool:
+            futures = [pool.submit(_read, fitfile) for _ in range(READERS)]
+
+            assert [future.result() for future in futures] == [expected] * READERS
+
+
+def test_nested_iteration(compressed_timestamp_fit_file):
+    fitfile = decode(compressed_timestamp_fit_file)[0]
+    records = fitfile(message_type="record", fields=["timestamp"])
+
+    pairs = [
+        (outer["timestamp"], inner["timestamp"])
+        for outer in records
+        for inner in records
+    ]
+
+    assert len(pairs) == 25
+    # Every iteration has its own cursor
+    assert iter(fitfile) is not iter(fitfile)
+    assert [message.get("heart_rate") for message in fitfile] == [
+        message.get("heart_rate") for message in fitfile
+    ]
+
+
+def test_no_shared_class_attributes(small_fitfile):
+    other = FitFile(
+        header=small_fitfile.header,
+        data_messages={},
+        local_message_definitions={},
+        developer_data={},
+    )
+
+    assert "local_message_definitions" not in vars(FitFile)
+    assert "developer_data" not in vars(FitFile)
+    assert other.developer_data is not small_fitfile.developer_data
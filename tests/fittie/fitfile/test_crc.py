@@ -1,6 +1,14 @@
 import pytest
 
-from fittie.fitfile.crc import calculate_crc, apply_crc
+import random
+
+from fittie.fitfile.crc import (
+    BYTE_TABLE,
+    calculate_crc,
+    apply_crc,
+    crc16,
+    crc16_combine,
+)
 
 
 def test_calculate_crc():
@@ -18,3 +26,30 @@ def test_calculate_crc():
 )
 def test_apply_crc(crc, value, expected):
     assert apply_crc(crc, value) == expected
+
+
+def test_byte_table_matches_nibble_implementation():
+    assert BYTE_TABLE == tuple(apply_crc(0, byte) for byte in range(256))
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_crc16_matches_nibble_implementation(seed):
+    data = random.Random(seed).randbytes(4096)
+    expected = 0
+
+    for byte in data:
+        expected = apply_crc(expected, byte)
+
+    assert crc16(data) == expected
+    assert crc16(memoryview(data)) == expected
+    # Continue a crc over multiple chunks
+    assert crc16(data[1000:], crc16(data[:1000])) == expected
+
+
+@pytest.mark.parametrize("length", [0, 1, 2, 3, 255, 256, 4097, 100_000])
+def test_crc16_combine(length):
+    rng = random.Random(length)
+    first = rng.randbytes(50)
+    second = rng.randbytes(length)
+
+    assert crc16_combine(crc16(first), crc16(second), length) == crc16(first + second)
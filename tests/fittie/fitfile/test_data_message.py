@@ -1,10 +1,12 @@
 import copy
+import pickle
 from io import BytesIO
 
 import pytest
 
 from fittie.fitfile.data_message import (
     decode_data_message,
+    read_lazy_data_message,
     add_subfields_to_fields,
     apply_scale_and_offset,
 )
@@ -34,6 +36,79 @@ def test_decode_data_message(record_1_definition_message):
     }
 
 
+def test_decode_data_message_projected(record_1_definition_message):
+    header = RecordHeader(
+        is_definition_message=False,
+        is_developer_data=False,
+        is_compressed_timestamp_message=False,
+        local_message_type=0,
+    )
+    data = b"\x04\x0f\x00\x16\x00\xd2\x04\x00\x00(\xc6\n%"
+    plan = record_1_definition_message.plan.project(
+        frozenset({"serial_number", "garmin_product"})
+    )
+    data_message = decode_data_message(
+        header,
+        record_1_definition_message,
+        developer_data={},
+        data=BytesIO(data),
+        plan=plan,
+    )
+    assert data_message.fields == {"serial_number": 1234, "garmin_product": 22}
+
+
+def test_data_message_fields(record_1_definition_message):
+    header = RecordHeader(
+        is_definition_message=False,
+        is_developer_data=False,
+        is_compressed_timestamp_message=False,
+        local_message_type=0,
+    )
+    data = b"\x04\x0f\x00\x16\x00\xd2\x04\x00\x00(\xc6\n%"
+    first = decode_data_message(
+        header, record_1_definition_message, developer_data={}, data=BytesIO(data)
+    )
+    second = decode_data_message(
+        header, record_1_definition_message, developer_data={}, data=BytesIO(data)
+    )
+
+    # Field names are shared by the data messages of the same definition
+    assert first._field_names is second._field_names
+    assert list(first.fields) == list(first.fields.keys())
+    assert first.fields["serial_number"] == 1234
+    assert "garmin_product" in first.fields
+    assert first.fields.get("unknown") is None
+    assert len(first.fields) == 6
+
+    with pytest.raises(KeyError):
+        first.fields["unknown"]
+
+    unpickled = pickle.loads(pickle.dumps(first))
+    assert unpickled.fields == first.fields
+    assert unpickled.local_message_type == first.local_message_type
+
+
+def test_read_lazy_data_message(record_1_definition_message):
+    header = RecordHeader(
+        is_definition_message=False,
+        is_developer_data=False,
+        is_compressed_timestamp_message=False,
+        local_message_type=0,
+    )
+    data = b"\x04\x0f\x00\x16\x00\xd2\x04\x00\x00(\xc6\n%"
+    data_message = read_lazy_data_message(
+        header, record_1_definition_message, developer_data={}, data=BytesIO(data)
+    )
+    expected = decode_data_message(
+        header, record_1_definition_message, developer_data={}, data=BytesIO(data)
+    )
+
+    assert not data_message.is_decoded
+    assert data_message.get_field("serial_number") == 1234
+    assert data_message.is_decoded
+    assert data_message.fields == expected.fields
+
+
 def test_decode_data_message_with_developer_fields(record_5_definition_message):
     # Expect record 6
     header = RecordHeader(
@@ -80,6 +155,26 @@ def test_add_subfields_to_fields():
     assert fields["product"] == fields["garmin_product"]
 
 
+def test_add_subfields_to_fields_reference_value_zero():
+    # Event timer (0) resolves the timer_trigger subfield of event.data
+    fields = {"event": 0, "data": 1}
+    subfield_names = add_subfields_to_fields(
+        fields, copy.deepcopy(fields), get_message_profile(21).fields[3], []
+    )
+    assert subfield_names == ["timer_trigger"]
+    assert fields["timer_trigger"] == 1
+
+
+def test_add_subfields_to_fields_scaled():
+    # Battery level (11) has a scale of 1000
+    fields = {"event": 11, "data": 3700}
+    subfield_names = add_subfields_to_fields(
+        fields, copy.deepcopy(fields), get_message_profile(21).fields[3], []
+    )
+    assert subfield_names == ["battery_level"]
+    assert fields["battery_level"] == 3.7
+
+
 @pytest.mark.parametrize(
     "value,scale,offset,expected",
     [
@@ -2,7 +2,9 @@ from datetime import timezone
 
 import pytest
 
-from fittie import decode
+from fittie import decode, iter_messages
+from fittie.fitfile.decode import scan_fitfiles
+from fittie.fitfile.utils.datastream import DataStream
 
 
 def garmin_sdk_fitfile_names():
@@ -116,4 +118,216 @@ def test_chained_file(load_fit_file, data_dir):
 @pytest.mark.parametrize("file_name", garmin_sdk_fitfile_names(), ids=garmin_sdk_fitfile_names())
 def test_garmin_sdk_fitfile(file_name, data_dir):
     # Just check if we can decode them for now
-    assert decode(data_dir / "from_garmin_sdk" / file_name)
\ No newline at end of file
+    assert decode(data_dir / "from_garmin_sdk" / file_name)
+
+
+@pytest.mark.parametrize("wrap", [bytes, bytearray, memoryview])
+def test_decode_buffer(data_dir, wrap):
+    with open(data_dir / "fittie_chained_file.fit", "rb") as file:
+        content = file.read()
+
+    from_path = decode(data_dir / "fittie_chained_file.fit")
+    from_buffer = decode(wrap(content))
+
+    assert len(from_buffer) == len(from_path) == 2
+
+    for fitfile_buffer, fitfile_path in zip(from_buffer, from_path):
+        assert fitfile_buffer.available_message_types == (
+            fitfile_path.available_message_types
+        )
+        for message_type, messages in fitfile_path.data_messages.items():
+            assert [m.fields for m in fitfile_buffer.data_messages[message_type]] == [
+                m.fields for m in messages
+            ]
+
+
+def test_iter_messages(data_dir):
+    fitfiles = decode(data_dir / "fittie_chained_file.fit")
+    messages = list(iter_messages(data_dir / "fittie_chained_file.fit"))
+
+    assert {index for index, _, _ in messages} == {0, 1}
+
+    for index, fitfile in enumerate(fitfiles):
+        expected = [
+            (message_type, message.fields)
+            for message_type, type_messages in fitfile.data_messages.items()
+            for message in type_messages
+        ]
+        actual = [
+            (message_type, message.fields)
+            for fitfile_index, message_type, message in messages
+            if fitfile_index == index
+        ]
+        assert sorted(actual, key=repr) == sorted(expected, key=repr)
+
+
+def test_iter_messages_is_lazy(data_dir):
+    iterator = iter_messages(data_dir / "fittie_monitoring_file.fit")
+
+    fitfile_index, message_type, message = next(iterator)
+
+    assert fitfile_index == 0
+    assert message_type == "file_id"
+    assert message.fields["type"] == 32
+
+
+def test_decode_include(data_dir):
+    fitfiles = decode(data_dir / "fittie_developer_fields.fit", include=["record"])
+    fitfile = decode(data_dir / "fittie_developer_fields.fit")[0]
+
+    assert fitfiles[0].available_message_types == ["record"]
+    # Developer fields are still decoded, the field descriptions are always read
+    assert fitfiles[0].developer_data.keys() == fitfile.developer_data.keys()
+    assert [m.fields for m in fitfiles[0].data_messages["record"]] == [
+        m.fields for m in fitfile.data_messages["record"]
+    ]
+
+
+def test_decode_exclude(data_dir):
+    fitfile = decode(data_dir / "fittie_monitoring_file.fit")[0]
+    fitfiles = decode(
+        data_dir / "fittie_monitoring_file.fit",
+        exclude=["monitoring", "developer_data_id"],
+    )
+
+    assert fitfiles[0].available_message_types == [
+        message_type
+        for message_type in fitfile.available_message_types
+        if message_type not in ("monitoring", "developer_data_id")
+    ]
+
+
+@pytest.mark.parametrize("calculate_crc", [True, False])
+def test_decode_exclude_stream(data_dir, calculate_crc):
+    with open(data_dir / "fittie_chained_file.fit", "rb") as file:
+        fitfiles = decode(file, calculate_crc=calculate_crc, exclude=["file_id"])
+
+    assert len(fitfiles) == 2
+    assert all("file_id" not in f.available_message_types for f in fitfiles)
+
+
+def test_decode_include_unknown_message_type(data_dir):
+    with pytest.raises(ValueError) as exc_info:
+        decode(data_dir / "fittie_minimal_file.fit", include=["bananas"])
+
+    assert "unknown message type 'bananas' received" in str(exc_info.value)
+
+
+def test_decode_fields(data_dir):
+    fitfile = decode(data_dir / "fittie_developer_fields.fit")[0]
+    projected = decode(
+        data_dir / "fittie_developer_fields.fit",
+        fields={"record": ["timestamp", "bananas_traversed"], "file_id": ["type"]},
+    )[0]
+
+    assert projected.available_message_types == fitfile.available_message_types
+    assert [m.fields for m in projected.data_messages["file_id"]] == [{"type": 4}]
+    assert [m.fields for m in projected.data_messages["record"]] == [
+        {
+            "timestamp": m.fields["timestamp"],
+            "bananas_traversed": m.fields["bananas_traversed"],
+        }
+        for m in fitfile.data_messages["record"]
+    ]
+    assert [m.fields for m in projected.data_messages["developer_data_id"]] == [
+        m.fields for m in fitfile.data_messages["developer_data_id"]
+    ]
+
+
+def test_decode_columnar(data_dir):
+    fitfile = decode(data_dir / "fittie_developer_fields.fit")[0]
+    columnar = decode(data_dir / "fittie_developer_fields.fit", layout="columnar")[0]
+
+    assert columnar.data_messages == {}
+    assert columnar.available_message_types == fitfile.available_message_types
+    assert columnar.file_id == fitfile.file_id
+
+    for message_type in fitfile.available_message_types:
+        columns = columnar.columns(message_type)
+        messages = fitfile.data_messages[message_type]
+
+        assert len(columns) == len(messages)
+        assert [columns.row(i) for i in range(len(columns))] == [
+            {name: m.fields.get(name) for name in columns.keys()} for m in messages
+        ]
+
+
+def test_decode_unsupported_layout(data_dir):
+    with pytest.raises(ValueError) as exc_info:
+        decode(data_dir / "fittie_minimal_file.fit", layout="bananas")
+
+    assert "unsupported layout 'bananas' received" in str(exc_info.value)
+
+
+def test_scan_fitfiles(data_dir):
+    content = (data_dir / "fittie_chained_file.fit").read_bytes()
+
+    with DataStream(content + content[:20]) as data:
+        ranges = scan_fitfiles(data)
+
+    assert len(ranges) == 2
+    assert ranges[0][0] == 0
+    assert ranges[0][1] == ranges[1][0]
+    # The incomplete chained fit file at the end is left out
+    assert ranges[1][1] == len(content)
+
+
+@pytest.mark.parametrize("executor", ["process", "thread"])
+@pytest.mark.parametrize("source_type", ["path", "bytes", "file"])
+def test_decode_parallel(data_dir, executor, source_type):
+    path = data_dir / "fittie_chained_file.fit"
+    expected = decode(path)
+
+    if source_type == "path":
+        fitfiles = decode(path, workers=2, executor=executor)
+    elif source_type == "bytes":
+        fitfiles = decode(path.read_bytes(), workers=2, executor=executor)
+    else:
+        with open(path, "rb") as file:
+            fitfiles = decode(file, workers=2, executor=executor)
+
+    assert len(fitfiles) == len(expected) == 2
+
+    for fitfile, expected_fitfile in zip(fitfiles, expected, strict=True):
+        assert fitfile.header.data_size == expected_fitfile.header.data_size
+        assert {
+            message_type: [message.fields for message in messages]
+            for message_type, messages in fitfile.data_messages.items()
+        } == {
+            message_type: [message.fields for message in messages]
+            for message_type, messages in expected_fitfile.data_messages.items()
+        }
+
+
+def test_decode_unsupported_executor(data_dir):
+    with pytest.raises(ValueError) as exc_info:
+        decode(data_dir / "fittie_minimal_file.fit", workers=2, executor="bananas")
+
+    assert "unsupported executor 'bananas' received" in str(exc_info.value)
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "fittie_chained_file.fit",
+        "fittie_developer_fields.fit",
+        "fittie_monitoring_file.fit",
+        "fittie_settings_file.fit",
+    ],
+)
+def test_decode_lazy(data_dir, filename):
+    expected = decode(data_dir / filename)
+    fitfiles = decode(data_dir / filename, lazy=True)
+
+    for fitfile, expected_fitfile in zip(fitfiles, expected, strict=True):
+        records = fitfile.data_messages.get("record", [])
+
+        assert not any(message.is_decoded for message in records)
+        assert fitfile.file_id == expected_fitfile.file_id
+        assert {
+            message_type: [message.fields for message in messages]
+            for message_type, messages in fitfile.data_messages.items()
+        } == {
+            message_type: [message.fields for message in messages]
+            for message_type, messages in expected_fitfile.data_messages.items()
+        }
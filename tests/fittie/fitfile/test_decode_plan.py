@@ -0,0 +1,124 @@
+from fittie.fitfile.decode_plan import (
+    ARRAY,
+    DEVELOPER_PLAN_CACHE_SIZE,
+    PADDING,
+    SCALAR,
+    STRING,
+    _get_developer_plan,
+    compile_decode_plan,
+    compile_developer_plan,
+)
+from fittie.fitfile.field_definitions import FieldDefinition
+from fittie.fitfile.utils.endianness import Endianness
+from fittie.profile.base_types import BASE_TYPES
+
+
+def test_compile_decode_plan(record_1_definition_message):
+    plan = record_1_definition_message.plan
+
+    assert plan.struct.format == "<BHHII"
+    assert plan.size == 13
+    assert plan.message_name == "file_id"
+    assert [field.name for field in plan.fields] == [
+        "type",
+        "manufacturer",
+        "product",
+        "serial_number",
+        "time_created",
+    ]
+    assert [name for name, _ in plan.fields_with_subfields] == ["product"]
+
+
+def test_compile_decode_plan_arrays_and_strings():
+    plan = compile_decode_plan(
+        20,
+        Endianness.BIG,
+        [
+            FieldDefinition(number=8, size=3, base_type=BASE_TYPES[0x0D]),
+            FieldDefinition(number=3, size=5, base_type=BASE_TYPES[0x84]),
+            FieldDefinition(number=250, size=8, base_type=BASE_TYPES[0x07]),
+        ],
+    )
+
+    assert plan.struct.format == ">3B2H1x8s"
+    assert plan.size == 16
+    assert [(field.kind, field.index, field.count) for field in plan.fields] == [
+        (ARRAY, 0, 3),
+        (ARRAY, 3, 2),
+        (STRING, 5, 1),
+    ]
+    assert plan.fields[2].name == "record_unknown_field_250"
+
+
+def test_compile_decode_plan_field_smaller_than_base_type():
+    plan = compile_decode_plan(
+        20,
+        Endianness.LITTLE,
+        [
+            FieldDefinition(number=3, size=1, base_type=BASE_TYPES[0x84]),
+            FieldDefinition(number=4, size=1, base_type=BASE_TYPES[0x02]),
+        ],
+    )
+
+    assert plan.struct.format == "<1xB"
+    assert [field.name for field in plan.fields] == ["cadence"]
+    assert plan.fields[0].kind == SCALAR
+    assert all(field.kind != PADDING for field in plan.fields)
+
+
+def test_developer_plan_is_reused(record_1_definition_message):
+    plan = record_1_definition_message.plan
+    developer_fields = (("doughnuts_earned", 0, 4, BASE_TYPES[0x86]),)
+
+    developer_plan = plan.developer_plan(developer_fields)
+
+    assert developer_plan.struct.format == "<I"
+    assert plan.developer_plan(developer_fields) is developer_plan
+    assert (
+        compile_developer_plan(Endianness.LITTLE, developer_fields).struct.format
+        == "<I"
+    )
+
+
+def test_developer_plans_are_bounded(record_1_definition_message):
+    plan = record_1_definition_message.plan
+
+    for index in range(DEVELOPER_PLAN_CACHE_SIZE + 10):
+        plan.developer_plan(((f"field_{index}", 0, 4, BASE_TYPES[0x86]),))
+
+    assert _get_developer_plan.cache_info().currsize == DEVELOPER_PLAN_CACHE_SIZE
+
+
+def test_project_decode_plan(record_1_definition_message):
+    plan = record_1_definition_message.plan
+    projected = plan.project(frozenset({"time_created"}))
+
+    assert projected.struct.format == "<1x2x2x4xI"
+    assert projected.size == plan.size
+    assert [field.name for field in projected.fields] == ["time_created"]
+    assert projected.output_names is None
+    assert plan.project(frozenset({"time_created"})) is projected
+
+
+def test_project_decode_plan_unknown_names(record_1_definition_message):
+    plan = record_1_definition_message.plan
+    projected = plan.project(frozenset({"time_created", "bananas_traversed"}))
+
+    # Names that the plan can not decode do not create another projected plan
+    assert projected is plan.project(frozenset({"time_created"}))
+    assert projected.projection == frozenset({"time_created"})
+
+    # Unless they can be the names of developer fields
+    projected = plan.project(
+        frozenset({"time_created", "bananas_traversed"}), developer_fields=True
+    )
+
+    assert projected.projection == frozenset({"time_created", "bananas_traversed"})
+
+
+def test_project_decode_plan_subfield(record_1_definition_message):
+    projected = record_1_definition_message.plan.project(frozenset({"garmin_product"}))
+
+    # Product and the reference field of the garmin_product subfield are decoded
+    assert [field.name for field in projected.fields] == ["manufacturer", "product"]
+    assert projected.output_names == frozenset({"garmin_product"})
@@ -2,9 +2,13 @@ import pytest
 
 from io import BytesIO
 
+from fittie.fitfile.decode import decode
+from fittie.fitfile.decode_plan import _project_decode_plan
 from fittie.fitfile.utils.exceptions import DecodeException
 from fittie.fitfile.definition_message import (
+    clear_definition_cache,
     decode_definition_message,
+    definition_cache_info,
     DefinitionMessage,
 )
 from fittie.fitfile.field_definitions import DeveloperFieldDefinition
@@ -88,6 +92,63 @@ def test_decode_definition_message_invalid_reserved_bit():
     assert "received invalid data for a definition message" in str(excinfo.value)
 
 
+def test_decode_definition_message_cached():
+    header = RecordHeader(
+        is_definition_message=True,
+        is_compressed_timestamp_message=False,
+        is_developer_data=False,
+        local_message_type=0,
+    )
+    content = bytes([0, 0, 20, 0, 2, 253, 4, 134, 3, 1, 2])
+
+    clear_definition_cache()
+    first = decode_definition_message(header, BytesIO(content))
+    second = decode_definition_message(header, BytesIO(content))
+    cache_info = definition_cache_info()
+
+    assert cache_info.misses == 1
+    assert cache_info.hits == 1
+    assert first is not second
+    assert first.plan is second.plan
+    assert first.field_definitions == second.field_definitions
+    assert first.field_definitions is not second.field_definitions
+
+
+def test_cached_plans_do_not_grow(data_dir):
+    path = data_dir / "fittie_monitoring_file.fit"
+    decode(path, fields={"monitoring": ["heart_rate", "x0"]})
+    projections = _project_decode_plan.cache_info().currsize
+
+    for index in range(1, 50):
+        decode(path, fields={"monitoring": ["heart_rate", f"x{index}"]})
+
+    # Unknown names do not add projections of the shared plans
+    assert _project_decode_plan.cache_info().currsize == projections
+
+
+def test_decode_definition_message_invalid_field_definition():
+    header = RecordHeader(
+        is_definition_message=True,
+        is_compressed_timestamp_message=False,
+        is_developer_data=False,
+        local_message_type=0,
+    )
+    data = BytesIO(bytes([0, 0, 20, 0, 1, 255, 4, 134]))
+
+    with pytest.raises(DecodeException) as excinfo:
+        decode_definition_message(header, data)
+
+    assert excinfo.value.detail == "invalid field definition number received"
+    assert excinfo.value.position == 8
+
+    data = BytesIO(bytes([0, 0, 20, 0, 2, 253, 4, 134]))
+
+    with pytest.raises(DecodeException) as excinfo:
+        decode_definition_message(header, data)
+
+    assert "could not decode definition message" in str(excinfo.value)
+
+
 def test_get_developer_field_definition():
     developer_field_definition = DeveloperFieldDefinition(
         data_index=1, number=2, size=1
@@ -0,0 +1,162 @@
+from io import BytesIO
+
+import pytest
+
+from fittie.fitfile.decode import decode
+from fittie.fitfile.index import NO_TIMESTAMP, FitFileIndex, FitIndex, build_index
+from fittie.fitfile.utils.exceptions import DecodeException
+from tests.conftest import fitfile_fields
+
+TIMESTAMP = 1_000_000_000
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "fittie_chained_file.fit",
+        "fittie_developer_fields.fit",
+        "fittie_gearshifts.fit",
+        "fittie_monitoring_file.fit",
+    ],
+)
+def test_index_decode(data_dir, file_name):
+    path = data_dir / file_name
+    index = build_index(path)
+
+    assert len(index) == len(decode(path))
+    assert fitfile_fields(index.decode(path)) == fitfile_fields(decode(path))
+
+
+def test_build_index(compressed_timestamp_fit_file):
+    (fitfile,) = build_index(compressed_timestamp_fit_file).fitfiles
+
+    assert fitfile.start == 0
+    assert fitfile.end == len(compressed_timestamp_fit_file)
+    assert len(fitfile.definition_offsets) == 4
+    assert list(fitfile.message_numbers) == [0, 20, 20, 20, 20, 21, 20]
+    assert list(fitfile.local_types) == [0, 1, 2, 2, 2, 3, 2]
+    # Compressed timestamps are rolled over, the file_id has no timestamp
+    assert list(fitfile.timestamps) == [
+        NO_TIMESTAMP,
+        TIMESTAMP,
+        TIMESTAMP + 5,
+        TIMESTAMP + 20,
+        TIMESTAMP + 35,
+        TIMESTAMP + 40,
+        TIMESTAMP + 42,
+    ]
+    assert fitfile.first_timestamp == TIMESTAMP
+    assert fitfile.last_timestamp == TIMESTAMP + 42
+    assert fitfile.replayed() == []
+
+
+@pytest.mark.parametrize(
+    "message_numbers, start, end",
+    [
+        (None, None, None),
+        (None, TIMESTAMP + 2, None),
+        (frozenset([20]), None, None),
+        (frozenset([20]), None, TIMESTAMP + 3),
+        (frozenset([20, 21, 55]), TIMESTAMP + 1, TIMESTAMP + 4),
+        (frozenset([20]), TIMESTAMP, NO_TIMESTAMP + 1),
+    ],
+)
+def test_select(message_numbers, start, end):
+    fitfile = FitFileIndex(0)
+    # Timestamps are not in file order, e.g. after a time correction
+    messages = [(0, None), (20, 3), (20, 1), (21, 2), (20, None), (20, 1), (21, 4)]
+
+    for offset, (message_number, timestamp) in enumerate(messages):
+        fitfile.append_message(offset, message_number, 0, timestamp, 0)
+
+    def expected(position):
+        number, timestamp = messages[position]
+
+        if message_numbers is not None and number not in message_numbers:
+            return False
+
+        if start is None and end is None:
+            return True
+
+        return timestamp is not None and (start or 0) <= timestamp < (end or 1 << 32)
+
+    assert fitfile.select(message_numbers, start, end) == [
+        position for position in range(len(messages)) if expected(position)
+    ]
+
+
+def test_index_decode_time_range(compressed_timestamp_fit_file):
+    index = build_index(compressed_timestamp_fit_file)
+    (fitfile,) = index.decode(
+        compressed_timestamp_fit_file,
+        include=["record"],
+        start=TIMESTAMP + 20,
+        end=TIMESTAMP + 42,
+    )
+
+    assert list(fitfile.data_messages) == ["record"]
+    assert [
+        (message.fields["timestamp"], message.fields["heart_rate"])
+        for message in fitfile.data_messages["record"]
+    ] == [(TIMESTAMP + 20, 102), (TIMESTAMP + 35, 103)]
+
+
+def test_index_iter_messages(compressed_timestamp_fit_file):
+    index = build_index(compressed_timestamp_fit_file)
+    messages = index.iter_messages(
+        BytesIO(compressed_timestamp_fit_file), start=TIMESTAMP + 40, lazy=True
+    )
+
+    assert [
+        (fitfile_index, message_type, message.fields["timestamp"])
+        for fitfile_index, message_type, message in messages
+    ] == [(0, "event", TIMESTAMP + 40), (0, "record", TIMESTAMP + 42)]
+
+
+def test_index_decode_accumulated(accumulated_fit_file):
+    index = build_index(accumulated_fit_file)
+    # Only the last records, the accumulated distance depends on the previous records
+    (fitfile,) = index.decode(
+        accumulated_fit_file, include=["record"], start=TIMESTAMP + 2
+    )
+
+    assert [
+        message.fields["distance"] for message in fitfile.data_messages["record"]
+    ] == [292.5, None]
+    assert index.fitfiles[0].replayed() == [1, 2, 3, 4]
+
+
+def test_index_save_and_load(tmp_path, data_dir):
+    path = data_dir / "fittie_chained_file.fit"
+    index = build_index(path)
+    index.save(tmp_path / "fittie_chained_file.fit.idx")
+
+    loaded = FitIndex.load(tmp_path / "fittie_chained_file.fit.idx")
+
+    assert len(loaded) == len(index)
+
+    for loaded_fitfile, fitfile in zip(loaded.fitfiles, index.fitfiles):
+        assert (loaded_fitfile.start, loaded_fitfile.end, loaded_fitfile.crc) == (
+            fitfile.start,
+            fitfile.end,
+            fitfile.crc,
+        )
+        assert loaded_fitfile.offsets == fitfile.offsets
+        assert loaded_fitfile.timestamps == fitfile.timestamps
+        assert loaded_fitfile.definitions == fitfile.definitions
+
+    assert fitfile_fields(loaded.decode(path)) == fitfile_fields(decode(path))
+
+
+def test_index_load_invalid(tmp_path):
+    (tmp_path / "invalid.idx").write_bytes(b"not an index")
+
+    with pytest.raises(ValueError, match="is not a fit index"):
+        FitIndex.load(tmp_path / "invalid.idx")
+
+
+def test_index_decode_other_file(accumulated_fit_file, compressed_timestamp_fit_file):
+    index = build_index(accumulated_fit_file)
+
+    with pytest.raises(DecodeException, match="the index does not match"):
+        index.decode(compressed_timestamp_fit_file)
@@ -1,7 +1,14 @@
+import pickle
+from array import array
 from unittest import mock
 from functools import cached_property
 
-from fittie.fitfile.fitfile import _IterableMixin  # noqa
+import pytest
+
+from fittie.fitfile.data_message import DataMessage
+from fittie.fitfile.decode import decode
+from fittie.fitfile.fitfile import FitFile, _IterableMixin  # noqa
+from fittie.fitfile.records import RecordHeader
 
 
 class Message:
@@ -77,3 +84,101 @@ def test_iterable_fitfile_filtered_messages_and_fields(small_fitfile):
         "speed": 3765,
         "timestamp": 1046114799,
     }
+
+
+def _message(**fields):
+    header = RecordHeader(
+        is_definition_message=False,
+        is_developer_data=False,
+        local_message_type=0,
+        is_compressed_timestamp_message=False,
+    )
+
+    return DataMessage(header=header, fields=fields)
+
+
+@pytest.fixture
+def interleaved_fitfile(small_fitfile):
+    # The event is written after the second record, with an earlier timestamp
+    return FitFile(
+        header=small_fitfile.header,
+        data_messages={
+            "record": [
+                _message(timestamp=10, heart_rate=100),
+                _message(timestamp=20, heart_rate=101),
+                _message(heart_rate=102),
+                _message(timestamp=30, heart_rate=103),
+            ],
+            "event": [_message(timestamp=15, event=0)],
+        },
+        local_message_definitions={},
+        developer_data={},
+        sequence_numbers={
+            "record": array("I", [0, 1, 3, 4]),
+            "event": array("I", [2]),
+        },
+    )
+
+
+def _summary(messages):
+    return [
+        (message_type, message.fields.get("timestamp"))
+        for message_type, message in messages
+    ]
+
+
+def test_iter_messages_file_order(interleaved_fitfile):
+    assert _summary(interleaved_fitfile.iter_messages()) == [
+        ("record", 10),
+        ("record", 20),
+        ("event", 15),
+        ("record", None),
+        ("record", 30),
+    ]
+    # Direct iteration is in file order too
+    assert [message.get("timestamp") for message in interleaved_fitfile] == [
+        10,
+        20,
+        15,
+        None,
+        30,
+    ]
+
+
+def test_iter_messages_timestamp_order(interleaved_fitfile):
+    # The record without a timestamp stays after the previous record
+    assert _summary(interleaved_fitfile.iter_messages(order="timestamp")) == [
+        ("record", 10),
+        ("event", 15),
+        ("record", 20),
+        ("record", None),
+        ("record", 30),
+    ]
+
+
+def test_iter_messages_type_order(interleaved_fitfile):
+    assert _summary(
+        interleaved_fitfile.iter_messages(order="type", message_types=["event", "lap"])
+    ) == [("event", 15)]
+    assert [
+        message_type for message_type, _ in interleaved_fitfile.iter_messages("type")
+    ] == ["record"] * 4 + ["event"]
+
+
+def test_iter_messages_invalid_order(interleaved_fitfile):
+    with pytest.raises(ValueError, match="unsupported order"):
+        list(interleaved_fitfile.iter_messages(order="random"))
+
+
+def test_iter_messages_decoded(compressed_timestamp_fit_file):
+    fitfile = pickle.loads(pickle.dumps(decode(compressed_timestamp_fit_file)[0]))
+
+    assert [message_type for message_type, _ in fitfile.iter_messages()] == [
+        "file_id",
+        "record",
+        "record",
+        "record",
+        "record",
+        "event",
+        "record",
+    ]
@@ -0,0 +1,111 @@
+import pytest
+
+from fittie.fitfile.decode import iter_messages
+from fittie.fitfile.push import FitPushParser
+from fittie.fitfile.utils.exceptions import DecodeException
+from tests.conftest import message_fields
+
+
+def _push(content: bytes, chunk_size: int, **kwargs) -> list:
+    parser = FitPushParser(**kwargs)
+    messages = []
+
+    for start in range(0, len(content), chunk_size):
+        messages.extend(parser.feed(content[start : start + chunk_size]))
+
+    parser.close()
+
+    assert parser.position == len(content)
+
+    return messages
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    [
+        "fittie_chained_file.fit",
+        "fittie_developer_fields.fit",
+        "fittie_gearshifts.fit",
+        "fittie_monitoring_file.fit",
+    ],
+)
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_push_parser(data_dir, file_name, chunk_size):
+    content = (data_dir / file_name).read_bytes()
+
+    assert message_fields(_push(content, chunk_size)) == message_fields(
+        iter_messages(content)
+    )
+
+
+@pytest.mark.parametrize(
+    "fixture", ["compressed_timestamp_fit_file", "accumulated_fit_file"]
+)
+def test_push_parser_state(request, fixture):
+    content = request.getfixturevalue(fixture)
+
+    assert message_fields(_push(content, 1)) == message_fields(iter_messages(content))
+
+
+def test_push_parser_filters(compressed_timestamp_fit_file):
+    kwargs = {"include": ["record"], "fields": {"record": ["timestamp"]}, "lazy": True}
+    messages = _push(compressed_timestamp_fit_file, 3, **kwargs)
+
+    assert message_fields(messages) == message_fields(
+        iter_messages(compressed_timestamp_fit_file, **kwargs)
+    )
+
+
+def test_push_parser_emits_complete_messages(compressed_timestamp_fit_file):
+    parser = FitPushParser()
+    header_size = compressed_timestamp_fit_file[0]
+
+    # Only the header and the first byte of the first definition message
+    assert parser.feed(compressed_timestamp_fit_file[: header_size + 1]) == []
+    assert parser.header is not None
+    assert parser.position == header_size
+
+    messages = parser.feed(compressed_timestamp_fit_file[header_size + 1 :])
+
+    assert [message_type for _, message_type, _ in messages] == [
+        "file_id",
+        "record",
+        "record",
+        "record",
+        "record",
+        "event",
+        "record",
+    ]
+
+
+def test_push_parser_crc_mismatch(compressed_timestamp_fit_file):
+    content = bytearray(compressed_timestamp_fit_file)
+    content[-1] ^= 0xFF
+    parser = FitPushParser()
+
+    with pytest.raises(DecodeException, match="the calculated crc does not match"):
+        parser.feed(content)
+
+    assert len(_push(bytes(content), 5, calculate_crc=False)) == 7
+
+
+def test_push_parser_incomplete(compressed_timestamp_fit_file):
+    parser = FitPushParser()
+    parser.feed(compressed_timestamp_fit_file[:-1])
+
+    with pytest.raises(DecodeException, match="the fit file is not complete"):
+        parser.close()
+
+    with pytest.raises(ValueError, match="can not feed a closed parser"):
+        parser.feed(compressed_timestamp_fit_file[-1:])
+
+
+def test_push_parser_missing_definition(compressed_timestamp_fit_file):
+    header_size = compressed_timestamp_fit_file[0]
+    parser = FitPushParser()
+
+    # A data message of local message type 5, without a definition message
+    with pytest.raises(DecodeException, match="did not receive local message") as exc:
+        parser.feed(compressed_timestamp_fit_file[:header_size] + b"\x05\x00")
+
+    assert exc.value.position == header_size + 1
@@ -31,3 +31,10 @@ def test_record_header() -> None:
     assert not header.local_message_type == 1
     assert not header.is_developer_data
     assert header.is_compressed_timestamp_message
+
+
+def test_record_header_is_shared() -> None:
+    first = read_record_header(BytesIO(b"\x41"))
+    second = read_record_header(BytesIO(b"\x41"))
+
+    assert first is second
@@ -0,0 +1,20 @@
+from fittie.fitfile.subfields import get_subfield_table
+from fittie.profile.util import get_message_profile
+
+
+def test_get_subfield_table():
+    profile = get_message_profile(0).fields[2]  # file_id.product
+    table = get_subfield_table(profile)
+
+    assert table is get_subfield_table(profile)
+    assert table.field_name == "product"
+    assert [name for name, _ in table.references] == ["manufacturer"]
+
+    lookup = dict(table.references)["manufacturer"]
+    assert [subfield.name for subfield in lookup[1]] == ["garmin_product"]
+    assert 0xFFFF not in lookup
+
+
+def test_get_subfield_table_without_subfields():
+    assert get_subfield_table(None) is None
+    assert get_subfield_table(get_message_profile(0).fields[0]) is None
@@ -0,0 +1,94 @@
+import pytest
+
+from fittie.fitfile.decode import decode, iter_messages
+from fittie.fitfile.records import RECORD_HEADERS
+from fittie.fitfile.timestamps import TimestampTracker
+from fittie.fitfile.utils.exceptions import DecodeException
+
+TIMESTAMP = 1_000_000_000
+EXPECTED_RECORDS = [
+    (TIMESTAMP, 100),
+    (TIMESTAMP + 5, 101),
+    (TIMESTAMP + 20, 102),
+    # Rolled over
+    (TIMESTAMP + 35, 103),
+    (TIMESTAMP + 42, 104),
+]
+
+
+def test_compressed_timestamp_record_header():
+    record_header = RECORD_HEADERS[0x80 | 3 << 5 | 31]
+
+    assert record_header.is_compressed_timestamp_message
+    assert record_header.local_message_type == 3
+    assert record_header.time_offset == 31
+
+
+def test_timestamp_tracker():
+    timestamps = TimestampTracker()
+
+    assert timestamps.rollover(5) is None
+
+    timestamps.timestamp = 0x3B
+    assert timestamps.rollover(0b11101) == 0x3D
+    assert timestamps.rollover(0b00010) == 0x42
+    assert timestamps.timestamp == 0x42
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_decode_compressed_timestamps(compressed_timestamp_fit_file, lazy):
+    fitfile = decode(compressed_timestamp_fit_file, lazy=lazy)[0]
+
+    assert [
+        (message.fields["timestamp"], message.fields["heart_rate"])
+        for message in fitfile.data_messages["record"]
+    ] == EXPECTED_RECORDS
+
+
+def test_decode_compressed_timestamps_columnar(compressed_timestamp_fit_file):
+    records = decode(compressed_timestamp_fit_file, layout="columnar")[0].columns(
+        "record"
+    )
+
+    assert records["timestamp"].to_list() == [
+        timestamp for timestamp, _ in EXPECTED_RECORDS
+    ]
+
+
+def test_decode_compressed_timestamps_excluded(compressed_timestamp_fit_file):
+    # The timestamp of the skipped event is still used
+    fitfile = decode(compressed_timestamp_fit_file, include=["record"])[0]
+
+    assert fitfile.data_messages["record"][-1].fields["timestamp"] == TIMESTAMP + 42
+
+
+def test_decode_compressed_timestamps_projected(compressed_timestamp_fit_file):
+    fitfile = decode(compressed_timestamp_fit_file, fields={"record": ["heart_rate"]})[
+        0
+    ]
+
+    assert [dict(message.fields) for message in fitfile.data_messages["record"]] == [
+        {"heart_rate": heart_rate} for _, heart_rate in EXPECTED_RECORDS
+    ]
+
+
+def test_iter_messages_compressed_timestamps(compressed_timestamp_fit_file):
+    timestamps = [
+        message.fields["timestamp"]
+        for _, message_type, message in iter_messages(compressed_timestamp_fit_file)
+        if message_type == "record"
+    ]
+
+    assert timestamps == [timestamp for timestamp, _ in EXPECTED_RECORDS]
+
+
+def test_decode_compressed_timestamp_without_timestamp(compressed_timestamp_fit_file):
+    # Leave out the first record, the first compressed timestamp has no timestamp
+    start = compressed_timestamp_fit_file.index(b"\x01\x00\xca\x9a\x3b")
+    content = (
+        compressed_timestamp_fit_file[:start]
+        + compressed_timestamp_fit_file[start + 6 : -2]
+    )
+
+    with pytest.raises(DecodeException, match="compressed timestamp header"):
+        decode(content, calculate_crc=False)
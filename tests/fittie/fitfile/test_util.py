@@ -23,6 +23,9 @@ def test_rollover_timestamp():
 
     assert rollover_timestamp(resultant_timestamp, 0b00001) == 0x61
 
+    # The offset is compared with the 5 least significant bits of the timestamp
+    assert rollover_timestamp(0x3D, 0b10000) == 0x50
+
 
 def test_datetime_from_timestamp():
     assert datetime_from_timestamp(1046114793) == datetime(
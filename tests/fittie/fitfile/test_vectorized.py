@@ -0,0 +1,104 @@
+import pytest
+
+from fittie.fitfile.decode import decode
+from fittie.fitfile.vectorized import decode_vectorized
+
+numpy = pytest.importorskip("numpy")
+
+
+def assert_same_columns(fitfiles, expected_fitfiles):
+    assert len(fitfiles) == len(expected_fitfiles)
+
+    for fitfile, expected in zip(fitfiles, expected_fitfiles, strict=True):
+        assert fitfile.data_messages == {}
+        assert fitfile.available_message_types == expected.available_message_types
+
+        for message_type in expected.available_message_types:
+            columns = fitfile.columns(message_type)
+            expected_columns = expected.columns(message_type)
+
+            assert len(columns) == len(expected_columns)
+            assert list(columns.keys()) == list(expected_columns.keys())
+
+            for name in expected_columns.keys():
+                assert columns[name].typecode == expected_columns[name].typecode
+                assert columns[name].values == expected_columns[name].values
+                assert columns[name].valid == expected_columns[name].valid
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "fittie_chained_file.fit",
+        "fittie_developer_fields.fit",
+        "fittie_gearshifts.fit",
+        "fittie_minimal_file.fit",
+        "fittie_monitoring_file.fit",
+        "fittie_settings_file.fit",
+    ],
+)
+def test_decode_vectorized(data_dir, filename):
+    assert_same_columns(
+        decode_vectorized(data_dir / filename),
+        decode(data_dir / filename, layout="columnar"),
+    )
+
+
+def test_decode_vectorized_stream(data_dir):
+    with open(data_dir / "fittie_chained_file.fit", "rb") as file:
+        fitfiles = decode_vectorized(file)
+
+    assert_same_columns(
+        fitfiles, decode(data_dir / "fittie_chained_file.fit", layout="columnar")
+    )
+
+
+def test_decode_vectorized_options(data_dir):
+    options = {
+        "exclude": ["file_id"],
+        "fields": {"record": ["timestamp", "bananas_traversed"]},
+    }
+
+    assert_same_columns(
+        decode_vectorized(data_dir / "fittie_developer_fields.fit", **options),
+        decode(data_dir / "fittie_developer_fields.fit", layout="columnar", **options),
+    )
+
+
+def test_decode_vectorized_numpy_columns(data_dir):
+    fitfile = decode_vectorized(data_dir / "fittie_monitoring_file.fit")[0]
+    expected = decode(data_dir / "fittie_monitoring_file.fit")[0]
+    columns = fitfile.columns("monitoring")
+
+    assert columns["timestamp"].to_numpy().tolist() == [
+        m.fields["timestamp"] for m in expected.data_messages["monitoring"]
+    ]
+    assert columns["timestamp"].valid_mask().all()
+
+
+def test_decode_vectorized_components(components_fit_file):
+    assert_same_columns(
+        decode_vectorized(components_fit_file),
+        decode(components_fit_file, layout="columnar"),
+    )
+
+    options = {"fields": {"record": ["enhanced_speed", "altitude"]}}
+    assert_same_columns(
+        decode_vectorized(components_fit_file, **options),
+        decode(components_fit_file, layout="columnar", **options),
+    )
+
+
+def test_decode_vectorized_accumulated(accumulated_fit_file):
+    # Messages with accumulated components are decoded in order while scanning
+    assert_same_columns(
+        decode_vectorized(accumulated_fit_file),
+        decode(accumulated_fit_file, layout="columnar"),
+    )
+
+
+def test_decode_vectorized_compressed_timestamps(compressed_timestamp_fit_file):
+    assert_same_columns(
+        decode_vectorized(compressed_timestamp_fit_file),
+        decode(compressed_timestamp_fit_file, layout="columnar"),
+    )
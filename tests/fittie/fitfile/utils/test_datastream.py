@@ -1,11 +1,12 @@
 import io
+import struct
 from unittest.mock import patch
 
 import pytest
 import tempfile
 
 from fittie.fitfile.utils.datastream import DataStream
-from fittie.fitfile.crc import apply_crc
+from fittie.fitfile.crc import crc16
 
 
 def test_datastream_file():
@@ -43,24 +44,84 @@ def test_datastream_streamable():
 
 def test_datastream_invalid_value():
     with pytest.raises(ValueError) as exc_info:
-        DataStream(bytes([1, 2, 3]))
+        DataStream(123)
 
-    assert "unsupported value received as stream input: <class 'bytes'>" in str(
+    assert "unsupported value received as stream input: <class 'int'>" in str(
         exc_info.value
     )
 
 
+@pytest.mark.parametrize(
+    "value", [b"\x01\x02\x03", bytearray(b"\x01\x02\x03"), memoryview(b"\x01\x02\x03")]
+)
+def test_datastream_buffer(value):
+    datastream = DataStream(value)
+    assert datastream.is_buffered
+
+    assert datastream.read(1) == b"\x01"
+    assert datastream.unpack(struct.Struct("<H")) == (0x0302,)
+    assert datastream.tell() == 3
+
+    with pytest.raises(EOFError):
+        datastream.read(1)
+
+    with pytest.raises(EOFError):
+        datastream.unpack(struct.Struct("B"))
+
+    assert datastream.tell() == 3
+
+
+def test_datastream_buffer_crc():
+    data = bytes(range(256)) * 4
+    datastream = DataStream(data)
+    datastream.read(100)
+    datastream.unpack(struct.Struct("100B"))
+
+    assert datastream.calculated_crc == crc16(data[:200])
+
+    datastream.reset_crc()
+    datastream.read(10)
+
+    assert datastream.calculated_crc == crc16(data[200:210])
+
+
+def test_datastream_path_is_memory_mapped():
+    with tempfile.NamedTemporaryFile("wb") as file:
+        file.write(b"\x01\x02\x03")
+        file.flush()
+
+        with DataStream(file.name) as datastream:
+            assert datastream.is_buffered
+            assert datastream.unpack(struct.Struct("3B")) == (1, 2, 3)
+            assert datastream.calculated_crc == crc16(b"\x01\x02\x03")
+
+        # Position is still available after the memory map is closed
+        assert datastream.tell() == 3
+
+
+def test_datastream_empty_path_falls_back_to_stream():
+    with tempfile.NamedTemporaryFile("wb") as file:
+        with DataStream(file.name) as datastream:
+            assert not datastream.is_buffered
+
+            with pytest.raises(EOFError):
+                datastream.read(1)
+
+
 def test_datastream_crc():
     datastream = DataStream(io.BytesIO(b"123"))
     assert datastream.calculated_crc == 0
 
     with patch(
-        "fittie.fitfile.utils.datastream.apply_crc", side_effect=apply_crc
-    ) as patched_apply_crc:
+        "fittie.fitfile.utils.datastream.crc16", side_effect=crc16
+    ) as patched_crc16:
         datastream.read()
+        datastream.read(2)
 
-    assert datastream.calculated_crc != 0
-    patched_apply_crc.assert_called_once()
+        assert datastream.calculated_crc != 0
+
+    # Pending bytes are added to the crc in a single pass
+    patched_crc16.assert_called_once_with(b"123", 0)
 
 
 def test_datastream_crc__crc_disabled():
@@ -69,9 +130,59 @@ def test_datastream_crc__crc_disabled():
     assert datastream.calculated_crc == 0
 
     with patch(
-        "fittie.fitfile.utils.datastream.apply_crc", side_effect=apply_crc
-    ) as patched_apply_crc:
+        "fittie.fitfile.utils.datastream.crc16", side_effect=crc16
+    ) as patched_crc16:
         datastream.read()
 
-    assert datastream.calculated_crc == 0
-    patched_apply_crc.assert_not_called()
+        assert datastream.calculated_crc == 0
+
+    patched_crc16.assert_not_called()
+
+
+def test_datastream_crc__large_read():
+    data = bytes(range(256)) * 1024
+    datastream = DataStream(io.BytesIO(data))
+
+    for _ in range(4):
+        datastream.read(len(data) // 4)
+
+    assert datastream.calculated_crc == crc16(data)
+
+
+def test_datastream_eof__crc_disabled():
+    datastream = DataStream(io.BytesIO(b"123"))
+    datastream.should_calculate_crc = False
+
+    with pytest.raises(EOFError):
+        datastream.read(4)
+
+
+@pytest.mark.parametrize("value", [b"\x01\x02\x03", io.BytesIO(b"\x01\x02\x03")])
+def test_datastream_skip(value):
+    datastream = DataStream(value)
+    datastream.skip(2)
+
+    assert datastream.tell() == 2
+    assert datastream.read(1) == b"\x03"
+    # Skipped bytes are part of the crc
+    assert datastream.calculated_crc == crc16(b"\x01\x02\x03")
+
+    with pytest.raises(EOFError):
+        datastream.skip(1)
+
+
+@pytest.mark.parametrize("value", [b"\x01\x02\x03", io.BytesIO(b"\x01\x02\x03")])
+def test_datastream_seek(value):
+    datastream = DataStream(value)
+    datastream.read(3)
+    datastream.seek(1)
+
+    assert datastream.tell() == 1
+    assert datastream.read(1) == b"\x02"
+    # The crc starts over at the new position
+    assert datastream.calculated_crc == crc16(b"\x02")
+
+
+def test_datastream_seek__eof():
+    with pytest.raises(EOFError):
+        DataStream(b"\x01\x02\x03").seek(4)
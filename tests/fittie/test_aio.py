@@ -0,0 +1,177 @@
+import asyncio
+import struct
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from fittie import aio
+from fittie.fitfile.crc import crc16
+from fittie.fitfile.decode import decode, iter_messages
+from fittie.fitfile.utils.exceptions import DecodeException
+from tests.conftest import message_fields
+
+
+def _fitfile_fields(fitfiles):
+    return [
+        (
+            fitfile.header.data_size,
+            {
+                message_type: [dict(message.fields) for message in messages]
+                for message_type, messages in fitfile.data_messages.items()
+            },
+            dict(fitfile.sequence_numbers),
+        )
+        for fitfile in fitfiles
+    ]
+
+
+async def _iter_bytes(content: bytes, chunk_size: int, consumed: list[int]):
+    for start in range(0, len(content), chunk_size):
+        consumed.append(start)
+        yield content[start : start + chunk_size]
+
+
+async def _collect(source, **kwargs) -> list:
+    return [message async for message in aio.iter_messages(source, **kwargs)]
+
+
+def _stream_reader(content: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(content)
+    reader.feed_eof()
+    return reader
+
+
+@pytest.mark.parametrize(
+    "file_name", ["fittie_chained_file.fit", "fittie_developer_fields.fit"]
+)
+def test_iter_messages_stream_reader(data_dir, file_name):
+    content = (data_dir / file_name).read_bytes()
+
+    async def run():
+        return await _collect(_stream_reader(content), chunk_size=100)
+
+    assert message_fields(asyncio.run(run())) == message_fields(iter_messages(content))
+
+
+def test_iter_messages_async_iterable(compressed_timestamp_fit_file):
+    async def run():
+        return await _collect(
+            _iter_bytes(compressed_timestamp_fit_file, 1000, []),
+            include=["record"],
+            chunk_size=3,
+        )
+
+    assert message_fields(asyncio.run(run())) == message_fields(
+        iter_messages(compressed_timestamp_fit_file, include=["record"])
+    )
+
+
+def test_iter_messages_backpressure(data_dir):
+    content = (data_dir / "fittie_monitoring_file.fit").read_bytes()
+    consumed: list[int] = []
+
+    async def run():
+        messages = aio.iter_messages(_iter_bytes(content, 256, consumed))
+        await messages.__anext__()
+        await messages.aclose()
+
+    asyncio.run(run())
+
+    # Only the chunks that are needed for the first data message are read
+    assert consumed == [0]
+
+
+def test_iter_messages_executor(data_dir):
+    content = (data_dir / "fittie_gearshifts.fit").read_bytes()
+
+    async def run():
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return await _collect(_stream_reader(content), executor=executor)
+
+    assert message_fields(asyncio.run(run())) == message_fields(iter_messages(content))
+
+
+def test_iter_messages_process_pool(compressed_timestamp_fit_file):
+    consumed: list[int] = []
+    source = _iter_bytes(compressed_timestamp_fit_file, 100, consumed)
+
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        # Raised when called, before the messages are iterated
+        with pytest.raises(TypeError, match="can not be shared with a process pool"):
+            aio.iter_messages(source, executor=executor)
+
+        with pytest.raises(TypeError, match="can not be shared with a process pool"):
+            asyncio.run(aio.decode(source, executor=executor))
+
+    assert consumed == []
+
+
+def test_iter_messages_incomplete(compressed_timestamp_fit_file):
+    async def run():
+        return await _collect(_stream_reader(compressed_timestamp_fit_file[:-5]))
+
+    with pytest.raises(DecodeException, match="the fit file is not complete"):
+        asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    "file_name",
+    ["fittie_chained_file.fit", "fittie_developer_fields.fit", "fittie_gearshifts.fit"],
+)
+def test_decode(data_dir, file_name):
+    path = data_dir / file_name
+
+    async def run():
+        return await aio.decode(_stream_reader(path.read_bytes()), chunk_size=512)
+
+    fitfiles = asyncio.run(run())
+
+    assert _fitfile_fields(fitfiles) == _fitfile_fields(decode(path))
+    assert [str(fitfile.developer_data) for fitfile in fitfiles] == [
+        str(fitfile.developer_data) for fitfile in decode(path)
+    ]
+
+
+def test_decode_columnar(data_dir):
+    content = (data_dir / "fittie_gearshifts.fit").read_bytes()
+
+    async def run():
+        return await aio.decode(_iter_bytes(content, 4096, []), layout="columnar")
+
+    (fitfile,) = asyncio.run(run())
+    (expected,) = decode(content, layout="columnar")
+    columns = fitfile.columns("record")
+
+    assert list(columns.keys()) == list(expected.columns("record").keys())
+    assert [columns.row(index) for index in range(len(columns))] == [
+        expected.columns("record").row(index) for index in range(len(columns))
+    ]
+
+
+def test_decode_without_data_messages(data_dir):
+    content = (data_dir / "fittie_minimal_file.fit").read_bytes()
+
+    async def run():
+        return await aio.decode(_stream_reader(content), include=["hrv"])
+
+    fitfiles = asyncio.run(run())
+
+    assert len(fitfiles) == len(decode(content, include=["hrv"])) == 1
+    assert _fitfile_fields(fitfiles) == _fitfile_fields(
+        decode(content, include=["hrv"])
+    )
+
+
+def test_decode_empty_chained_file(data_dir):
+    header = struct.pack("<BBHI4s", 12, 0x20, 2158, 0, b".FIT")
+    content = header + struct.pack("<H", crc16(header))
+    content += (data_dir / "fittie_chained_file.fit").read_bytes()
+
+    async def run():
+        return await aio.decode(_stream_reader(content))
+
+    fitfiles = asyncio.run(run())
+
+    assert len(fitfiles) == len(decode(content)) == 3
+    assert _fitfile_fields(fitfiles) == _fitfile_fields(decode(content))